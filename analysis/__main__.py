@@ -4,6 +4,7 @@ import pandas as pd
 
 from .analyse import analyse
 from .diff import diff
+from .operators import operators
 
 pd.set_option('display.float_format', "{:.2f}".format)
 pd.set_option('display.max_rows', 500)
@@ -25,10 +26,17 @@ def main():
                              " result files. Second file is subtracted from"
                              " the first.")
 
+    parser.add_argument("--operators", action="store_true", dest="operators",
+                        help="Aggregates the operator statistics of the"
+                             " instances, as written by the heuristic's"
+                             " --operator-statistics option.")
+
     args = parser.parse_args()
 
     if args.diff:
         diff(args.input, args.output)
+    elif args.operators:
+        operators(args.input, args.output)
     else:
         analyse(args.input, args.output)
 
@@ -0,0 +1,36 @@
+import glob
+
+import pandas as pd
+
+from heuristic.classes import Problem
+
+COUNTS = ["calls", "time", "bests", "accepts", "rejects", "improvement"]
+
+
+def operators(in_files: str, out_file: str):
+    """
+    Aggregates the operator statistics of all searches on the passed-in
+    in-files, and writes the result to the out-file location. This gives the
+    totals of each operator over all instances, and the mean time and
+    improvement per second derived from those.
+    """
+    data = []
+
+    for location in glob.iglob(in_files):
+        problem = Problem.from_file(location, delimiter=',')
+        pattern = f"solutions/oracs_{problem.instance}_*_operators.csv"
+
+        for stats_location in glob.iglob(pattern):
+            data.append(pd.read_csv(stats_location))
+
+    if not data:
+        print("No operator statistics found. See --operator-statistics.")
+        return
+
+    report = pd.concat(data).groupby(["kind", "operator"])[COUNTS].sum()
+
+    report["mean_time"] = report["time"] / report["calls"]
+    report["improvement_per_second"] = report["improvement"] / report["time"]
+
+    report.to_csv(out_file)
+    print(report)
@@ -0,0 +1,80 @@
+import argparse
+
+import pandas as pd
+
+from .compare import compare
+from .descent import descent
+from .granular import granular
+from .macro import macro
+from .micro import micro
+from .startup import startup
+from .two_opt import two_opt
+
+pd.set_option('display.float_format', "{:.2f}".format)
+pd.set_option('display.max_rows', 500)
+pd.set_option('display.width', 1000)
+
+BENCHMARKS = {
+    "descent": descent,
+    "granular": granular,
+    "macro": macro,
+    "micro": micro,
+    "startup": startup,
+    "two_opt": two_opt,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the heuristic.")
+
+    parser.add_argument("benchmark", choices=BENCHMARKS.keys(),
+                        help="Benchmark to run.")
+
+    parser.add_argument("input", nargs="+",
+                        help="Input data file locations (glob strings).")
+
+    parser.add_argument("--save-baseline", default=None,
+                        help="Saves the results to this baseline file (CSV).")
+
+    parser.add_argument("--baseline", default=None,
+                        help="Compares the results against this baseline file"
+                             " (CSV), and exits with an error if any result is"
+                             " worse than its baseline. See --tolerance.")
+
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative slowdown (or memory increase) over the"
+                             " baseline that is still accepted. Default 0.2,"
+                             " that is, twenty percent.")
+
+    args = parser.parse_args()
+
+    results = BENCHMARKS[args.benchmark](args.input)
+
+    keys = [key for key in ["operation", "customers"] if key in results]
+    grouped = results.drop(columns="instance").groupby(keys)
+    report = grouped.agg(["mean", "max"])
+
+    print(report)
+
+    if args.save_baseline is not None:
+        results.to_csv(args.save_baseline, index=False)
+
+    if args.baseline is not None:
+        ratios = compare(results,
+                         pd.read_csv(args.baseline),
+                         args.tolerance)
+
+        regressions = ratios[ratios["regression"]]
+
+        if len(regressions) != 0:
+            print("\nRegressions (ratio of result to baseline):")
+            regressions = regressions.drop(columns="regression")
+            print(regressions.to_string(index=False))
+            parser.exit(1, f"{len(regressions)} result(s) regressed by more"
+                           f" than {args.tolerance:.0%}.\n")
+
+        print(f"\nNo regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import pandas as pd
+
+# Columns that identify a measurement. All other columns are measurements,
+# where lower is better (e.g. time, memory).
+KEYS = ["instance", "customers", "operation"]
+
+
+def compare(results: pd.DataFrame,
+            baseline: pd.DataFrame,
+            tolerance: float) -> pd.DataFrame:
+    """
+    Compares the benchmark results against the baseline results, and returns
+    the ratio of each result to its baseline. Results that are more than the
+    tolerance (relative) worse than their baseline are marked as regressions.
+    Results without a baseline are not compared.
+    """
+    keys = [key for key in KEYS if key in results]
+    measures = [column for column in results if column not in keys]
+
+    merged = results.merge(baseline, on=keys, suffixes=("", "_baseline"))
+    ratios = merged[keys].copy()
+
+    for measure in measures:
+        ratios[measure] = merged[measure] / merged[measure + "_baseline"]
+
+    ratios["regression"] = (ratios[measures] > 1 + tolerance).any(axis=1)
+    return ratios
@@ -0,0 +1,59 @@
+import glob
+import time
+from multiprocessing import get_context
+from typing import Dict, List
+
+import pandas as pd
+
+from heuristic.classes import Problem
+from heuristic.local_search import LocalSearch, SOLUTION_OPERATORS, or_opt
+from .greedy_solution import greedy_solution
+
+# Sets of solution operators to compare, by name.
+OPERATOR_SETS = {
+    "without or_opt": [op for op in SOLUTION_OPERATORS if op is not or_opt],
+    "with or_opt": SOLUTION_OPERATORS,
+}
+
+
+def descent(in_files: List[str]) -> pd.DataFrame:
+    """
+    Compares sets of solution operators, by the time (in seconds) and final
+    objective of a local search descent from a greedily constructed solution,
+    with best and first improvement. Each descent uses a new local search, so
+    it starts without cached moves. Each instance is measured in a fresh
+    process.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def _measure(location: str) -> List[Dict]:
+    problem = Problem.from_file(location, delimiter=',')
+    initial = greedy_solution()
+
+    results = []
+
+    for name, operators in OPERATOR_SETS.items():
+        for first_improvement in [False, True]:
+            local_search = LocalSearch(first_improvement=first_improvement)
+
+            for op in operators:
+                local_search.add_solution_operator(op)
+
+            start = time.perf_counter()
+            solution = local_search(initial)
+
+            strategy = "first" if first_improvement else "best"
+            results.append(dict(instance=problem.instance,
+                                customers=problem.num_customers,
+                                operation=f"{name} ({strategy})",
+                                time=time.perf_counter() - start,
+                                objective=solution.objective()))
+
+    return results
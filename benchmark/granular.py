@@ -0,0 +1,58 @@
+import glob
+import time
+from multiprocessing import get_context
+from typing import Dict, List
+
+import pandas as pd
+
+from heuristic.classes import Problem
+from heuristic.local_search import OperatorContext, relocate_customer
+from heuristic.functions import initial_solution
+
+# Numbers of nearest customers of the granular neighbourhoods, and None for
+# the full neighbourhood.
+NEIGHBOURS = [None, 5, 10, 20]
+
+
+def granular(in_files: List[str]) -> pd.DataFrame:
+    """
+    Compares the full and granular neighbourhoods of relocate_customer, by the
+    time (in seconds) and final objective of a descent from the initial
+    solution. The descent applies relocate_customer until it no longer
+    improves the solution. Each instance is measured in a fresh process.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def _measure(location: str) -> List[Dict]:
+    problem = Problem.from_file(location, delimiter=',')
+    initial = initial_solution()
+
+    results = []
+
+    for k in NEIGHBOURS:
+        context = OperatorContext(neighbours=k)
+        solution = initial
+        start = time.perf_counter()
+
+        while True:
+            improved = relocate_customer(solution, context)
+
+            if improved.cost() >= solution.cost():
+                break
+
+            solution = improved
+
+        results.append(dict(instance=problem.instance,
+                            customers=problem.num_customers,
+                            operation="full" if k is None else f"k={k}",
+                            time=time.perf_counter() - start,
+                            objective=solution.objective()))
+
+    return results
@@ -0,0 +1,18 @@
+from numpy.random import default_rng
+
+from heuristic.classes import Problem, Solution
+from heuristic.repair_operators import greedy_insert
+
+
+def greedy_solution() -> Solution:
+    """
+    Greedily constructs a solution to the current problem instance, seeded
+    with the instance number. Unlike the initial solution, this has routes of
+    realistic length, so it is suitable for benchmarking the operators.
+    """
+    problem = Problem()
+    unassigned = list(range(problem.num_customers))
+
+    rnd_state = default_rng(problem.instance)
+
+    return greedy_insert(Solution([], unassigned), rnd_state)
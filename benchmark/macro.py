@@ -0,0 +1,45 @@
+import glob
+import time
+from multiprocessing import get_context
+from typing import Dict, List
+
+import pandas as pd
+
+from heuristic.classes import Problem
+from heuristic.search import solve
+
+# Number of ALNS iterations of each search. Each search is seeded with the
+# instance number, so the same iterations are measured on every run. The
+# fastest of several such searches is reported.
+ITERATIONS = 100
+REPEATS = 3
+
+
+def macro(in_files: List[str]) -> pd.DataFrame:
+    """
+    Measures the time per ALNS iteration of a full search on each instance, in
+    milliseconds (the inverse of iterations per second). Each instance is
+    measured in a fresh process.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame(results)
+
+
+def _measure(location: str) -> Dict:
+    problem = Problem.from_file(location, delimiter=',')
+
+    durations = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        solve(problem.instance, iterations=ITERATIONS)
+        durations.append(time.perf_counter() - start)
+
+    return dict(instance=problem.instance,
+                customers=problem.num_customers,
+                iteration_time=1000 * min(durations) / ITERATIONS)
@@ -0,0 +1,124 @@
+import glob
+import time
+from copy import deepcopy
+from multiprocessing import get_context
+from typing import Callable, Dict, List
+
+import pandas as pd
+from numpy.random import default_rng
+
+from heuristic.classes import Problem, Stack, Stacks
+from heuristic.destroy_operators import D_OPERATORS, random_customers
+from heuristic.local_search import (OperatorContext, ROUTE_OPERATORS,
+                                    SOLUTION_OPERATORS)
+from heuristic.repair_operators import R_OPERATORS
+from .greedy_solution import greedy_solution
+
+# Number of timed calls of each route operation, and of each operator. The
+# fastest call time is reported, as slower calls are mostly due to noise from
+# other processes, rather than the code being measured.
+ROUTE_REPEATS = 1000
+OPERATOR_REPEATS = 10
+
+
+def micro(in_files: List[str]) -> pd.DataFrame:
+    """
+    Measures the time per call of the basic route operations, and of each
+    destroy, repair, and local search operator, in microseconds. These are
+    measured on a greedily constructed solution to each instance, with a fixed
+    seed. Each instance is measured in a fresh process.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def _measure(location: str) -> List[Dict]:
+    problem = Problem.from_file(location, delimiter=',')
+    solution = greedy_solution()
+    rnd_state = default_rng(problem.instance)
+
+    # The route operations are measured on the longest route, for the
+    # customer in the middle of that route.
+    route = max(solution.routes, key=len)
+    at = len(route) // 2
+    customer = route.customers[at]
+
+    without = deepcopy(route)
+    without.remove_customer(customer)
+
+    before, after = route.plan[at], route.plan[at + 1]
+
+    timings = {
+        "Route.insert_customer": _time(
+            lambda: (deepcopy(without),),
+            lambda copied: copied.insert_customer(customer, at),
+            ROUTE_REPEATS),
+        "Route.remove_customer": _time(
+            lambda: (deepcopy(route),),
+            lambda copied: copied.remove_customer(customer),
+            ROUTE_REPEATS),
+        "Route.can_insert": _time(
+            lambda: (),
+            lambda: without.can_insert(customer, at),
+            ROUTE_REPEATS),
+        "Stacks.cost": _time(
+            lambda: (),
+            lambda: Stacks.cost(customer, before, after),
+            ROUTE_REPEATS),
+        "Stack.moved_volume": _time(
+            lambda: (),
+            lambda: [Stack.moved_volume(before[idx], after[idx])
+                     for idx in range(problem.num_stacks)],
+            ROUTE_REPEATS),
+    }
+
+    for op in D_OPERATORS:
+        timings[op.__name__] = _time(lambda: (solution, rnd_state),
+                                     op,
+                                     OPERATOR_REPEATS)
+
+    for op in R_OPERATORS:
+        timings[op.__name__] = _time(
+            lambda: (random_customers(solution, rnd_state), rnd_state),
+            op,
+            OPERATOR_REPEATS)
+
+    for op in SOLUTION_OPERATORS:
+        # Each call gets a fresh context, so it cannot use the moves cached
+        # by an earlier call.
+        timings[op.__name__] = _time(lambda: (solution, OperatorContext()),
+                                     op,
+                                     OPERATOR_REPEATS)
+
+    for op in ROUTE_OPERATORS:
+        timings[op.__name__] = _time(lambda: (deepcopy(route),),
+                                     op,
+                                     OPERATOR_REPEATS)
+
+    return [dict(instance=problem.instance,
+                 customers=problem.num_customers,
+                 operation=operation,
+                 time=timing)
+            for operation, timing in timings.items()]
+
+
+def _time(make_args: Callable, func: Callable, repeats: int) -> float:
+    """
+    Returns the fastest time of calling func, in microseconds, with arguments
+    created by make_args. Creating the arguments is not timed.
+    """
+    timings = []
+
+    for _ in range(repeats):
+        args = make_args()
+
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+
+    return 1e6 * min(timings)
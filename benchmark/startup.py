@@ -0,0 +1,51 @@
+import glob
+import resource
+import time
+from multiprocessing import get_context
+from typing import Dict, List
+
+import pandas as pd
+
+from heuristic.classes import Problem
+from heuristic.constants import DEPOT
+from heuristic.functions import initial_solution
+
+
+def startup(in_files: List[str]) -> pd.DataFrame:
+    """
+    Measures the start-up time and peak memory use of the heuristic, that is,
+    everything that happens before the first ALNS iteration. Each instance is
+    measured in a fresh process, so the measurements do not influence each
+    other.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    # One process per instance (and one instance at a time), so the maximum
+    # resident set size is a clean measurement for each instance.
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame(results)
+
+
+def _measure(location: str) -> Dict:
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    problem = Problem.from_file(location, delimiter=',')
+
+    # These are all the derived data the heuristic needs before the first
+    # iteration, either directly or via the initial solution.
+    problem.short_distances[DEPOT, 0, DEPOT]
+    problem.nearest_customers
+    problem.smallest_quantity_customers
+    initial_solution()
+
+    duration = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return dict(instance=problem.instance,
+                customers=problem.num_customers,
+                time=duration,
+                rss=(rss_after - rss_before) / 1024)  # in MB
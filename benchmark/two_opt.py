@@ -0,0 +1,75 @@
+import glob
+import time
+from multiprocessing import get_context
+from typing import Dict, List
+
+import pandas as pd
+
+from heuristic.classes import Problem, Route, Stacks
+from heuristic.constants import DEPOT
+from heuristic.local_search import in_route_two_opt
+from .greedy_solution import greedy_solution
+
+
+def two_opt(in_files: List[str]) -> pd.DataFrame:
+    """
+    Compares in_route_two_opt against constructing the route of every swap
+    that improves the routing costs, as the operator originally did, by the
+    time (in milliseconds) per route and the total cost of the resulting
+    routes. These are measured on the routes of a greedily constructed
+    solution. Each instance is measured in a fresh process.
+    """
+    locations = [location for in_file in in_files
+                 for location in sorted(glob.glob(in_file))]
+
+    with get_context().Pool(1, maxtasksperchild=1) as pool:
+        results = pool.map(_measure, locations, chunksize=1)
+
+    return pd.DataFrame([row for rows in results for row in rows])
+
+
+def _measure(location: str) -> List[Dict]:
+    problem = Problem.from_file(location, delimiter=',')
+    routes = greedy_solution().routes
+
+    results = []
+
+    for name, op in [("construct all", _construct_all),
+                     ("in_route_two_opt", in_route_two_opt)]:
+        start = time.perf_counter()
+        new_routes = [op(route) for route in routes]
+        duration = time.perf_counter() - start
+
+        results.append(dict(instance=problem.instance,
+                            customers=problem.num_customers,
+                            operation=name,
+                            time=1_000 * duration / len(routes),
+                            cost=sum(route.cost() for route in new_routes)))
+
+    return results
+
+
+def _construct_all(route: Route) -> Route:
+    """
+    Constructs the route of each two-opt swap that improves the routing costs,
+    and returns the cheapest of these and the passed-in route. As in the
+    operator, the last two customers are never part of the reversed segment.
+    """
+    tour = route.customers.to_list()
+    best = route
+
+    for first in range(len(tour)):
+        for second in range(first + 2, len(tour) - 1):
+            new_tour = tour[:first] + tour[first:second][::-1] + tour[second:]
+
+            if Route.distance([DEPOT] + new_tour + [DEPOT]) \
+                    >= route.routing_cost():
+                continue
+
+            new_route = Route([], [Stacks(Problem().num_stacks)])
+
+            if new_route.attempt_append_tail(new_tour) \
+                    and new_route.cost() < best.cost():
+                best = new_route
+
+    return best
@@ -1,47 +1,174 @@
+import argparse
 import sys
 
-from alns import ALNS
-from numpy.random import default_rng
-
-from heuristic.classes import Solution
 from .classes import Problem
-from .constants import CRITERION, DECAY, ITERATIONS, WEIGHTS
-from .destroy_operators import D_OPERATORS
-from .functions import initial_solution
-from .local_search import LocalSearch, ROUTE_OPERATORS, SOLUTION_OPERATORS
-from .repair_operators import R_OPERATORS
+from .constants import ITERATIONS, RELOCATE_NEIGHBOURS
+from .search import batch, multi_start, write_summary
 
 
 def main():
-    if len(sys.argv) < 2:
-        raise ValueError(f"{sys.argv[0]}: expected file location.")
-
-    problem = Problem.from_file(sys.argv[1], delimiter=',')
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        return main_batch(sys.argv[2:])
 
-    alns = ALNS(default_rng(problem.instance))
+    parser = argparse.ArgumentParser(prog="heuristic",
+                                     description="Solves a problem instance.")
 
-    for op in D_OPERATORS:
-        alns.add_destroy_operator(op)
+    parser.add_argument("instance",
+                        help="Problem instance data file location.")
 
-    for op in R_OPERATORS:
-        alns.add_repair_operator(op)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of independent searches to run in"
+                             " parallel, each in its own process. The best"
+                             " solution is kept. Default 1.")
 
-    local_search = LocalSearch()
+    parser.add_argument("--migration-interval", type=int, default=None,
+                        help="When passed, the parallel searches exchange"
+                             " their best solutions every this many"
+                             " iterations (island model). Default the"
+                             " searches are independent.")
 
-    for op in SOLUTION_OPERATORS:
-        local_search.add_solution_operator(op)
+    _add_search_arguments(parser)
 
-    for op in ROUTE_OPERATORS:
-        local_search.add_route_operator(op)
+    args = parser.parse_args()
 
-    alns.on_best(local_search)
+    if args.workers < 1:
+        parser.error("--workers must be at least one.")
 
-    init = initial_solution()
-    result = alns.iterate(init, WEIGHTS, DECAY, CRITERION, ITERATIONS)
+    if args.checkpoint_interval is not None and args.checkpoint_interval < 1:
+        parser.error("--checkpoint-interval must be at least one.")
 
-    # noinspection PyTypeChecker
-    solution: Solution = result.best_state
-    solution.to_file(f"solutions/oracs_{problem.instance}.csv")
+    if args.workers > 1 and args.local_search_workers > 1:
+        # The parallel searches run in daemonic worker processes, which cannot
+        # start processes of their own.
+        parser.error("--local-search-workers cannot be combined with"
+                     " --workers.")
+
+    solution = multi_start(args.instance,
+                           args.workers,
+                           migration_interval=args.migration_interval,
+                           **_search_options(args))
+    solution.to_file(f"solutions/oracs_{Problem().instance}.csv")
+
+
+def main_batch(argv):
+    parser = argparse.ArgumentParser(prog="heuristic batch",
+                                     description="Solves many problem"
+                                                 " instances.")
+
+    parser.add_argument("input",
+                        help="Problem instance data file locations (glob"
+                             " string).")
+
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of instances to solve in parallel."
+                             " Default 1.")
+
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Wall-clock time limit for each instance, in"
+                             " seconds. Instances are stopped once this limit"
+                             " is reached, without a solution. See also"
+                             " --time-limit. Default no time limit.")
+
+    parser.add_argument("--retries", type=int, default=1,
+                        help="Number of retries for each instance, should its"
+                             " worker process fail. Default 1.")
+
+    parser.add_argument("--summary", default="solutions/summary.json",
+                        help="Run summary location. The summary is written as"
+                             " CSV if this ends in '.csv', and as JSON"
+                             " otherwise. Default solutions/summary.json.")
+
+    _add_search_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least one.")
+
+    if args.checkpoint_interval is not None and args.checkpoint_interval < 1:
+        parser.error("--checkpoint-interval must be at least one.")
+
+    summary = batch(args.input,
+                    args.workers,
+                    args.timeout,
+                    args.retries,
+                    **_search_options(args))
+
+    write_summary(summary, args.summary)
+
+    for result in summary:
+        print(f"{result['location']}: {result['status']}")
+
+
+def _add_search_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--iterations", type=int, default=ITERATIONS,
+                        help="Maximum number of iterations of each search."
+                             f" Default {ITERATIONS}.")
+
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="Wall-clock time limit of each search, in"
+                             " seconds. This is checked between iterations,"
+                             " and the search stops once the limit is"
+                             " reached. Default no time limit.")
+
+    parser.add_argument("--max-stagnation", type=int, default=None,
+                        help="Stops a search after this many consecutive"
+                             " iterations without improving the best solution."
+                             " Default no such limit.")
+
+    parser.add_argument("--output-interval", type=float, default=None,
+                        help="Writes the best solution found so far to the"
+                             " solution file at this interval, in seconds."
+                             " Default only the final solution is written.")
+
+    parser.add_argument("--local-search-workers", type=int, default=1,
+                        help="Number of worker processes that improve routes,"
+                             " and scan neighbourhoods, in parallel during"
+                             " local search. Default 1.")
+
+    parser.add_argument("--first-improvement-from", type=int, default=None,
+                        metavar="CUSTOMERS",
+                        help="Local search performs the first improving move"
+                             " it finds, rather than the best, on instances"
+                             " with at least this many customers. This is"
+                             " faster, but less thorough. Default always the"
+                             " best improving move.")
+
+    parser.add_argument("--relocate-neighbours", type=int,
+                        default=RELOCATE_NEIGHBOURS, metavar="K",
+                        help="Local search relocates a customer only next to"
+                             " its K nearest customers (a granular"
+                             " neighbourhood). This is faster, but might miss"
+                             " some improving moves. Default"
+                             f" {RELOCATE_NEIGHBOURS}, which considers all"
+                             " insertion points.")
+
+    parser.add_argument("--checkpoint-interval", type=int, default=None,
+                        help="Writes a checkpoint of each search every this"
+                             " many iterations, from which the search can be"
+                             " resumed. Default no checkpoints are written.")
+
+    parser.add_argument("--resume", action="store_true",
+                        help="Resumes each search from its last checkpoint,"
+                             " if there is one. See --checkpoint-interval.")
+
+    parser.add_argument("--operator-statistics", action="store_true",
+                        help="Writes the run time and outcomes of each"
+                             " operator to a CSV file for each search, next to"
+                             " the solution file.")
+
+
+def _search_options(args: argparse.Namespace):
+    return dict(iterations=args.iterations,
+                time_limit=args.time_limit,
+                max_stagnation=args.max_stagnation,
+                output_interval=args.output_interval,
+                local_search_workers=args.local_search_workers,
+                first_improvement_from=args.first_improvement_from,
+                relocate_neighbours=args.relocate_neighbours,
+                checkpoint_interval=args.checkpoint_interval,
+                resume=args.resume,
+                operator_statistics=args.operator_statistics)
 
 
 if __name__ == "__main__":
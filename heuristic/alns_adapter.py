@@ -0,0 +1,52 @@
+from alns import ALNS
+from alns.Result import Result
+from alns.State import State
+from alns.Statistics import Statistics
+from alns.WeigthIndex import WeightIndex  # sic, the module name is misspelled.
+from alns.criteria import AcceptanceCriterion
+from alns.select_operator import select_operator
+
+__all__ = ["Result", "State", "Statistics", "WeightIndex",
+           "AcceptanceCriterion", "select_operator", "validate_parameters",
+           "consider_candidate", "outcome"]
+
+# The search extends ALNS.iterate, which the public ALNS API does not allow
+# for: it relies on the alns internals below. These may change between alns
+# releases, so they are used only through this module - and the alns version
+# is pinned in the Pipfile.
+
+# Outcome of each weight index, see ``outcome``.
+_OUTCOMES = {WeightIndex.IS_BEST: "best",
+             WeightIndex.IS_BETTER: "better",
+             WeightIndex.IS_ACCEPTED: "accepted",
+             WeightIndex.IS_REJECTED: "rejected"}
+
+
+def validate_parameters(alns: ALNS, weights, operator_decay: float,
+                        iterations: int):
+    """
+    Raises ValueError if the passed-in parameters of an ALNS search are not
+    valid. See ``ALNS.iterate``.
+    """
+    alns._validate_parameters(weights, operator_decay, iterations)
+
+
+def outcome(weight_idx: int) -> str:
+    """
+    Returns the outcome of an ALNS iteration with the passed-in weight index,
+    as one of "best", "better", "accepted", or "rejected". See also
+    ``OperatorStatistics``.
+    """
+    return _OUTCOMES[weight_idx]
+
+
+def consider_candidate(alns: ALNS,
+                       best: State,
+                       current: State,
+                       candidate: State,
+                       criterion: AcceptanceCriterion):
+    """
+    Returns the new best and current solutions, and the weight index of the
+    outcome, after considering the candidate solution. See ``ALNS.iterate``.
+    """
+    return alns._consider_candidate(best, current, candidate, criterion)
@@ -1,4 +1,5 @@
 import heapq
+from itertools import count
 from typing import List, Tuple, TypeVar
 
 _T = TypeVar("_T")
@@ -6,17 +7,20 @@ _T = TypeVar("_T")
 
 class Heap:
     _data: List[Tuple[float, int, _T]]
+    _counter: count
 
     def __init__(self):
         self._data = []
+        self._counter = count()
 
     def __len__(self) -> int:
         return len(self._data)
 
     def push(self, key: float, item: _T):
-        # See https://stackoverflow.com/a/8875823/4316405 for a comment
-        # on the use of id() here.
-        heapq.heappush(self._data, (key, id(item), item))
+        # Ties are broken by insertion order, so items need not be comparable
+        # (see https://stackoverflow.com/a/8875823/4316405). Unlike id(), this
+        # order is the same between runs, so results are reproducible.
+        heapq.heappush(self._data, (key, next(self._counter), item))
 
     def pop(self) -> Tuple[float, _T]:
         key, _, item = heapq.heappop(self._data)
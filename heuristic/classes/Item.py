@@ -4,31 +4,37 @@ from heuristic.constants import DEPOT
 
 
 class Item:
-    __slots__ = ['volume', 'origin', 'destination']
+    __slots__ = ['volume', 'origin', 'destination', 'id']
 
     volume: float
     origin: int
     destination: int
+    id: int
 
     def __init__(self, volume: float, origin: int, destination: int):
         """
         Creates an item with a volume, origin and destination. A pickup item
         will have destination DEPOT. A delivery item will have origin DEPOT.
+
+        Each item has a dense integer id: the delivery item of a customer has
+        id 2 * customer, and its pickup item 2 * customer + 1.
         """
         self.volume = volume
         self.origin = origin
         self.destination = destination
 
+        self.id = 2 * self.customer + self.is_pickup()
+
     def __eq__(self, other) -> bool:
+        if not isinstance(other, Item):
+            return NotImplemented
+
         # NW: we don't really need a type and volume comparison, and this is a
         # bit faster.
-        return self.origin == other.origin \
-               and self.destination == other.destination
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        # NW: we don't really need to hash the volume, as that is assumed not
-        # to change during execution.
-        return hash((self.origin, self.destination))
+        return self.id
 
     @property
     def customer(self) -> int:
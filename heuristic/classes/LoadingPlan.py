@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Iterable, List, Union
+
+from .Stacks import Stacks
+
+
+class LoadingPlan:
+    __slots__ = ['_legs', '_owner', '_shared']
+
+    _legs: List[Stacks]
+    _owner: object  # ownership token for the legs this plan may mutate
+    _shared: bool  # whether the list of legs is shared with another plan
+
+    def __init__(self, legs: Iterable[Stacks] = ()):
+        """
+        A route's loading plan, that is, the stacks configuration for each leg
+        of the route. Copies of a loading plan share their legs: a leg is only
+        copied once it is accessed via indexing or iteration, as the caller
+        might then mutate it (copy-on-write). Copying a loading plan is thus
+        O(1), and legs that are never accessed are never copied.
+        """
+        self._legs = list(legs)
+        self._owner = object()
+        self._shared = False
+
+        for leg in self._legs:
+            leg.owner = self._owner
+
+    def __deepcopy__(self, memodict={}):
+        new = LoadingPlan()
+
+        # Both plans share the legs after copying, and neither owns any of
+        # them - so both must copy a leg before it may be mutated.
+        new._legs = self._legs
+        new._shared = self._shared = True
+        self._owner = object()
+
+        return new
+
+    def __len__(self) -> int:
+        return len(self._legs)
+
+    def __iter__(self):
+        for idx in range(len(self._legs)):
+            yield self._own_leg(idx)
+
+    def __getitem__(self, idx: Union[int, slice]):
+        if isinstance(idx, slice):
+            return [self._own_leg(leg) for leg in range(len(self))[idx]]
+
+        return self._own_leg(idx)
+
+    def __setitem__(self, idx: int, leg: Stacks):
+        self._own_legs()
+
+        self._legs[idx] = leg
+        leg.owner = self._owner
+
+    def __delitem__(self, idx: int):
+        self._own_legs()
+        del self._legs[idx]
+
+    def append(self, leg: Stacks):
+        self.insert(len(self), leg)
+
+    def insert(self, idx: int, leg: Stacks):
+        self._own_legs()
+
+        self._legs.insert(idx, leg)
+        leg.owner = self._owner
+
+    def peek(self, idx: int) -> Stacks:
+        """
+        Returns the leg at the given index, without taking ownership of it.
+        The returned leg may be shared with other loading plans, and must thus
+        *not* be mutated. O(1).
+        """
+        return self._legs[idx]
+
+    def _own_legs(self):
+        if self._shared:
+            self._legs = list(self._legs)
+            self._shared = False
+
+    def _own_leg(self, idx: int) -> Stacks:
+        """
+        Returns the leg at the given index, after taking ownership of it. This
+        copies the leg if it may be shared with another loading plan.
+        """
+        leg = self._legs[idx]
+
+        if leg.owner is not self._owner:
+            self._own_legs()
+
+            leg = deepcopy(leg)
+            leg.owner = self._owner
+
+            self._legs[idx] = leg
+
+        return leg
+
+    def __str__(self):
+        return str(self._legs)
+
+    def __repr__(self):
+        return repr(self._legs)
@@ -0,0 +1,111 @@
+import csv
+import json
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Outcomes of an operator call, and the record field each is counted in.
+OUTCOMES = {"best": "bests", "better": "accepts", "accepted": "accepts",
+            "rejected": "rejects"}
+
+# Fields of each operator record, in order. Mean time, and the improvement per
+# second, are derived from the other fields. See ``to_records``.
+FIELDS = ["kind", "operator", "calls", "time", "mean_time", "bests", "accepts",
+          "rejects", "improvement", "improvement_per_second"]
+
+
+class OperatorStatistics:
+
+    def __init__(self):
+        """
+        Per-operator instrumentation: tracks how often each operator is
+        called, the wall time it takes, and how often its result is a new
+        best, accepted, or rejected. It also tracks the total objective
+        improvement of each operator, so operators can be compared by their
+        yield per second of run time.
+
+        For destroy and repair operators, the outcome and improvement are
+        those of the candidate solution they jointly produce, relative to the
+        current solution. When the candidate is a new best solution, it is
+        improved by the local search, and the time and improvement of that
+        are included as well. For local search operators, a call is accepted
+        when it improves the solution or route, and rejected otherwise. The
+        local search time is thus counted for both kinds of operators.
+        """
+        self._records: Dict[Tuple[str, str], Dict] = defaultdict(_new_record)
+
+    def record_call(self, kind: str, operator: str, time: float):
+        """
+        Records a call of the given kind (e.g. "destroy") of operator, which
+        took the given wall time, in seconds.
+        """
+        record = self._records[kind, operator]
+        record["calls"] += 1
+        record["time"] += time
+
+    def record_outcome(self,
+                       kind: str,
+                       operator: str,
+                       outcome: str,
+                       improvement: float = 0.):
+        """
+        Records the outcome of a call of the given kind of operator, which is
+        one of ``OUTCOMES`` ("best", "better", "accepted", or "rejected"), and
+        the objective improvement it achieved, if any.
+        """
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown outcome {outcome}.")
+
+        record = self._records[kind, operator]
+        record[OUTCOMES[outcome]] += 1
+        record["improvement"] += max(improvement, 0.)
+
+    def merge(self, other: "OperatorStatistics"):
+        """
+        Adds the records of the other operator statistics to these, e.g. those
+        recorded in a worker process.
+        """
+        for key, other_record in other._records.items():
+            record = self._records[key]
+
+            for field, value in other_record.items():
+                record[field] += value
+
+    def to_records(self) -> List[Dict]:
+        """
+        Returns a record for each operator, with the fields in ``FIELDS``.
+        """
+        records = []
+
+        for (kind, operator), record in self._records.items():
+            calls, time = record["calls"], record["time"]
+            per_second = record["improvement"] / time if time else 0.
+
+            row = dict(record,
+                       kind=kind,
+                       operator=operator,
+                       mean_time=time / calls if calls else 0.,
+                       improvement_per_second=per_second)
+
+            records.append({field: row[field] for field in FIELDS})
+
+        return records
+
+    def to_file(self, location: str):
+        """
+        Writes the operator records to the passed-in location, as CSV if the
+        location ends in '.csv', and as JSON otherwise.
+        """
+        with open(location, 'w', newline='') as file:
+            if location.endswith(".csv"):
+                writer = csv.DictWriter(file, FIELDS)
+                writer.writeheader()
+                writer.writerows(self.to_records())
+            else:
+                json.dump(self.to_records(), file, indent=2)
+
+
+def _new_record() -> Dict:
+    # A module-level function (rather than a lambda), so the statistics can be
+    # pickled, e.g. to return them from a worker process.
+    return dict(calls=0, time=0., bests=0, accepts=0, rejects=0,
+                improvement=0.)
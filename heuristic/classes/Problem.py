@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import zipfile
+from contextlib import contextmanager
 from functools import lru_cache
-from itertools import product
-from typing import List
+from typing import Dict, List
 
 import numpy as np
 
-from heuristic.constants import DEPOT
+from heuristic.constants import CACHE_VERSION, DEPOT, INSTANCE_CACHE
 from .Item import Item
+from .SharedProblem import SharedProblem
+from .ShortDistances import ShortDistances
 from .Singleton import Singleton
 
 
@@ -24,6 +29,11 @@ class Problem(metaclass=Singleton):
     _demands: np.ndarray
     _pickups: np.ndarray
 
+    _nearest_customers: np.ndarray
+    _smallest_quantity_customers: np.ndarray
+
+    _shared: SharedProblem  # only when attached to shared data.
+
     @property
     def instance(self) -> int:
         return self._instance
@@ -50,21 +60,12 @@ class Problem(metaclass=Singleton):
 
     @property
     @lru_cache(1)
-    def short_distances(self) -> np.ndarray:
+    def short_distances(self) -> ShortDistances:
         """
-        Pre-computes some short (three length) distances, so those do not have
-        to be recomputed again.
+        Short (three length) distances, computed on demand from the distance
+        matrix. See ``ShortDistances`` for details.
         """
-        from .Route import Route
-
-        distances = np.empty((self.num_customers + 1,
-                              self.num_customers + 1,
-                              self.num_customers + 1))
-
-        for route in product(range(DEPOT, self.num_customers), repeat=3):
-            distances[route] = Route.distance(route)
-
-        return distances
+        return ShortDistances(self.distances)
 
     @property
     @lru_cache(1)
@@ -78,13 +79,32 @@ class Problem(metaclass=Singleton):
         return [Item(pickup, customer, DEPOT)
                 for customer, pickup in enumerate(self._pickups)]
 
+    @property
+    @lru_cache(1)
+    def items(self) -> List[Item]:
+        """
+        Returns all items, indexed by item id. These are the same Item objects
+        as those in ``demands`` and ``pickups``. See also ``Item.id``.
+        """
+        return [item for items in zip(self.demands, self.pickups)
+                for item in items]
+
+    @property
+    @lru_cache(1)
+    def volumes(self) -> np.ndarray:
+        """
+        Returns the item volumes, indexed by item id. The delivery volumes of
+        some customers are thus ``volumes[2 * customers]``, and their pickup
+        volumes ``volumes[2 * customers + 1]``.
+        """
+        return np.column_stack([self._demands, self._pickups]).ravel()
+
     @property
     @lru_cache(1)
     def stack_capacity(self) -> float:
         return self.capacity / self.num_stacks
 
     @property
-    @lru_cache(1)
     def nearest_customers(self) -> np.ndarray:
         """
         Returns the customers nearest to each other customer, as a matrix. Each
@@ -94,28 +114,39 @@ class Problem(metaclass=Singleton):
         Note: first column is the customer itself, as the distance to self is
         zero.
         """
-        return np.argsort(self.distances[1:, 1:], axis=1)
+        return self._nearest_customers
 
     @property
-    @lru_cache(1)
     def smallest_quantity_customers(self) -> np.ndarray:
         """
         Returns the customers sorted by the smallest quantities of demand and
         pickup (summed), ascending.
         """
-        return np.argsort(self._demands + self._pickups)
+        return self._smallest_quantity_customers
 
     @classmethod
-    def from_file(cls, location: str, **kwargs) -> Problem:
+    def from_file(cls,
+                  location: str,
+                  use_cache: bool = True,
+                  **kwargs) -> Problem:
         """
         Sets-up a problem instance from the passed-in data file location. Any
         additional arguments are passed to ``numpy.genfromtxt``. For the assumed
         file format, see the data in `/data` - in particular the text file.
 
+        Parsed instances are stored in the instance cache (see
+        ``INSTANCE_CACHE``; by default a .cache directory next to the data
+        file), keyed by the contents of the data file. Later calls for the
+        same instance read the cached data instead, which is much faster than
+        parsing the data file again. Cache files that cannot be read are
+        ignored, and failing to write the cache is not an error.
+
         Parameters
         ----------
         location
             Data file location.
+        use_cache
+            Whether to use the instance cache. Default True.
         kwargs
             Additional arguments.
 
@@ -126,33 +157,151 @@ class Problem(metaclass=Singleton):
         """
         cls.clear()
 
-        data = np.genfromtxt(location, **kwargs)
+        if not use_cache:
+            return cls._from_data(np.genfromtxt(location, **kwargs))
 
-        problem = cls()
+        with open(location, 'rb') as file:
+            key = _digest(file.read(), repr(sorted(kwargs.items())).encode())
+
+        directory = _cache_directory(location)
 
-        problem._instance = int(data[0])
+        try:
+            return cls._from_cache(directory, key)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Not (completely) cached, or the cache files are corrupt, so we
+            # parse and cache the instance.
+            problem = cls._from_data(np.genfromtxt(location, **kwargs))
 
-        problem._capacity = data[1]
-        problem._handling_cost = data[3]
+            try:
+                problem._to_cache(directory, key)
+            except OSError:  # e.g. a read-only directory; caching is optional
+                pass
 
-        problem._num_customers = int(data[2])
-        problem._num_stacks = int(data[4])
+            return problem
+
+    def share(self) -> SharedProblem:
+        """
+        Publishes this problem instance into shared memory, so that worker
+        processes may attach to it without parsing the instance, or copying
+        its data. The returned object is cheap to pickle, and should be closed
+        once the workers are done with it. See also ``attach``.
+
+        Returns
+        -------
+        SharedProblem
+            Shared problem instance data.
+        """
+        return SharedProblem(self._header(), self._arrays())
+
+    @classmethod
+    def attach(cls, shared: SharedProblem) -> Problem:
+        """
+        Sets-up the problem instance from the passed-in shared problem instance
+        data, which is not copied. The problem instance is read-only. Like
+        ``from_file``, this sets the singleton instance, so this may be passed
+        directly as the initializer of a worker pool.
+
+        Parameters
+        ----------
+        shared
+            Shared problem instance data, see ``share``.
+
+        Returns
+        -------
+        Problem
+            Problem instance for the shared data.
+        """
+        cls.clear()
+
+        problem = cls._from_arrays(shared.header, **shared.arrays())
+        problem._shared = shared  # keeps the shared memory alive.
+
+        return problem
+
+    @classmethod
+    def _from_data(cls, data: np.ndarray) -> Problem:
+        header = data[:5]
+        num_customers = int(header[2])
 
         # Distances include depot, so customers + 1
-        distances = data[5:5 + (problem.num_customers + 1) ** 2]
-        problem._distances = distances.reshape((problem.num_customers + 1,
-                                                problem.num_customers + 1))
+        distances = data[5:5 + (num_customers + 1) ** 2]
+        distances = distances.reshape((num_customers + 1, num_customers + 1))
 
-        demands = np.empty(problem.num_customers)
-        pickups = np.empty(problem.num_customers)
+        demands = np.empty(num_customers)
+        pickups = np.empty(num_customers)
 
-        for idx in range(problem.num_customers):
-            demands[idx] = data[-2 * problem.num_customers + 2 * idx]
-            pickups[idx] = data[-2 * problem.num_customers + 2 * idx + 1]
+        for idx in range(num_customers):
+            demands[idx] = data[-2 * num_customers + 2 * idx]
+            pickups[idx] = data[-2 * num_customers + 2 * idx + 1]
 
+        nearest_customers = np.argsort(distances[1:, 1:], axis=1)
+        smallest_quantity = np.argsort(demands + pickups)
+
+        return cls._from_arrays(header,
+                                distances=distances,
+                                demands=demands,
+                                pickups=pickups,
+                                nearest_customers=nearest_customers,
+                                smallest_quantity_customers=smallest_quantity)
+
+    @classmethod
+    def _from_cache(cls, directory: str, key: str) -> Problem:
+        """
+        Reads a problem instance from the instance cache in the passed-in
+        directory. The distance (and derived) matrices are memory-mapped, and
+        shared between all cached instances with the same distances. Raises an
+        OSError when the instance is not (completely) cached, and a ValueError,
+        KeyError, or BadZipFile when the cache files are corrupt.
+        """
+        with np.load(os.path.join(directory, key + ".npz")) as data:
+            header = data["header"]
+            demands = data["demands"]
+            pickups = data["pickups"]
+            smallest_quantity = data["smallest_quantity_customers"]
+            distances_key = str(data["distances_key"])
+
+        distances = _load_shared(directory, "distances", distances_key)
+        nearest_customers = _load_shared(directory,
+                                         "nearest_customers",
+                                         distances_key)
+
+        return cls._from_arrays(header,
+                                distances=distances,
+                                demands=demands,
+                                pickups=pickups,
+                                nearest_customers=nearest_customers,
+                                smallest_quantity_customers=smallest_quantity)
+
+    @classmethod
+    def _from_arrays(cls,
+                     header: np.ndarray,
+                     distances: np.ndarray,
+                     demands: np.ndarray,
+                     pickups: np.ndarray,
+                     nearest_customers: np.ndarray,
+                     smallest_quantity_customers: np.ndarray) -> Problem:
+        """
+        Sets-up a problem instance from its header and (already computed)
+        arrays, and checks that all demands and pickups fit in a stack. See
+        also ``_header`` and ``_arrays``.
+        """
+        problem = cls()
+
+        problem._instance = int(header[0])
+
+        problem._capacity = header[1]
+        problem._handling_cost = header[3]
+
+        problem._num_customers = int(header[2])
+        problem._num_stacks = int(header[4])
+
+        problem._distances = distances
         problem._demands = demands
         problem._pickups = pickups
 
+        problem._nearest_customers = nearest_customers
+        problem._smallest_quantity_customers = smallest_quantity_customers
+
         # These checks are due to the initially faulty large instances we were
         # provided, and check if all demands and pickups can at least be
         # inserted into a stack.
@@ -163,3 +312,102 @@ class Problem(metaclass=Singleton):
         assert np.all(pickups <= problem.stack_capacity)
 
         return problem
+
+    def _header(self) -> np.ndarray:
+        return np.array([self.instance,
+                         self.capacity,
+                         self.num_customers,
+                         self.handling_cost,
+                         self.num_stacks])
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        smallest_quantity = self.smallest_quantity_customers
+
+        return dict(distances=self.distances,
+                    demands=self._demands,
+                    pickups=self._pickups,
+                    nearest_customers=self.nearest_customers,
+                    smallest_quantity_customers=smallest_quantity)
+
+    def _to_cache(self, directory: str, key: str):
+        """
+        Stores this problem instance in the instance cache in the passed-in
+        directory, under the given key. Raises an OSError when the cache files
+        cannot be written. See also ``_from_cache``.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        distances_key = _digest(self.distances.tobytes())
+
+        _store_shared(directory, "distances", distances_key, self.distances)
+        _store_shared(directory,
+                      "nearest_customers",
+                      distances_key,
+                      self.nearest_customers)
+
+        smallest_quantity = self.smallest_quantity_customers
+
+        with _atomic_open(os.path.join(directory, key + ".npz")) as file:
+            np.savez(file,
+                     header=self._header(),
+                     demands=self._demands,
+                     pickups=self._pickups,
+                     smallest_quantity_customers=smallest_quantity,
+                     distances_key=distances_key)
+
+
+def _cache_directory(location: str) -> str:
+    """
+    Returns the instance cache directory for the data file at the passed-in
+    location: ``INSTANCE_CACHE`` when set, and otherwise the .cache directory
+    next to the data file, so the cache does not depend on the working
+    directory.
+    """
+    if INSTANCE_CACHE is not None:
+        return INSTANCE_CACHE
+
+    return os.path.join(os.path.dirname(os.path.abspath(location)), ".cache")
+
+
+def _digest(*contents: bytes) -> str:
+    digest = hashlib.sha1(CACHE_VERSION.encode())
+
+    for content in contents:
+        digest.update(content)
+
+    return digest.hexdigest()
+
+
+def _load_shared(directory: str, name: str, key: str) -> np.ndarray:
+    location = os.path.join(directory, f"{name}-{key}.npy")
+
+    # Plain array view of the memory-mapped data. Indexing the memmap itself
+    # is much slower, and we do a lot of that.
+    return np.asarray(np.load(location, mmap_mode='r'))
+
+
+def _store_shared(directory: str, name: str, key: str, data: np.ndarray):
+    location = os.path.join(directory, f"{name}-{key}.npy")
+
+    if not os.path.exists(location):  # these may be shared between instances.
+        with _atomic_open(location) as file:
+            np.save(file, data)
+
+
+@contextmanager
+def _atomic_open(location: str):
+    """
+    Opens a temporary file for writing, which replaces the file at the given
+    location once it is closed. This ensures concurrent readers never see
+    partially written cache files.
+    """
+    tmp_location = f"{location}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_location, 'wb') as file:
+            yield file
+
+        os.replace(tmp_location, location)
+    finally:
+        if os.path.exists(tmp_location):
+            os.remove(tmp_location)
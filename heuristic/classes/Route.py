@@ -1,34 +1,84 @@
 import operator
-from copy import deepcopy
-from itertools import islice, takewhile, tee
-from typing import Dict, List, Optional, Tuple, Union
+from copy import copy, deepcopy
+from itertools import count, islice, takewhile, tee
+from typing import List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 
 from heuristic.constants import DEPOT
 from .Item import Item
+from .LoadingPlan import LoadingPlan
 from .Problem import Problem
 from .SetList import SetList
 from .Stacks import Stacks
 
+_versions = count(1)
+
 
 class Route:
-    __slots__ = ['customers', 'plan', '_route_cost', '_handling_cost']
+    __slots__ = ['customers',
+                 'plan',
+                 '_route_cost',
+                 '_handling_cost',
+                 '_leg_costs',
+                 '_max_loads',
+                 '_version']
 
     customers: SetList[int]  # visited customers
-    plan: List[Stacks]  # loading plan
+    plan: LoadingPlan  # loading plan
 
     _route_cost: Optional[float]  # cached results
     _handling_cost: Optional[float]
 
+    # Cached handling cost of each leg, aligned with the customers. Each entry
+    # is a key of (customer, before version, after version), and the cost of
+    # that leg. See also Stacks.version.
+    _leg_costs: List[Optional[Tuple[Tuple[int, int, int], float]]]
+
+    # Cached maximum stack loads, as (legs x stacks) matrices. The first gives
+    # the maximum load of each stack over the legs up to and including a leg,
+    # and the second over the legs from a leg onwards. See can_insert_item.
+    _max_loads: Optional[Tuple[np.ndarray, np.ndarray]]
+
+    _version: int
+
     def __init__(self,
                  customers: Union[List[int], SetList[int]],
                  plan: List[Stacks]):
         self.customers = SetList(customers)
-        self.plan = plan
+        self.plan = LoadingPlan(plan)
 
         self._route_cost = None
         self._handling_cost = None
+        self._leg_costs = []
+        self._max_loads = None
+        self._version = next(_versions)
+
+    def __deepcopy__(self, memodict={}):
+        route = Route([], [])
+
+        # The loading plan is copied-on-write, so this copy is cheap: only the
+        # customer list is actually copied. See also LoadingPlan.
+        route.customers = copy(self.customers)
+        route.plan = deepcopy(self.plan, memodict)
+
+        route._route_cost = self._route_cost
+        route._handling_cost = self._handling_cost
+        route._leg_costs = self._leg_costs.copy()
+        route._max_loads = self._max_loads  # these are never changed in-place
+        route._version = self._version
+
+        return route
+
+    def __setstate__(self, state):
+        _, slots = state
+
+        for attr, value in slots.items():
+            setattr(self, attr, value)
+
+        # Versions are only unique within a single process, so an unpickled
+        # route (e.g. from another process) is given a new version.
+        self.mark_changed()
 
     def __contains__(self, customer: int) -> bool:
         return customer in self.customers
@@ -63,8 +113,25 @@ class Route:
                    for first, second in zip(from_custs, to_custs))
 
     @property
-    def indices(self) -> Dict[int, int]:
-        return {customer: idx for idx, customer in enumerate(self.customers)}
+    def version(self) -> int:
+        """
+        Returns this route's version. Each change to a route gives it a new
+        version, larger than any version handed out before. Copies retain the
+        version of the route they were copied from, so routes with the same
+        version have the same customers and loading plan. This allows caching
+        (expensive) computations on routes, see e.g. ``MoveCache``.
+        """
+        return self._version
+
+    @property
+    def indices(self) -> Mapping[int, int]:
+        """
+        Returns a read-only mapping of customers to their index in this route.
+        The mapping is only valid until the route changes. O(1) when the route
+        did not change since the last call, and O(n) at most otherwise, where
+        n is the number of customers. See ``SetList.positions``.
+        """
+        return self.customers.positions()
 
     def attempt_append_tail(self, customers: List[int]) -> bool:
         """
@@ -90,9 +157,25 @@ class Route:
 
     def invalidate_routing_cache(self):
         self._route_cost = None
+        self.mark_changed()
 
     def invalidate_handling_cache(self):
+        """
+        Invalidates the cached handling cost and stack loads. This must be
+        called whenever the loading plan changes. Only the costs of legs whose
+        stacks have changed since are recomputed. See handling_cost.
+        """
         self._handling_cost = None
+        self._max_loads = None
+        self.mark_changed()
+
+    def mark_changed(self):
+        """
+        Marks this route as changed, by giving it a new version. This is done
+        automatically whenever the route's caches are invalidated, and only
+        needs to be called when the route changes in some other way.
+        """
+        self._version = next(_versions)
 
     def routing_cost(self) -> float:
         """
@@ -107,16 +190,31 @@ class Route:
 
     def handling_cost(self) -> float:
         """
-        Determines the handling cost for this route. O(1), generally.
+        Determines the handling cost for this route. O(1), generally. When the
+        cache has been invalidated, only the handling costs of legs whose
+        stacks have changed are recomputed.
         """
         if self._handling_cost is None:
             assert len(self.customers) + 1 == len(self.plan)
 
-            self._handling_cost = 0.
+            if len(self._leg_costs) != len(self.customers):
+                self._leg_costs = [None] * len(self.customers)
+
+            versions = [self.plan.peek(idx).version()
+                        for idx in range(len(self.plan))]
 
             for idx, customer in enumerate(self.customers):
-                before, after = self.plan[idx], self.plan[idx + 1]
-                self._handling_cost += Stacks.cost(customer, before, after)
+                key = customer, versions[idx], versions[idx + 1]
+                cached = self._leg_costs[idx]
+
+                if cached is None or cached[0] != key:
+                    before = self.plan.peek(idx)
+                    after = self.plan.peek(idx + 1)
+                    cost = Stacks.cost(customer, before, after)
+
+                    self._leg_costs[idx] = key, cost
+
+            self._handling_cost = sum(cost for _, cost in self._leg_costs)
 
         return self._handling_cost
 
@@ -126,7 +224,7 @@ class Route:
         feasible, that is, there is sufficient stack capacity to store the
         delivery and pickup items for the appropriate legs of the tour.
 
-        O(n), where n is the number of customers in the route.
+        O(1), once the maximum stack loads are known. See can_insert_item.
         """
         problem = Problem()
 
@@ -134,7 +232,7 @@ class Route:
         # depot. Including at: we need to make sure the delivery item  fits into
         # stacks up to and including the customer before at, and the depot.
         can_deliver = self.can_insert_item(problem.demands[customer],
-                                           self.plan[0].shortest_stack().index,
+                                           self._shortest_stack_at(0),
                                            at + 1)
 
         if not can_deliver:
@@ -146,7 +244,7 @@ class Route:
         # at the customer. From at, since we copy at and turn it into the
         # customer's loading plan (which should be feasible).
         can_pickup = self.can_insert_item(problem.pickups[customer],
-                                          self.plan[at].shortest_stack().index,
+                                          self._shortest_stack_at(at),
                                           at)
 
         return can_deliver and can_pickup
@@ -161,20 +259,43 @@ class Route:
         a delivery item), or from customer_at (for a pickup item).
 
         If customer_at is not passed, it is assumed the customer is in this
-        route.
+        route. O(1), once the maximum stack loads are known, and O(n)
+        otherwise, where n is the number of customers in the route.
         """
         if customer_at is None:
             customer_at = self.customers.index(item.customer)
 
-        problem = Problem()
-
         if item.is_delivery():
-            plans = self.plan[:customer_at]
+            if customer_at == 0:  # there are no legs to check.
+                return True
+
+            prefix_max, _ = self._stack_loads()
+            load = prefix_max[customer_at - 1, stack_idx]
         else:
-            plans = self.plan[customer_at:]
+            if customer_at >= len(self.plan):
+                return True
+
+            _, suffix_max = self._stack_loads()
+            load = suffix_max[customer_at, stack_idx]
 
-        return all(plan[stack_idx].volume() + item.volume
-                   <= problem.stack_capacity for plan in plans)
+        return load + item.volume <= Problem().stack_capacity
+
+    def _stack_loads(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the maximum stack loads over the legs up to and including each
+        leg, and over the legs from each leg onwards. Each is a (legs x stacks)
+        matrix. O(1), once computed.
+        """
+        if self._max_loads is None:
+            loads = np.array([[stack.volume() for stack in self.plan.peek(leg)]
+                              for leg in range(len(self.plan))])
+
+            prefix_max = np.maximum.accumulate(loads, axis=0)
+            suffix_max = np.maximum.accumulate(loads[::-1], axis=0)[::-1]
+
+            self._max_loads = prefix_max, suffix_max
+
+        return self._max_loads
 
     def opt_insert(self, customer: int) -> Tuple[int, float]:
         """
@@ -196,12 +317,12 @@ class Route:
         problem = Problem()
 
         self.customers.insert(at, customer)
-        self.plan.insert(at + 1, deepcopy(self.plan[at]))
+        self.plan.insert(at + 1, deepcopy(self.plan.peek(at)))
 
         # Inserts customer delivery item into the loading plan. The stack to
         # insert into is the shortest stack at the depot (since the delivery
         # item is carried from the depot to the customer).
-        stack_idx = self.plan[0].shortest_stack().index
+        stack_idx = self._shortest_stack_at(0)
         delivery = problem.demands[customer]
 
         for plan in self.plan[:at + 1]:
@@ -239,6 +360,7 @@ class Route:
 
         self._update_routing_cost(customer, at, "insert")
         self.invalidate_handling_cache()
+        self._leg_costs.insert(at, None)
 
     def remove_customer(self, customer: int):
         """
@@ -265,6 +387,17 @@ class Route:
         del self.customers[idx]
         del self.plan[idx + 1]
 
+        # The leg costs might not have been computed yet, in which case there
+        # is nothing to remove. See also handling_cost.
+        if idx < len(self._leg_costs):
+            del self._leg_costs[idx]
+
+    def _shortest_stack_at(self, leg: int) -> int:
+        """
+        Returns the index of the shortest stack at the given leg of the route.
+        """
+        return self.plan.peek(leg).shortest_stack().index
+
     def _insert_cost(self, customer: int, at: int) -> float:
         """
         Computes the routing cost of inserting customer in route at position
@@ -1,4 +1,5 @@
-from typing import Generic, List, Set, TypeVar
+from types import MappingProxyType
+from typing import Dict, Generic, List, Mapping, Set, TypeVar, Union
 
 _T = TypeVar("_T")
 
@@ -7,6 +8,12 @@ class SetList(Generic[_T]):
     _list: List[_T]
     _set: Set[_T]
 
+    # Maps items to their position in the list. Positions are maintained
+    # lazily: only those of items before the first changed index (_valid) are
+    # guaranteed to be correct. The others are updated on demand.
+    _positions: Dict[_T, int]
+    _valid: int
+
     def __init__(self, *args, **kwargs):
         """
         SetList is a hash set and array data structure, that supports the usual
@@ -19,6 +26,19 @@ class SetList(Generic[_T]):
         self._list = list(*args, **kwargs)
         self._set = set(*args, **kwargs)
 
+        self._positions = {}
+        self._valid = 0
+
+    def __copy__(self):
+        new = SetList()
+
+        new._list = self._list.copy()
+        new._set = self._set.copy()
+        new._positions = self._positions.copy()
+        new._valid = self._valid
+
+        return new
+
     def __contains__(self, item: _T) -> bool:
         return item in self._set
 
@@ -29,30 +49,68 @@ class SetList(Generic[_T]):
         yield from self._list
 
     def append(self, obj: _T):
+        if self._valid == len(self._list):
+            self._positions[obj] = len(self._list)
+            self._valid += 1
+
         self._list.append(obj)
         self._set.add(obj)
 
     def index(self, obj: _T) -> int:
-        return self._list.index(obj)
+        """
+        Returns the position of the passed-in object, or raises a ValueError if
+        it is not in this SetList. O(1) when the object is before the first
+        index changed since the positions were last updated, and O(n - k)
+        otherwise, where n is the length of the list and k that first changed
+        index. Alternating mutations and look-ups of later items thus costs
+        O(n - k) per look-up, rather than O(1).
+        """
+        if obj not in self._set:
+            raise ValueError(f"{obj} is not in SetList.")
+
+        idx = self._positions.get(obj, self._valid)
+
+        if idx >= self._valid:
+            self._update_positions()
+            idx = self._positions[obj]
+
+        return idx
+
+    def positions(self) -> Mapping[_T, int]:
+        """
+        Returns a read-only mapping of items to their position in the list.
+        This mapping is a view that is only valid until the SetList changes.
+        O(n - k), where n is the length of the list, and k the first index
+        changed since the positions were last updated. This is O(1) when the
+        list did not change.
+        """
+        self._update_positions()
+        return MappingProxyType(self._positions)
 
     def insert(self, index: int, obj: _T):
+        self._invalidate(index)
+
         self._list.insert(index, obj)
         self._set.add(obj)
 
     def remove(self, obj: _T):
-        self._list.remove(obj)
-        self._set.remove(obj)
+        self.__delitem__(self.index(obj))
 
     def __delitem__(self, index: int):
+        self._invalidate(index)
+
         item = self._list[index]
 
         del self._list[index]
         self._set.remove(item)
+        self._positions.pop(item, None)
 
     def __getitem__(self, index: int) -> _T:
         return self._list[index]
 
-    def __setitem__(self, index: int, value: _T):
+    def __setitem__(self, index: Union[int, slice], value: _T):
+        self._invalidate(index)
+
         curr = self._list[index]
 
         self._list[index] = value
@@ -66,6 +124,9 @@ class SetList(Generic[_T]):
 
         assert len(curr) == len(value)
 
+        for item in curr:
+            self._positions.pop(item, None)
+
         self._set.difference_update(curr)
         self._set.update(value)
 
@@ -75,6 +136,29 @@ class SetList(Generic[_T]):
     def to_set(self) -> Set[_T]:
         return self._set
 
+    def _invalidate(self, index: Union[int, slice]):
+        """
+        Marks the positions of the items from the given index onwards as
+        possibly changed. O(1), for integer indices.
+        """
+        if isinstance(index, slice):
+            index = min(range(len(self._list))[index], default=self._valid)
+        elif index < 0:
+            index = max(len(self._list) + index, 0)
+
+        self._valid = min(self._valid, index)
+
+    def _update_positions(self):
+        """
+        Updates the positions of the items from the first changed index
+        onwards. O(n - k), where n is the length of the list, and k the first
+        changed index.
+        """
+        for idx in range(self._valid, len(self._list)):
+            self._positions[self._list[idx]] = idx
+
+        self._valid = len(self._list)
+
     def __str__(self):
         return str(self._list)
 
@@ -0,0 +1,148 @@
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Arrays are stored at offsets that are a multiple of this, so all views into
+# the shared memory block are properly aligned.
+_ALIGNMENT = 64
+
+
+class SharedProblem:
+    __slots__ = ['_header', '_layout', '_name', '_memory', '_owner', '_arrays']
+
+    _header: np.ndarray
+    _layout: Dict[str, Tuple[int, Tuple[int, ...], str]]
+    _name: Optional[str]
+    _memory: Optional[Any]  # SharedMemory, when attached to the block.
+    _owner: bool
+
+    # The arrays themselves, when shared memory is not available (Python 3.7).
+    # These are then pickled along with this object.
+    _arrays: Optional[Dict[str, np.ndarray]]
+
+    def __init__(self, header: np.ndarray, arrays: Dict[str, np.ndarray]):
+        """
+        Problem instance data in a single shared memory block, which other
+        processes may attach to without copying the data. Pickling this object
+        is cheap: only the block name and array layout are pickled, not the
+        data itself. See ``Problem.share`` and ``Problem.attach``.
+
+        The process that creates this object owns the shared memory block, and
+        should close it once the other processes are done with it - this also
+        frees the block. The object may be used as a context manager to this
+        end.
+
+        Shared memory requires Python 3.8 or later. On earlier versions, the
+        arrays are instead pickled along with this object, so each process
+        receives its own copy.
+
+        Parameters
+        ----------
+        header
+            Problem instance header, with the scalar parameters.
+        arrays
+            Mapping of array names to the arrays to share.
+        """
+        self._header = header
+        self._layout = {}
+        self._owner = True
+
+        shared_memory = _shared_memory()
+
+        if shared_memory is None:
+            self._name = self._memory = None
+            self._arrays = arrays
+            return
+
+        self._arrays = None
+        size = 0
+
+        for name, array in arrays.items():
+            self._layout[name] = (size, array.shape, array.dtype.str)
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        self._memory = shared_memory(create=True, size=max(size, 1))
+        self._name = self._memory.name
+
+        for name, array in arrays.items():
+            self._view(name, writeable=True)[...] = array
+
+    def __getstate__(self):
+        return self._header, self._layout, self._name, self._arrays
+
+    def __setstate__(self, state):
+        self._header, self._layout, self._name, self._arrays = state
+        self._memory = None
+        self._owner = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def header(self) -> np.ndarray:
+        return self._header
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Returns read-only views of the shared arrays, attaching to the shared
+        memory block first if needed. The views are only valid while this
+        object is alive, and not yet closed.
+        """
+        if self._arrays is not None:
+            return {name: _read_only(array)
+                    for name, array in self._arrays.items()}
+
+        return {name: self._view(name) for name in self._layout}
+
+    def close(self):
+        """
+        Closes this process's access to the shared memory block, and frees the
+        block if this process owns it. Views into the block must no longer be
+        used after this.
+        """
+        if self._memory is not None:
+            memory, self._memory = self._memory, None
+
+            try:
+                memory.close()
+            except BufferError:
+                # Views into the block still exist. The block is then unmapped
+                # once those views and the memory object are garbage collected.
+                pass
+
+            if self._owner:
+                memory.unlink()
+
+    def _view(self, name: str, writeable: bool = False) -> np.ndarray:
+        if self._memory is None:
+            self._memory = _shared_memory()(name=self._name)
+
+        offset, shape, dtype = self._layout[name]
+
+        view = np.ndarray(shape, dtype, self._memory.buf, offset)
+        view.flags.writeable = writeable
+
+        return view
+
+
+def _shared_memory():
+    """
+    Returns the SharedMemory class, or None if shared memory is not available.
+    This is imported lazily, as it requires Python 3.8 or later.
+    """
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        return None
+
+    return SharedMemory
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+
+    return view
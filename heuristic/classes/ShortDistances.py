@@ -0,0 +1,48 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+class ShortDistances:
+    __slots__ = ['_distances', '_rows']
+
+    _distances: np.ndarray
+    _rows: List[memoryview]
+
+    def __init__(self, distances: np.ndarray):
+        """
+        Short (three length) distances, computed on demand from the passed-in
+        distance matrix. Indexing this object as ``[first, second, third]``
+        returns the distance of first -> second -> third, where the DEPOT is
+        -1 and customers are indexed from zero. This uses O(n^2) memory, rather
+        than the O(n^3) required to pre-compute all such distances.
+        """
+        self._distances = np.ascontiguousarray(distances, dtype=float)
+
+        # Scalar look-ups into a list of memory views are several times faster
+        # than NumPy indexing. The views share the matrix's memory, so this
+        # takes no memory of its own - also when the matrix is shared between
+        # processes (see ``Problem.share``).
+        self._rows = [memoryview(row) for row in self._distances]
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        num_nodes = len(self._rows)
+        return num_nodes, num_nodes, num_nodes
+
+    def __getitem__(self, route):
+        first, second, third = route
+
+        try:
+            rows = self._rows
+            return rows[first + 1][second + 1] + rows[second + 1][third + 1]
+        except TypeError:
+            # Not all indices are scalars, so we defer to NumPy, which can
+            # broadcast the (array) indices against each other.
+            first, second, third = map(np.asarray, route)
+
+            return self._distances[first + 1, second + 1] \
+                + self._distances[second + 1, third + 1]
+
+    def __len__(self) -> int:
+        return len(self._rows)
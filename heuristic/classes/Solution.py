@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from copy import copy, deepcopy
-from typing import List
+from typing import Dict, List
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -14,31 +14,55 @@ from .Stacks import Stacks
 
 
 class Solution(State):
-    __slots__ = ['routes', 'unassigned']
+    __slots__ = ['routes', 'unassigned', '_route_indices']
 
     routes: List[Route]
     unassigned: List[int]
 
+    # Maps customers to the index of their route. The routes may be changed
+    # freely, so this map can become outdated. It is validated on look-up,
+    # and rebuilt when needed. See find_route.
+    _route_indices: Dict[int, int]
+
     def __init__(self, routes: List[Route], unassigned: List[int]):
         self.routes = routes
         self.unassigned = unassigned
 
+        self._route_indices = {}
+
     def __copy__(self):
-        return Solution(copy(self.routes), copy(self.unassigned))
+        solution = Solution(copy(self.routes), copy(self.unassigned))
+        solution._route_indices = copy(self._route_indices)
+
+        return solution
 
     def __deepcopy__(self, memodict={}):
-        return Solution(deepcopy(self.routes), deepcopy(self.unassigned))
+        solution = Solution(deepcopy(self.routes), deepcopy(self.unassigned))
+        solution._route_indices = copy(self._route_indices)
+
+        return solution
 
     def find_route(self, customer: int) -> Route:
         """
         Finds and returns the Route containing the passed-in customer. Raises
-        a LookupError if no such Route exists. O(num_routes).
+        a LookupError if no such Route exists. O(1), amortised.
         """
-        for route in self.routes:
-            if customer in route:
-                return route
+        idx = self._route_indices.get(customer, len(self.routes))
+
+        # Each customer is in at most one route, so if the route at idx
+        # contains this customer, it must be the route we are looking for.
+        if idx >= len(self.routes) or customer not in self.routes[idx]:
+            self._route_indices = {other: idx_route
+                                   for idx_route, route
+                                   in enumerate(self.routes)
+                                   for other in route.customers.to_list()}
+
+            if customer not in self._route_indices:
+                raise LookupError(f"Customer {customer} is not understood.")
+
+            idx = self._route_indices[customer]
 
-        raise LookupError(f"Customer {customer} is not understood.")
+        return self.routes[idx]
 
     def cost(self) -> float:
         """
@@ -1,63 +1,110 @@
 from __future__ import annotations
 
-from collections import deque
+from array import array
 from copy import copy
-from functools import partial
-from itertools import islice
-from typing import Deque, Set
+from itertools import accumulate, chain, count
+from operator import attrgetter
+from typing import Dict, List, Optional, Set
 
 from .Item import Item
 
+_volume = attrgetter("volume")
+_versions = count(1)
 
-class Stack:
-    __slots__ = ['stack', '_set', '_index', '_volume']
 
-    stack: Deque[Item]
-    _set: Set[Item]
+class Stack:
+    __slots__ = ['_items',
+                 '_set',
+                 '_index',
+                 '_volume',
+                 '_prefix',
+                 '_positions',
+                 '_shared',
+                 '_version',
+                 '_locations']
+
+    _items: List[Item]
+    _set: Set[int]  # ids of the items in this stack, for fast look-ups
 
     _index: int
     _volume: float
 
+    # Prefix volume sums: _prefix[idx] is the volume of the first idx items,
+    # from the rear, and _positions maps item ids to their index. These are
+    # computed when needed, and cleared whenever the stack changes.
+    _prefix: Optional[array]
+    _positions: Optional[Dict[int, int]]
+
+    _shared: bool  # whether the item containers are shared with other stacks
+    _version: int
+
+    # Item locations (item id to stack index) of the Stacks this stack belongs
+    # to, if any. This stack keeps its items' locations up-to-date.
+    _locations: Optional[Dict[int, int]]
+
     def __init__(self, index: int):
         """
-        Wrapper class for a stack of items, maintained as a deque of Items. Such
+        Wrapper class for a stack of items, maintained as a list of Items. Such
         a stack represents a single stack of a truck, from the rear (left) to
         the front (right).
         """
-        self.stack = deque()
+        self._items = []
         self._set = set()
 
         self._index = index
         self._volume = 0.
+        self._prefix = None
+        self._positions = None
+
+        self._shared = False
+        self._version = 0
+
+        self._locations = None
 
     def __contains__(self, item: Item) -> bool:
         """
         Tests if this stack contains the passed-in item. O(1).
         """
-        return item in self._set
+        return item.id in self._set
 
     def __deepcopy__(self, memodict={}):
         new = Stack(self.index)
 
         # We don't need deep copies of these items, as the *items* themselves
-        # never change. Just a shallow copy of their containers suffices.
-        new.stack = copy(self.stack)
-        new._set = copy(self._set)
-        new._volume = copy(self._volume)
+        # never change. The copy shares the item containers with this stack,
+        # and either stack copies them just before its first mutation. O(1).
+        new._items = self._items
+        new._set = self._set
+        new._volume = self._volume
+        new._prefix = self._prefix
+        new._positions = self._positions
+        new._version = self._version
+
+        new._shared = self._shared = True
 
         return new
 
+    def __setstate__(self, state):
+        _, slots = state
+
+        for attr, value in slots.items():
+            setattr(self, attr, value)
+
+        # Versions are only unique within a single process, so an unpickled
+        # stack (e.g. from another process) is given a new version.
+        self.mark_changed()
+
     def __iter__(self):
-        yield from self.stack
+        yield from self._items
 
     def __reversed__(self):
-        yield from reversed(self.stack)
+        yield from reversed(self._items)
 
     def __getitem__(self, idx: int):
-        return self.stack[idx]
+        return self._items[idx]
 
     def __len__(self):
-        return len(self.stack)
+        return len(self._items)
 
     @property
     def index(self):
@@ -66,6 +113,17 @@ class Stack:
         """
         return self._index
 
+    @property
+    def version(self) -> int:
+        """
+        Returns this stack's version. Each change to a stack gives it a new
+        version, larger than any version handed out before. Copies retain the
+        version of the stack they were copied from, so stacks with the same
+        version have the same contents. This allows caching (expensive)
+        computations on stacks.
+        """
+        return self._version
+
     @staticmethod
     def moved_volume(before: Stack, after: Stack) -> float:
         """
@@ -77,94 +135,151 @@ class Stack:
         must have been removed from some other stack (we do not want to count
         twice).
         """
-        it_before = reversed(before)
-        it_after = reversed(after)
+        b_items = before._items
+        a_items = after._items
 
-        for (idx, b_item), a_item in zip(enumerate(it_before, 1), it_after):
-            idx = len(before) - idx
+        # Number of items (from the front) the before and after stacks have
+        # in common. Comparing the whole overlap at once is fast, and this is
+        # very often the case, so we only search for the first difference if
+        # there actually is one.
+        common = min(len(b_items), len(a_items))
 
-            if b_item != a_item:
-                # This implies all items up to this point must have been
-                # moved out of the truck, which is exactly the volume that
-                # must be moved to insert an item at this index.
-                return before.insert_volume(idx + 1)
-        else:
-            if len(before) > len(after):
-                # This implies some items have been moved out of the stack,
-                # and we should count those.
-                return before.insert_volume(len(before) - len(after))
+        if b_items[len(b_items) - common:] != a_items[len(a_items) - common:]:
+            b_front = reversed(b_items)
+            a_front = reversed(a_items)
 
-        return 0.
+            common = next(idx for idx, (b_item, a_item)
+                          in enumerate(zip(b_front, a_front))
+                          if b_item != a_item)
+
+        # Any items before the common front have been moved, either to get at
+        # an item, insert an item, or because the item is no longer in this
+        # stack (insertions are not counted).
+        return before.insert_volume(len(b_items) - common)
 
     def deliveries_in_stack(self) -> int:
         """
         Number of deliverable items in this stack.
         """
-        return len([item for item in self.stack if item.is_delivery()])
+        return len([item for item in self._items if item.is_delivery()])
 
     def pickups_in_stack(self) -> int:
         """
         Number of pickup items in this stack.
         """
-        return len(self.stack) - self.deliveries_in_stack()
+        return len(self._items) - self.deliveries_in_stack()
 
     def item_index(self, item: Item) -> int:
-        return self.stack.index(item)
+        """
+        Returns the index (from the rear) of the passed-in item, which must be
+        in this stack. O(1) once the item positions are known, and O(n)
+        otherwise, where n is the number of stack items.
+        """
+        self._index_items()
+        return self._positions[item.id]
 
     def insert_volume(self, at: int) -> float:
         """
         Computes the volume that needs to be moved in order to insert an item at
-        the given index. Does not actually change the stack lay-out. O(n), where
-        n is the number of stack items.
+        the given index. Does not actually change the stack lay-out. O(1) once
+        the prefix volume sums are known, and O(n) otherwise, where n is the
+        number of stack items. These are computed on first use after each
+        mutation.
         """
-        return sum(item.volume for item in islice(self.stack, at))
+        self._index_items()
+        return self._prefix[min(at, len(self._items))]
 
     def remove_volume(self, item: Item) -> float:
         """
         Computes the (excess) volume that needs to be moved to remove the
-        passed-in item. Does not actually change the stack lay-out. O(n), where
-        n is the number of stack items.
+        passed-in item. Does not actually change the stack lay-out. O(1) once
+        the prefix volume sums and item positions are known, and O(n)
+        otherwise, where n is the number of stack items.
         """
         assert item in self
-        return self.insert_volume(self.stack.index(item))
+        return self.insert_volume(self.item_index(item))
 
     def push_front(self, item: Item):
         """
         Places the item in the front of the truck (right). O(1).
         """
-        self._append(self.stack.append, item)
+        self.push(len(self._items), item)
 
     def push_rear(self, item: Item):
         """
-        Adds item to the rear of the truck (left). O(1).
+        Adds item to the rear of the truck (left). O(n), where n is the number
+        of items in the stack, but fast in practice.
         """
-        self._append(self.stack.appendleft, item)
+        self.push(0, item)
 
     def push(self, idx: int, item: Item):
         """
         Generalised push, pushes an item at index idx (from the rear).
         """
-        self._append(partial(self.stack.insert, idx), item)
+        self._own()
+
+        self._items.insert(idx, item)
+        self._set.add(item.id)
+        self._volume += item.volume
+
+        if self._locations is not None:
+            self._locations[item.id] = self._index
 
     def remove(self, item: Item):
         """
         Removes the passed-in item from the stack. O(n), where n is the number
         of items in the stack.
         """
-        self.stack.remove(item)
-        self._set.remove(item)
+        self._own()
+
+        self._items.remove(item)
+        self._set.remove(item.id)
         self._volume -= item.volume
 
+        if self._locations is not None:
+            del self._locations[item.id]
+
     def volume(self) -> float:
         """
         Returns the currently used volume by the items in this stack. O(1).
         """
         return self._volume
 
-    def _append(self, func, item: Item):
-        func(item)
-        self._set.add(item)
-        self._volume += item.volume
+    def mark_changed(self):
+        """
+        Marks this stack as changed, by giving it a new version. This is done
+        automatically whenever the stack is mutated, and only needs to be
+        called when the stack changes in some other way - for example, when it
+        replaces another stack.
+        """
+        self._version = next(_versions)
+
+    def _index_items(self):
+        """
+        Computes the prefix volume sums and item positions, if these are not
+        yet known. O(n) when computed, and O(1) otherwise.
+        """
+        if self._prefix is None:
+            volumes = chain((0.,), map(_volume, self._items))
+            self._prefix = array('d', accumulate(volumes))
+            self._positions = {item.id: idx
+                               for idx, item in enumerate(self._items)}
+
+    def _own(self):
+        """
+        Ensures this stack does not share its item containers with any other
+        stack, so they may be mutated. Also clears the prefix volume sums and
+        item positions, and marks the stack as changed, as it is about to be.
+        O(n) when shared, and O(1) otherwise.
+        """
+        if self._shared:
+            self._items = copy(self._items)
+            self._set = copy(self._set)
+            self._shared = False
+
+        self._prefix = None
+        self._positions = None
+        self.mark_changed()
 
     def __str__(self):
         """
@@ -172,4 +287,4 @@ class Stack:
         front (first item) to rear (last). O(n), where n is the number of stack
         items.
         """
-        return ",".join(str(item) for item in reversed(self.stack))
+        return ",".join(str(item) for item in reversed(self._items))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from operator import methodcaller
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from .Item import Item
 from .Problem import Problem
@@ -9,12 +10,36 @@ from .Stack import Stack
 
 
 class Stacks:
-    __slots__ = ['stacks']
+    __slots__ = ['stacks', 'owner', '_locations']
 
     stacks: List[Stack]
+    owner: Optional[object]  # the loading plan that may mutate these stacks
+
+    # Maps item ids to the index of the stack they are stored in. This is
+    # maintained by the stacks as items are pushed and removed.
+    _locations: Dict[int, int]
 
     def __init__(self, num_stacks: int):
         self.stacks = [Stack(idx) for idx in range(num_stacks)]
+        self.owner = None
+
+        self._locations = {}
+
+        for stack in self.stacks:
+            stack._locations = self._locations
+
+    def __deepcopy__(self, memodict={}):
+        new = Stacks(0)
+
+        # This is cheap, as the stacks are copied-on-write. See also the
+        # Stack class.
+        new.stacks = [deepcopy(stack, memodict) for stack in self.stacks]
+        new._locations = self._locations.copy()
+
+        for stack in new.stacks:
+            stack._locations = new._locations
+
+        return new
 
     def __len__(self):
         return len(self.stacks)
@@ -26,7 +51,17 @@ class Stacks:
         return self.stacks[idx]
 
     def __setitem__(self, idx: int, stack: Stack):
+        for item in self.stacks[idx]:
+            del self._locations[item.id]
+
+        self.stacks[idx]._locations = None
         self.stacks[idx] = stack
+        stack.mark_changed()
+
+        stack._locations = self._locations
+
+        for item in stack:
+            self._locations[item.id] = stack.index
 
     @staticmethod
     def cost(customer: int,
@@ -50,6 +85,14 @@ class Stacks:
         assert volume >= 0.
         return problem.handling_cost * volume
 
+    def version(self) -> int:
+        """
+        Returns the version of these stacks, which changes whenever any of the
+        stacks changes. Stacks with the same version have the same contents.
+        See also ``Stack.version``. O(1).
+        """
+        return max(stack.version for stack in self.stacks)
+
     def is_feasible(self) -> bool:
         """
         Determines if this loading plan is feasible, that is, all stack
@@ -85,11 +128,10 @@ class Stacks:
         Finds the stack the given item is stored in. Raises a LookupError when
         the item is not in any stacks. O(1).
         """
-        for idx, stack in enumerate(self.stacks):
-            if item in stack:
-                return stack
-
-        raise LookupError(f"Item {item} not in any stacks.")
+        try:
+            return self.stacks[self._locations[item.id]]
+        except KeyError:
+            raise LookupError(f"Item {item} not in any stacks.")
 
     def _first_stack(self, criterion: Callable[..., Stack]) -> Stack:
         return criterion(self.stacks, key=methodcaller("volume"))
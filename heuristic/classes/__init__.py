@@ -1,5 +1,7 @@
 from .Heap import Heap
 from .Item import Item
+from .LoadingPlan import LoadingPlan
+from .OperatorStatistics import OperatorStatistics
 from .Problem import Problem
 from .Route import Route
 from .SetList import SetList
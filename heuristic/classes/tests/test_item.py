@@ -0,0 +1,24 @@
+from heuristic.classes import Item
+from heuristic.constants import DEPOT
+
+
+def test_item_ids():
+    delivery = Item(5, DEPOT, 3)
+    pickup = Item(2, 3, DEPOT)
+
+    assert delivery.id == 6
+    assert pickup.id == 7
+
+    # Items are identified by their id only, not by their volume.
+    assert delivery == Item(1, DEPOT, 3)
+    assert delivery != pickup
+    assert len({delivery, pickup, Item(1, DEPOT, 3)}) == 2
+
+
+def test_item_not_equal_to_other_types():
+    item = Item(5, DEPOT, 3)
+
+    assert item != item.id
+    assert item != None  # noqa: E711
+    assert item not in [6, "d4"]
+    assert hash(item) == item.id
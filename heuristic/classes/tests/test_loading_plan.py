@@ -0,0 +1,57 @@
+from copy import deepcopy
+
+from heuristic.classes import Item, LoadingPlan, Stacks
+from heuristic.constants import DEPOT
+
+
+def get_plan():
+    stacks = [Stacks(2), Stacks(2)]  # [d1; ] -> [; p1]
+    stacks[0][0].push_rear(Item(5, DEPOT, 0))
+    stacks[1][1].push_rear(Item(2, 0, DEPOT))
+
+    return LoadingPlan(stacks)
+
+
+def test_copies_share_legs_until_accessed():
+    plan = get_plan()
+    copy = deepcopy(plan)
+
+    for idx in range(len(plan)):
+        assert copy.peek(idx) is plan.peek(idx)
+
+    # Accessing a leg of the copy may mutate it, so the copy should now have
+    # its own leg. The other leg is still shared.
+    assert copy[0] is not plan.peek(0)
+    assert copy.peek(1) is plan.peek(1)
+
+
+def test_mutating_copy_does_not_change_original():
+    plan = get_plan()
+    copy = deepcopy(plan)
+
+    item = Item(3, DEPOT, 1)
+
+    for stacks in copy:
+        stacks[0].push_rear(item)
+
+    assert str(plan) == "[Stacks(d1;), Stacks(;p1)]"
+    assert str(copy) == "[Stacks(d1,d2;), Stacks(d2;p1)]"
+
+    # And the other way around: mutating the original should not change the
+    # copy, even though the original was the one copied from.
+    plan[1][1].remove(Item(2, 0, DEPOT))
+
+    assert str(plan) == "[Stacks(d1;), Stacks(;)]"
+    assert str(copy) == "[Stacks(d1,d2;), Stacks(d2;p1)]"
+
+
+def test_structural_changes_do_not_affect_copies():
+    plan = get_plan()
+    copy = deepcopy(plan)
+
+    del copy[1]
+    copy.append(Stacks(2))
+
+    assert len(plan) == len(copy) == 2
+    assert str(plan) == "[Stacks(d1;), Stacks(;p1)]"
+    assert str(copy) == "[Stacks(d1;), Stacks(;)]"
@@ -0,0 +1,84 @@
+import csv
+import json
+import pickle
+
+import pytest
+from numpy.testing import assert_almost_equal
+
+from heuristic.classes import OperatorStatistics
+
+
+def test_records():
+    statistics = OperatorStatistics()
+
+    statistics.record_call("destroy", "op", 2.)
+    statistics.record_outcome("destroy", "op", "best", 5.)
+
+    statistics.record_call("destroy", "op", 2.)
+    statistics.record_outcome("destroy", "op", "rejected", -3.)
+
+    record, = statistics.to_records()
+
+    assert record["kind"] == "destroy"
+    assert record["operator"] == "op"
+    assert record["calls"] == 2
+    assert record["bests"] == 1
+    assert record["accepts"] == 0
+    assert record["rejects"] == 1
+
+    # Worsening candidates do not count against the improvement.
+    assert_almost_equal(record["improvement"], 5.)
+    assert_almost_equal(record["mean_time"], 2.)
+    assert_almost_equal(record["improvement_per_second"], 5. / 4.)
+
+
+def test_to_file(tmp_path):
+    statistics = OperatorStatistics()
+
+    statistics.record_call("repair", "first", 1.)
+    statistics.record_call("local search", "second", 1.)
+    statistics.record_outcome("local search", "second", "better")
+
+    statistics.to_file(str(tmp_path / "stats.json"))
+    statistics.to_file(str(tmp_path / "stats.csv"))
+
+    with open(tmp_path / "stats.json") as file:
+        assert json.load(file) == statistics.to_records()
+
+    with open(tmp_path / "stats.csv") as file:
+        rows = list(csv.DictReader(file))
+
+    assert [row["operator"] for row in rows] == ["first", "second"]
+    assert [row["accepts"] for row in rows] == ["0", "1"]
+
+
+def test_merge():
+    statistics = OperatorStatistics()
+    statistics.record_call("local search", "op", 1.)
+    statistics.record_outcome("local search", "op", "better", 2.)
+
+    # The other statistics are recorded elsewhere, e.g. in a worker process.
+    other = pickle.loads(pickle.dumps(OperatorStatistics()))
+    other.record_call("local search", "op", 3.)
+    other.record_outcome("local search", "op", "rejected")
+    other.record_call("local search", "other", 1.)
+
+    statistics.merge(other)
+    first, second = statistics.to_records()
+
+    assert first["operator"] == "op"
+    assert first["calls"] == 2
+    assert first["accepts"] == 1
+    assert first["rejects"] == 1
+    assert_almost_equal(first["time"], 4.)
+    assert_almost_equal(first["improvement"], 2.)
+
+    assert second["operator"] == "other"
+    assert second["calls"] == 1
+
+
+def test_unknown_outcome():
+    statistics = OperatorStatistics()
+
+    with pytest.raises(ValueError):
+        statistics.record_outcome("destroy", "op", "improved")
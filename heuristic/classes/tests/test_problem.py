@@ -0,0 +1,179 @@
+import importlib
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from heuristic.classes import Problem
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_cached_instance_equals_parsed(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", str(tmp_path))
+
+    location = str(DATA / "small_1.csv")
+    problems = [Problem.from_file(location, use_cache=False, delimiter=','),
+                Problem.from_file(location, delimiter=','),  # writes cache
+                Problem.from_file(location, delimiter=',')]  # reads cache
+
+    assert len(list(tmp_path.iterdir())) != 0
+
+    for attr in ["instance", "capacity", "handling_cost", "num_customers",
+                 "num_stacks", "distances", "nearest_customers",
+                 "smallest_quantity_customers"]:
+        for problem in problems[1:]:
+            assert_equal(getattr(problem, attr), getattr(problems[0], attr))
+
+    for first, second in zip(problems[0].demands, problems[2].demands):
+        assert first.volume == second.volume
+
+
+def test_items_indexed_by_id():
+    problem = Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    assert len(problem.items) == 2 * problem.num_customers
+
+    for customer in range(problem.num_customers):
+        delivery = problem.demands[customer]
+        pickup = problem.pickups[customer]
+
+        assert problem.items[delivery.id] is delivery
+        assert problem.items[pickup.id] is pickup
+
+        assert problem.volumes[delivery.id] == delivery.volume
+        assert problem.volumes[pickup.id] == pickup.volume
+
+
+def test_instances_share_cached_distances(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", str(tmp_path))
+
+    # These two instances have the same distances, but different demands and
+    # pickups (and other parameters).
+    for instance in ["large_1.csv", "large_25.csv"]:
+        Problem.from_file(str(DATA / instance), delimiter=',')
+
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+    assert len(list(tmp_path.glob("distances-*.npy"))) == 1
+
+
+def test_attached_instance_equals_shared():
+    location = str(DATA / "small_1.csv")
+    problem = Problem.from_file(location, delimiter=',')
+
+    with problem.share() as shared:
+        # Workers receive a pickled copy, which attaches to the shared memory
+        # block, rather than containing the data itself.
+        received = pickle.loads(pickle.dumps(shared))
+        attached = Problem.attach(received)
+
+        assert attached is Problem()
+        assert attached is not problem
+
+        for attr in ["instance", "capacity", "handling_cost", "num_customers",
+                     "num_stacks", "distances", "nearest_customers",
+                     "smallest_quantity_customers", "volumes"]:
+            assert_equal(getattr(attached, attr), getattr(problem, attr))
+
+        assert not attached.distances.flags.writeable
+        assert attached.short_distances[0, 1, 2] \
+            == problem.short_distances[0, 1, 2]
+
+        received.close()
+
+
+def test_shared_instance_without_shared_memory(monkeypatch):
+    # Shared memory is not available before Python 3.8. The problem data is
+    # then pickled along with the shared object.
+    module = importlib.import_module("heuristic.classes.SharedProblem")
+    monkeypatch.setattr(module, "_shared_memory", lambda: None)
+
+    location = str(DATA / "small_1.csv")
+    problem = Problem.from_file(location, delimiter=',')
+
+    with problem.share() as shared:
+        received = pickle.loads(pickle.dumps(shared))
+        attached = Problem.attach(received)
+
+        assert attached is not problem
+
+        for attr in ["instance", "capacity", "num_customers", "distances",
+                     "nearest_customers", "smallest_quantity_customers"]:
+            assert_equal(getattr(attached, attr), getattr(problem, attr))
+
+        assert not attached.distances.flags.writeable
+
+        received.close()
+
+
+def test_corrupt_cache_is_parsed_again(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", str(tmp_path))
+
+    location = str(DATA / "small_1.csv")
+    parsed = Problem.from_file(location, use_cache=False, delimiter=',')
+    Problem.from_file(location, delimiter=',')  # writes cache
+
+    for cache_file in tmp_path.glob("*.npz"):
+        cache_file.write_bytes(b"not a zip file")
+
+    problem = Problem.from_file(location, delimiter=',')
+    assert_equal(problem.distances, parsed.distances)
+
+    # The corrupt cache file has been replaced.
+    problem = Problem.from_file(location, delimiter=',')
+    assert_equal(problem.distances, parsed.distances)
+
+
+def test_unwritable_cache_is_not_an_error(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+
+    # The cache directory cannot be created, as a file of that name exists.
+    cache = tmp_path / "cache"
+    cache.write_bytes(b"")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", str(cache))
+
+    location = str(DATA / "small_1.csv")
+    problem = Problem.from_file(location, delimiter=',')
+
+    assert problem.num_customers == 5
+
+
+def test_cached_instances_are_checked(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", str(tmp_path))
+
+    location = str(DATA / "small_1.csv")
+    problem = Problem.from_file(location, delimiter=',')  # writes cache
+
+    # Replaces the cached demands by demands that do not fit in a stack.
+    cache_file = next(tmp_path.glob("*.npz"))
+
+    with np.load(cache_file) as data:
+        arrays = dict(data)
+
+    arrays["demands"] = arrays["demands"] + problem.stack_capacity
+
+    with open(cache_file, 'wb') as file:
+        np.savez(file, **arrays)
+
+    with pytest.raises(AssertionError):
+        Problem.from_file(location, delimiter=',')
+
+
+def test_cache_is_next_to_instance_file(tmp_path, monkeypatch):
+    module = importlib.import_module("heuristic.classes.Problem")
+    monkeypatch.setattr(module, "INSTANCE_CACHE", None)
+
+    location = tmp_path / "small_1.csv"
+    location.write_bytes((DATA / "small_1.csv").read_bytes())
+
+    # The cache does not depend on the working directory.
+    monkeypatch.chdir(DATA)
+    Problem.from_file(str(location), delimiter=',')
+
+    assert len(list((tmp_path / ".cache").glob("*.npz"))) == 1
@@ -0,0 +1,69 @@
+from copy import deepcopy
+from pathlib import Path
+
+from heuristic.classes import Problem, Route, Stacks
+from heuristic.functions import create_single_customer_route
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_can_insert_item_matches_all_legs():
+    problem = Problem.from_file(str(DATA / "small_1.csv"),
+                                use_cache=False,
+                                delimiter=',')
+
+    route = Route([], [Stacks(problem.num_stacks)])
+    route.attempt_append_tail(list(range(problem.num_customers)))
+
+    for customer in route:
+        for item in [problem.demands[customer], problem.pickups[customer]]:
+            for idx in range(problem.num_stacks):
+                for at in range(len(route.plan)):
+                    legs = range(at) if item.is_delivery() \
+                        else range(at, len(route.plan))
+
+                    expected = all(route.plan.peek(leg)[idx].volume()
+                                   + item.volume <= problem.stack_capacity
+                                   for leg in legs)
+
+                    assert route.can_insert_item(item, idx, at) == expected
+
+
+def test_remove_customer_before_handling_cost():
+    Problem.from_file(str(DATA / "small_1.csv"),
+                      use_cache=False,
+                      delimiter=',')
+
+    route = create_single_customer_route(0)
+
+    for customer in range(1, 3):
+        route.insert_customer(customer, len(route))
+
+    # The handling cost has not yet been computed for this route, so neither
+    # are the costs of its legs.
+    removed = deepcopy(route)
+    removed.remove_customer(2)
+
+    route.handling_cost()
+    route.remove_customer(2)
+
+    assert removed.handling_cost() == route.handling_cost()
+
+
+def test_version_changes_with_route():
+    Problem.from_file(str(DATA / "small_1.csv"),
+                      use_cache=False,
+                      delimiter=',')
+
+    route = create_single_customer_route(0)
+    copied = deepcopy(route)
+
+    # Copies retain the version, as their contents are the same.
+    assert copied.version == route.version
+
+    copied.insert_customer(1, len(copied))
+    assert copied.version > route.version
+
+    version = copied.version
+    copied.remove_customer(1)
+    assert copied.version > version
@@ -0,0 +1,37 @@
+from copy import copy
+
+import pytest
+
+from heuristic.classes import SetList
+
+
+def test_index_follows_changes():
+    setlist = SetList([3, 1, 4])
+
+    assert setlist.index(4) == 2
+
+    setlist.insert(0, 5)  # [5, 3, 1, 4]
+    assert [setlist.index(item) for item in [5, 3, 1, 4]] == [0, 1, 2, 3]
+
+    del setlist[1]  # [5, 1, 4]
+    assert setlist.index(4) == 2
+
+    setlist.remove(5)  # [1, 4]
+    setlist.append(9)  # [1, 4, 9]
+    assert [setlist.index(item) for item in [1, 4, 9]] == [0, 1, 2]
+
+    setlist[0:2] = [4, 1]  # [4, 1, 9]
+    assert [setlist.index(item) for item in [4, 1, 9]] == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        setlist.index(5)
+
+
+def test_positions_and_copies():
+    setlist = SetList([3, 1, 4])
+    copied = copy(setlist)
+
+    setlist.insert(1, 5)  # [3, 5, 1, 4]
+
+    assert dict(setlist.positions()) == {3: 0, 5: 1, 1: 2, 4: 3}
+    assert dict(copied.positions()) == {3: 0, 1: 1, 4: 2}
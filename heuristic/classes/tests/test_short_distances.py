@@ -0,0 +1,39 @@
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from heuristic.classes.ShortDistances import ShortDistances
+from heuristic.constants import DEPOT
+
+
+def test_scalar_indices():
+    distances = np.array([[0, 1, 2],
+                          [3, 0, 4],
+                          [5, 6, 0]])
+
+    short_distances = ShortDistances(distances)
+
+    # The depot is the first row/column of the distance matrix, but it is
+    # indexed as DEPOT (-1).
+    assert_almost_equal(short_distances[DEPOT, 0, 1], 1 + 4)
+    assert_almost_equal(short_distances[1, DEPOT, 0], 5 + 1)
+    assert_almost_equal(short_distances[0, 1, DEPOT], 4 + 5)
+    assert_almost_equal(short_distances[DEPOT, 0, DEPOT], 1 + 3)
+
+
+def test_array_indices_broadcast():
+    rnd = np.random.default_rng(1)
+    distances = rnd.random((6, 6))
+
+    short_distances = ShortDistances(distances)
+    nodes = np.arange(DEPOT, 5)
+
+    first = nodes[:, np.newaxis, np.newaxis]
+    second = nodes[np.newaxis, :, np.newaxis]
+    third = nodes[np.newaxis, np.newaxis, :]
+
+    result = short_distances[first, second, third]
+    assert result.shape == short_distances.shape
+
+    for route in [(DEPOT, 2, 3), (4, DEPOT, 0), (1, 1, DEPOT)]:
+        idx = tuple(node + 1 for node in route)
+        assert_almost_equal(result[idx], short_distances[route])
@@ -0,0 +1,30 @@
+from copy import copy
+
+import pytest
+
+from heuristic.classes import Route, Solution
+
+
+def test_find_route_follows_changes():
+    routes = [Route([0, 1], []), Route([2], []), Route([3, 4], [])]
+    solution = Solution(routes.copy(), [])
+
+    assert solution.find_route(3) is routes[2]
+
+    # Removing a route shifts the other routes, but look-ups should still
+    # find the correct route.
+    del solution.routes[1]
+    assert solution.find_route(3) is routes[2]
+
+    with pytest.raises(LookupError):
+        solution.find_route(2)
+
+    # Changes to a copy should not affect look-ups in the original solution.
+    copied = copy(solution)
+    copied.routes[0] = Route([1], [])
+
+    assert solution.find_route(0) is routes[0]
+    assert copied.find_route(1) is copied.routes[0]
+
+    with pytest.raises(LookupError):
+        copied.find_route(0)
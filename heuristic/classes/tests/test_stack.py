@@ -0,0 +1,95 @@
+from copy import deepcopy
+
+from numpy.testing import assert_almost_equal
+
+from heuristic.classes import Item, Stack
+from heuristic.constants import DEPOT
+
+
+def get_stack():
+    items = [Item(5, DEPOT, 0), Item(4, DEPOT, 1), Item(3, DEPOT, 2)]
+    stack = Stack(0)  # [d1, d2, d3]
+
+    for item in items:
+        stack.push_rear(item)
+
+    return stack, items
+
+
+def test_insert_and_remove_volume():
+    stack, items = get_stack()
+
+    assert_almost_equal(stack.insert_volume(0), 0)
+    assert_almost_equal(stack.insert_volume(2), 3 + 4)
+    assert_almost_equal(stack.insert_volume(3), stack.volume())
+
+    assert_almost_equal(stack.remove_volume(items[0]), 3 + 4)
+    assert_almost_equal(stack.remove_volume(items[2]), 0)
+
+    # Volume queries should reflect changes to the stack.
+    stack.remove(items[1])
+    assert_almost_equal(stack.remove_volume(items[0]), 3)
+
+    stack.push(1, Item(2, 0, DEPOT))  # [d1, p1, d3]
+    assert_almost_equal(stack.remove_volume(items[0]), 3 + 2)
+
+
+def test_item_index():
+    stack, items = get_stack()
+
+    assert [stack.item_index(item) for item in items] == [2, 1, 0]
+
+    # Positions should reflect changes to the stack, but not to its copies.
+    copied = deepcopy(stack)
+    copied.push_rear(Item(2, 0, DEPOT))  # [d1, d2, d3, p1]
+
+    assert [copied.item_index(item) for item in items] == [3, 2, 1]
+    assert [stack.item_index(item) for item in items] == [2, 1, 0]
+
+
+def test_moved_volume():
+    before, items = get_stack()
+
+    # Nothing changed, so nothing is moved.
+    assert_almost_equal(Stack.moved_volume(before, deepcopy(before)), 0)
+
+    # Delivering d3 (the rear item) does not move anything else.
+    after = deepcopy(before)
+    after.remove(items[2])
+    assert_almost_equal(Stack.moved_volume(before, after), 3)
+
+    # Delivering d1 requires moving d2 and d3 out of the way (and d1 itself),
+    # but inserting a pickup item in the rear is not counted.
+    after = deepcopy(before)
+    after.remove(items[0])
+    after.push_rear(Item(2, 0, DEPOT))
+    assert_almost_equal(Stack.moved_volume(before, after), 5 + 4 + 3)
+
+
+def test_copies_do_not_share_changes():
+    stack, items = get_stack()
+    copy = deepcopy(stack)
+
+    copy.remove(items[1])
+
+    assert str(stack) == "d1,d2,d3"
+    assert str(copy) == "d1,d3"
+    assert_almost_equal(stack.insert_volume(3), 5 + 4 + 3)
+    assert_almost_equal(copy.insert_volume(2), 5 + 3)
+
+
+def test_version_changes_with_stack():
+    stack, items = get_stack()
+    copied = deepcopy(stack)
+
+    # Copies retain the version, as their contents are the same.
+    assert copied.version == stack.version
+
+    copied.remove(items[0])
+    assert copied.version > stack.version
+
+    version = stack.version
+    stack.push_front(Item(2, DEPOT, 3))  # [d4, d1, d2, d3]
+
+    assert str(stack) == "d4,d1,d2,d3"
+    assert stack.version > max(version, copied.version)
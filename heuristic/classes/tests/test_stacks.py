@@ -1,5 +1,7 @@
+from copy import deepcopy
 from types import SimpleNamespace
 
+import pytest
 from numpy.testing import assert_almost_equal
 
 from heuristic.classes import Item, Stacks
@@ -20,11 +22,12 @@ def test_handling_costs_scale_with_parameter():
     problem = get_problem(1, 0)
 
     before = Stacks(problem.num_stacks)  # [d2, d1]
-    before[0].stack.extend(problem.demands[:2])
+    for item in problem.demands[:2]:
+        before[0].push_front(item)
 
     after = Stacks(problem.num_stacks)  # [p1, d2]
-    after[0].stack.append(problem.demands[1])
-    after[0].stack.append(problem.pickups[0])
+    after[0].push_front(problem.demands[1])
+    after[0].push_front(problem.pickups[0])
 
     # No handling costs, so volume moved should not matter.
     assert_almost_equal(Stacks.cost(0, before, after, problem), 0)
@@ -43,12 +46,14 @@ def test_moving_items_between_two_stacks():
     problem = get_problem(2, 4 / 3)
 
     before = Stacks(problem.num_stacks)  # [d1; d3, d2]
-    before[0].stack.append(problem.demands[0])
-    before[1].stack.extend(problem.demands[1:])
+    before[0].push_front(problem.demands[0])
+    for item in problem.demands[1:]:
+        before[1].push_front(item)
 
     after = Stacks(problem.num_stacks)  # [d2, d1; p3]
-    after[0].stack.extend(problem.demands[:2])
-    after[1].stack.append(problem.pickups[2])
+    for item in problem.demands[:2]:
+        after[0].push_front(item)
+    after[1].push_front(problem.pickups[2])
 
     # We need to move d1 and d2 to get to the after configuration, which costs
     # (4 / 3) * 9 = 12.
@@ -59,16 +64,41 @@ def test_after_stack_is_empty():
     problem = get_problem(2, 3)
 
     before = Stacks(problem.num_stacks)  # [d1; d3, d2]
-    before[0].stack.append(problem.demands[0])
-    before[1].stack.extend(problem.demands[1:])
+    before[0].push_front(problem.demands[0])
+    for item in problem.demands[1:]:
+        before[1].push_front(item)
 
     after = Stacks(problem.num_stacks)  # [d1, d2, p3; ]
-    after[0].stack.append(problem.pickups[2])
-    after[0].stack.append(problem.demands[1])
-    after[0].stack.append(problem.demands[0])
+    after[0].push_front(problem.pickups[2])
+    after[0].push_front(problem.demands[1])
+    after[0].push_front(problem.demands[0])
 
     # We need to move d2 to get to the after configuration, which costs
     # 3 * 4 = 12.
     assert_almost_equal(Stacks.cost(2, before, after, problem), 12)
 
 # TODO
+
+
+def test_find_stack():
+    problem = get_problem(2, 1)
+    delivery, pickup = problem.demands[0], problem.pickups[0]
+
+    stacks = Stacks(problem.num_stacks)
+    stacks[1].push_front(delivery)
+
+    assert stacks.find_stack(delivery) is stacks[1]
+
+    # Copies should track their own items, independent of the original.
+    copied = deepcopy(stacks)
+    copied[1].remove(delivery)
+    copied[0].push_rear(pickup)
+
+    assert copied.find_stack(pickup) is copied[0]
+    assert stacks.find_stack(delivery) is stacks[1]
+
+    with pytest.raises(LookupError):
+        copied.find_stack(delivery)
+
+    with pytest.raises(LookupError):
+        stacks.find_stack(pickup)
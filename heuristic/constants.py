@@ -5,6 +5,26 @@ from alns.criteria import RecordToRecordTravel, SimulatedAnnealing
 DEPOT = -1
 TEAM_NUMBER = 3
 
+# Parsed problem instances are cached here. None caches them in a .cache
+# directory next to each instance file. The cache version should be changed
+# whenever the cached data changes, which invalidates any existing cache files.
+INSTANCE_CACHE = os.environ.get("INSTANCE_CACHE")
+CACHE_VERSION = "1"
+
+# Number of nearest customers next to which relocate_customer considers
+# inserting a customer (a granular neighbourhood). None considers all
+# insertion points, which is slower, but more thorough. This is the default of
+# the local search, see OperatorContext.
+RELOCATE_NEIGHBOURS = None
+
+# With first improvement, a customer is skipped until the route of the customer
+# or of one of its nearest customers changes. This is the number of nearest
+# customers considered, including the customer itself. See DontLookBits.
+DONT_LOOK_NEIGHBOURS = 10
+
+# Numbers of consecutive customers that or_opt moves between routes.
+SEGMENT_LENGTHS = [2, 3]
+
 if "TRAVIS" in os.environ:
     NEARNESS = 3
     DEGREE_OF_DESTRUCTION = 0.2
@@ -4,9 +4,15 @@ from heuristic.classes import Problem
 from heuristic.constants import DEGREE_OF_DESTRUCTION
 
 
-@lru_cache(1)
 def customers_to_remove() -> int:
     """
     Returns the number of customers to remove from the solution.
     """
-    return int(Problem().num_customers * DEGREE_OF_DESTRUCTION)
+    return _customers_to_remove(Problem())
+
+
+@lru_cache(1)
+def _customers_to_remove(problem: Problem) -> int:
+    # Cached for the current problem instance only, so loading another
+    # instance (e.g. in tests, or batch runs) does not reuse a stale count.
+    return int(problem.num_customers * DEGREE_OF_DESTRUCTION)
@@ -19,7 +19,7 @@ def handling_costs(solution: Solution) -> np.ndarray:
 
     for route in solution.routes:
         for idx, customer in enumerate(route):
-            before, after = route.plan[idx], route.plan[idx + 1]
+            before, after = route.plan.peek(idx), route.plan.peek(idx + 1)
 
             # This is the handling cost for just this customer, as an
             # approximation to the total handling costs.
@@ -0,0 +1,64 @@
+from typing import Dict, FrozenSet, List
+
+from heuristic.classes import Problem, Solution
+from heuristic.constants import DONT_LOOK_NEIGHBOURS
+
+
+class DontLookBits:
+    __slots__ = ['_bits']
+
+    # Maps customers whose bit is set to the versions of their neighbouring
+    # routes at that time. See also Route.version.
+    _bits: Dict[int, FrozenSet[int]]
+
+    def __init__(self):
+        """
+        Don't-look bits of customers, for a solution operator that uses first
+        improvement. A customer's bit is set when its neighbourhood yielded no
+        improving move, and it remains set until one of its neighbouring routes
+        changes. These are the routes visiting the customer, or any of its
+        ``DONT_LOOK_NEIGHBOURS`` nearest customers. Customers whose bit is set
+        are skipped, as their neighbourhood is unlikely to have changed.
+
+        The bits are kept in the operator context, which can also save and
+        restore them, e.g. with a checkpoint. See ``OperatorContext``.
+
+        References
+        ----------
+        - Bentley, Jon J. 1992. "Fast Algorithms for Geometric Traveling
+          Salesman Problems." *ORSA Journal on Computing* 4 (4): 387-411.
+        """
+        self._bits = {}
+
+    def is_set(self, solution: Solution, customer: int) -> bool:
+        """
+        Tests if the passed-in customer's bit is set, that is, none of its
+        neighbouring routes have changed since its neighbourhood was scanned.
+        """
+        return self._bits.get(customer) == self._versions(solution, customer)
+
+    def set(self, solution: Solution, customer: int):
+        """
+        Sets the passed-in customer's bit, after its neighbourhood yielded no
+        improving move.
+        """
+        self._bits[customer] = self._versions(solution, customer)
+
+    def set_customers(self, solution: Solution) -> List[int]:
+        """
+        Returns the customers whose bit is set, for the passed-in solution.
+        Unlike the bits themselves, these do not depend on route versions, so
+        they remain valid for copies of the solution that are unpickled, e.g.
+        from a checkpoint.
+        """
+        return [customer for customer in self._bits
+                if self.is_set(solution, customer)]
+
+    @staticmethod
+    def _versions(solution: Solution, customer: int) -> FrozenSet[int]:
+        # The nearest customer is (usually) the customer itself, so this
+        # includes the customer's own route.
+        nearest = Problem().nearest_customers[customer, :DONT_LOOK_NEIGHBOURS]
+
+        return frozenset(solution.find_route(other).version
+                         for other in nearest)
@@ -0,0 +1,114 @@
+from multiprocessing import get_context
+from typing import Any, Callable, List, Optional, Tuple
+
+from heuristic.classes import Problem, Solution
+
+Move = Tuple[float, Any]  # proposed cost, and the move itself
+Scan = Callable[[Solution, List], List[Optional[Move]]]
+
+
+class Executor:
+    __slots__ = ['_workers', '_min_routes', '_pool', '_shared']
+
+    def __init__(self, workers: int = 1, min_routes: int = 8):
+        """
+        Executes the work of a local search: the route improvements, and the
+        neighbourhood scans of the solution operators. This work is done in
+        this process, or distributed over a pool of worker processes.
+
+        The worker processes are started on first use, and attach to the
+        problem instance in shared memory, rather than each receiving a copy
+        of it. The executor should be closed once it is no longer needed, see
+        ``close``. It may be used as a context manager to this end.
+
+        Parameters
+        ----------
+        workers
+            Number of worker processes. Default 1, which does everything in
+            this process.
+        min_routes
+            Minimum number of routes for which the work is done in parallel.
+            Below this threshold, the communication overhead is not worth it,
+            and everything is done in this process. Default 8.
+        """
+        self._workers = workers
+        self._min_routes = min_routes
+        self._pool = None
+        self._shared = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def map(self, func: Callable, routes: List) -> List:
+        """
+        Applies func to each of the passed-in routes, and returns the results
+        in the order of the routes.
+        """
+        pool = self._get_pool(len(routes))
+
+        if pool is None:
+            return [func(route) for route in routes]
+
+        return pool.map(func, routes)
+
+    def scan(self,
+             func: Scan,
+             solution: Solution,
+             tasks: List) -> List[Optional[Move]]:
+        """
+        Scans a neighbourhood of the passed-in solution for the best move of
+        each task. The scan function should return the best (proposed cost,
+        move) tuple for each of the given tasks, or None for tasks without an
+        improving move.
+
+        The tasks are split into contiguous blocks, four per worker, which are
+        scanned in parallel. The moves are returned in the order of the tasks,
+        as a scan over all tasks at once would return them.
+        """
+        pool = self._get_pool(len(solution.routes))
+        blocks = 4 * self._workers
+
+        if pool is None or len(tasks) < blocks:
+            return func(solution, tasks)
+
+        size = -(-len(tasks) // blocks)  # rounds up.
+        args = [(solution, tasks[start:start + size])
+                for start in range(0, len(tasks), size)]
+
+        return [move for moves in pool.starmap(func, args, chunksize=1)
+                for move in moves]
+
+    def close(self):
+        """
+        Stops the worker processes, if any were started.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def _get_pool(self, num_routes: int):
+        """
+        Returns the process pool to use for work on the passed-in number of
+        routes, or None if it should be done in this process.
+        """
+        if self._workers == 1 or num_routes < self._min_routes:
+            return None
+
+        if self._pool is None:
+            self._shared = Problem().share()
+            self._pool = get_context().Pool(self._workers,
+                                            initializer=Problem.attach,
+                                            initargs=(self._shared,))
+
+        return self._pool
@@ -1,14 +1,53 @@
+import time
 from copy import deepcopy
+from functools import partial
+from typing import Dict, List, Optional
 
-from heuristic.classes import Solution
+from heuristic.classes import OperatorStatistics, Route, Solution
+from heuristic.constants import RELOCATE_NEIGHBOURS
+from .Executor import Executor
+from .OperatorContext import OperatorContext
 
 
 class LocalSearch:
 
-    def __init__(self):
+    def __init__(self,
+                 executor: Optional[Executor] = None,
+                 statistics: Optional[OperatorStatistics] = None,
+                 first_improvement: bool = False,
+                 neighbours: Optional[int] = RELOCATE_NEIGHBOURS):
+        """
+        Local search procedure, which improves solutions using the added
+        solution and route operators.
+
+        Parameters
+        ----------
+        executor
+            Executor for the route improvements, and the neighbourhood scans
+            of the solution operators. Routes are improved independently of
+            each other, so this may be done in parallel. Default None, which
+            does everything in this process. See ``Executor``.
+        statistics
+            When passed, the run time and outcome of each operator call is
+            recorded in these operator statistics. This includes the route
+            operator calls in worker processes. Default None.
+        first_improvement
+            Whether the solution operators perform the first improving move
+            they find, rather than the best. This is faster, but less
+            thorough. See ``OperatorContext``. Default False.
+        neighbours
+            Number of nearest customers next to which relocate_customer
+            considers inserting a customer, or None for all insertion points.
+            See ``OperatorContext``. Default ``RELOCATE_NEIGHBOURS``.
+        """
         self._solution_operators = []
         self._route_operators = []
 
+        self._context = OperatorContext(executor,
+                                        first_improvement,
+                                        neighbours)
+        self._statistics = statistics
+
     def add_route_operator(self, operator):
         self._route_operators.append(operator)
 
@@ -16,26 +55,94 @@ class LocalSearch:
         self._solution_operators.append(operator)
 
     def __call__(self, current: Solution, *args) -> Solution:
-        improved = self._improve(deepcopy(current), self._solution_operators)
+        improved = self._improve(deepcopy(current),
+                                 self._solution_operators,
+                                 self._statistics,
+                                 self._context)
 
-        for idx, route in enumerate(improved.routes):
-            improved.routes[idx] = self._improve(route, self._route_operators)
+        improved.routes = self._improve_routes(improved.routes)
 
         assert improved.objective() <= current.objective()
         return improved
 
+    def save_bits(self, solution: Solution) -> Dict[str, List[int]]:
+        """
+        Returns the customers whose don't-look bits are set for the passed-in
+        solution, by operator. See ``OperatorContext.save_bits``.
+        """
+        return self._context.save_bits(solution)
+
+    def restore_bits(self, solution: Solution, saved: Dict[str, List[int]]):
+        """
+        Sets the saved don't-look bits (see ``save_bits``) again, for the
+        passed-in solution.
+        """
+        self._context.restore_bits(solution, saved)
+
+    def _improve_routes(self, routes):
+        improve = partial(_improve_route,
+                          operators=self._route_operators,
+                          record=self._statistics is not None)
+
+        improved = []
+
+        for route, (new_route, statistics) in \
+                zip(routes, self._context.executor.map(improve, routes)):
+            if statistics is not None:
+                self._statistics.merge(statistics)
+
+            # Unchanged routes are kept as-is, along with their versions, so
+            # the moves and don't-look bits that depend on them remain valid.
+            improved.append(route if new_route is None else new_route)
+
+        return improved
+
     @staticmethod
-    def _improve(entity, operators):
+    def _improve(entity,
+                 operators,
+                 statistics: Optional[OperatorStatistics] = None,
+                 *args):
         """
         Generic local search procedure. Improves the passed-in entity using
-        the given routes.
+        the given operators, which are called with the entity and any further
+        arguments.
         """
         while True:
             for operator in operators:
-                new_entity = operator(entity)
+                start = time.perf_counter()
+                new_entity = operator(entity, *args)
+
+                if statistics is not None:
+                    _record(statistics,
+                            operator.__name__,
+                            time.perf_counter() - start,
+                            entity.cost() - new_entity.cost())
 
                 if new_entity.cost() < entity.cost():
                     entity = new_entity
                     break
             else:
                 return entity
+
+
+def _improve_route(route: Route, operators, record: bool):
+    """
+    Improves the passed-in route using the given route operators, possibly in
+    a worker process. Returns the improved route, or None if the route did
+    not improve. Also returns the statistics of the operator calls if record
+    is set, as statistics recorded in a worker process are otherwise lost.
+    """
+    statistics = OperatorStatistics() if record else None
+    improved = LocalSearch._improve(route, operators, statistics)
+
+    return (None if improved is route else improved), statistics
+
+
+def _record(statistics: OperatorStatistics,
+            operator: str,
+            run_time: float,
+            improvement: float):
+    outcome = "better" if improvement > 0 else "rejected"
+
+    statistics.record_call("local search", operator, run_time)
+    statistics.record_outcome("local search", operator, outcome, improvement)
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from heuristic.classes import Solution
+from .Executor import Executor, Move, Scan
+
+Pair = Tuple[int, int]  # route indices
+PairMove = Tuple[float, Pair, Any]  # proposed cost, route indices, and move
+
+
+class MoveCache:
+    __slots__ = ['_moves']
+
+    # Best move between each pair of routes, keyed by the versions of those
+    # routes. See also Route.version.
+    _moves: Dict[Tuple[int, int], Optional[Move]]
+
+    def __init__(self):
+        """
+        Cache of the best move between pairs of routes, for a solution operator
+        that scans pairs of routes. A move between two routes depends only on
+        those routes, so it remains valid for as long as neither route changes.
+        After a move, only the pairs involving the changed routes need to be
+        scanned again.
+
+        Moves are (proposed cost, move) tuples. The proposed cost is the total
+        cost of the two routes after the move, and moves are ranked by it, as
+        the operators did before moves were cached. Only improving moves, with
+        a proposed cost below the current cost of the two routes, are cached.
+        The move itself should be small, e.g. a tuple of customer indices from
+        which the operator can redo the move, rather than the new routes.
+
+        The cache is kept in the operator context, see ``OperatorContext``.
+        Only the moves of the route pairs in the most recently scanned solution
+        are kept, so the cache does not grow beyond the number of route pairs.
+        """
+        self._moves = {}
+
+    def best_move(self,
+                  func: Scan,
+                  solution: Solution,
+                  pairs: List[Pair],
+                  executor: Executor) -> Optional[PairMove]:
+        """
+        Returns the best move between the passed-in pairs of route indices, as
+        a (proposed cost, pair, move) tuple, or None if there is no improving
+        move. Of moves with equal proposed cost, the move of the earliest pair
+        is returned. Only the pairs that are not yet cached are scanned, using
+        func and the passed-in executor (see ``Executor.scan``).
+        """
+        keys = [(solution.routes[idx1].version, solution.routes[idx2].version)
+                for idx1, idx2 in pairs]
+
+        moves = {key: self._moves[key] for key in keys if key in self._moves}
+        missing = [(pair, key) for pair, key in zip(pairs, keys)
+                   if key not in moves]
+
+        if missing:
+            tasks, new_keys = zip(*missing)
+            new_moves = executor.scan(func, solution, list(tasks))
+            moves.update(zip(new_keys, new_moves))
+
+        self._moves = moves
+        best = None
+
+        for pair, key in zip(pairs, keys):
+            move = moves[key]
+
+            if move is not None and (best is None or move[0] < best[0]):
+                best = move[0], pair, move[1]
+
+        return best
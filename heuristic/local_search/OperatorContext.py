@@ -0,0 +1,114 @@
+from collections import defaultdict
+from typing import DefaultDict, Dict, Hashable, List, Optional
+
+from heuristic.classes import Problem, Solution
+from heuristic.constants import RELOCATE_NEIGHBOURS
+from .DontLookBits import DontLookBits
+from .Executor import Executor
+from .MoveCache import MoveCache
+
+
+class OperatorContext:
+    __slots__ = ['executor', 'first_improvement', 'neighbours', '_problem',
+                 '_caches', '_bits']
+
+    executor: Executor
+    first_improvement: bool
+    neighbours: Optional[int]
+
+    # Problem instance of the cached moves and don't-look bits, see clear.
+    _problem: Optional[Problem]
+
+    _caches: DefaultDict[Hashable, MoveCache]
+    _bits: DefaultDict[str, DontLookBits]
+
+    def __init__(self,
+                 executor: Optional[Executor] = None,
+                 first_improvement: bool = False,
+                 neighbours: Optional[int] = RELOCATE_NEIGHBOURS):
+        """
+        Context of the solution operators, which the local search passes to
+        each operator call. The operators scan their neighbourhoods using the
+        executor, which might distribute the scans over worker processes. The
+        moves they found, and their don't-look bits, are kept in this context,
+        so they can be re-used by later calls. These are cleared when another
+        problem instance is loaded.
+
+        Parameters
+        ----------
+        executor
+            Executor for the neighbourhood scans. Default None, which scans in
+            this process.
+        first_improvement
+            Whether the operators perform the first improving move they find,
+            rather than the best. First improvement is faster, but less
+            thorough: it skips customers whose neighbourhood did not change
+            (see ``DontLookBits``), and scans in this process only. Default
+            False.
+        neighbours
+            Number of nearest customers next to which relocate_customer
+            considers inserting a customer (a granular neighbourhood), or None
+            to consider all insertion points. Default ``RELOCATE_NEIGHBOURS``.
+        """
+        self.executor = Executor() if executor is None else executor
+        self.first_improvement = first_improvement
+        self.neighbours = neighbours
+
+        self._problem = None
+        self._caches = defaultdict(MoveCache)
+        self._bits = defaultdict(DontLookBits)
+
+    def move_cache(self, key: Hashable) -> MoveCache:
+        """
+        Returns the move cache of the operator with the passed-in key,
+        typically the name of the operator's module. See ``MoveCache``.
+        """
+        self._check_problem()
+        return self._caches[key]
+
+    def dont_look_bits(self, name: str) -> DontLookBits:
+        """
+        Returns the don't-look bits of the operator with the passed-in name,
+        typically the name of the operator's module. See ``DontLookBits``.
+        """
+        self._check_problem()
+        return self._bits[name]
+
+    def save_bits(self, solution: Solution) -> Dict[str, List[int]]:
+        """
+        Returns the customers whose bit is set for the passed-in solution, for
+        each operator's don't-look bits. See ``DontLookBits.set_customers``,
+        and ``restore_bits``.
+        """
+        self._check_problem()
+
+        return {name: bits.set_customers(solution)
+                for name, bits in self._bits.items()}
+
+    def restore_bits(self, solution: Solution, saved: Dict[str, List[int]]):
+        """
+        Sets the bits of the saved customers (see ``save_bits``) again, for the
+        passed-in solution.
+        """
+        for name, customers in saved.items():
+            bits = self.dont_look_bits(name)
+
+            for customer in customers:
+                bits.set(solution, customer)
+
+    def clear(self):
+        """
+        Clears the cached moves and don't-look bits of all operators.
+        """
+        self._caches.clear()
+        self._bits.clear()
+
+    def _check_problem(self):
+        # The cached moves and don't-look bits refer to the customers of the
+        # problem instance they were found for, so they are cleared when
+        # another instance is loaded.
+        problem = Problem()
+
+        if problem is not self._problem:
+            self.clear()
+            self._problem = problem
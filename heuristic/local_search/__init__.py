@@ -1,11 +1,14 @@
 from typing import Callable, List
 
 from heuristic.classes import Route, Solution
+from .Executor import Executor
 from .LocalSearch import LocalSearch
+from .OperatorContext import OperatorContext
 from .cross_customer_exchange import cross_customer_exchange
 from .exchange_customer import exchange_customer
 from .in_route_two_opt import in_route_two_opt
 from .item_reinsert import item_reinsert
+from .or_opt import or_opt
 from .pickup_push_to_front import pickup_push_to_front
 from .relocate_customer import relocate_customer
 
@@ -13,6 +16,7 @@ SOLUTION_OPERATORS: List[Callable[[Solution], Solution]] = [
     relocate_customer,
     exchange_customer,
     cross_customer_exchange,
+    or_opt,
 ]
 
 ROUTE_OPERATORS: List[Callable[[Route], Route]] = [
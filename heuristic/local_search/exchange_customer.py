@@ -1,19 +1,27 @@
 from copy import copy, deepcopy
-from itertools import product
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from heuristic.classes import Heap, Route, Solution
 from heuristic.constants import DEPOT
 from heuristic.functions import remove_empty_routes, routing_costs
+from .DontLookBits import DontLookBits
+from .Executor import Move
+from .MoveCache import PairMove
+from .OperatorContext import OperatorContext
 
 
 @remove_empty_routes
-def exchange_customer(solution: Solution) -> Solution:
+def exchange_customer(solution: Solution,
+                      context: Optional[OperatorContext] = None) -> Solution:
     """
     Performs exchange moves between two customers. Of all such moves, the best
     is performed and the updated solution is returned. O(n^2), where n is the
-    number of customers.
+    number of customers. Moves between routes that have not changed since the
+    last call are taken from a cache, see ``MoveCache``. With first
+    improvement, the first improving move is performed instead. The other
+    moves are scanned using the context's executor.
 
     Similar to exchange in Hornstra et al. (2020).
 
@@ -23,51 +31,131 @@ def exchange_customer(solution: Solution) -> Solution:
       Windows: Minimizing Route Duration." *ORSA Journal on Computing* 4 (2):
       146-154.
     """
-    improvements = Heap()
+    if context is None:
+        context = OperatorContext()
+
+    if context.first_improvement:
+        best = _first_move(solution, context.dont_look_bits(__name__))
+    else:
+        tasks = [(idx1, idx2)
+                 for idx1 in range(len(solution.routes))
+                 for idx2 in range(idx1 + 1, len(solution.routes))]
+
+        cache = context.move_cache(__name__)
+        best = cache.best_move(_best_moves, solution, tasks, context.executor)
+
+    if best is not None:
+        _, (idx1, idx2), (idx_cust1, idx_cust2) = best
+
+        solution = copy(solution)
+        solution.routes[idx1], solution.routes[idx2] = _exchange(
+            solution.routes[idx1], idx_cust1, solution.routes[idx2], idx_cust2)
+
+    return solution
+
+
+def _best_moves(solution: Solution,
+                tasks: List[Tuple[int, int]]) -> List[Optional[Move]]:
+    """
+    Finds the best move between each pair of routes in the passed-in tasks,
+    which are (route index, route index) tuples.
+    """
+    moves = []
+    costs = routing_costs(solution)
+
+    for idx1, idx2 in tasks:
+        improvements = Heap()
+
+        route1 = solution.routes[idx1]
+        route2 = solution.routes[idx2]
+
+        for idx_cust1 in range(len(route1)):
+            for proposed, move in _moves(costs, route1, idx_cust1, route2):
+                improvements.push(proposed, move)
+
+        moves.append(improvements.pop() if len(improvements) != 0 else None)
+
+    return moves
+
+
+def _first_move(solution: Solution,
+                dont_look: DontLookBits) -> Optional[PairMove]:
+    """
+    Finds the first improving exchange move, as a (proposed cost, route
+    indices, move) tuple, skipping customers whose don't-look bit is set.
+    """
     costs = routing_costs(solution)
 
     for idx1, route1 in enumerate(solution.routes):
-        for idx2, route2 in enumerate(solution.routes[idx1 + 1:], idx1 + 1):
-            iterable = product(range(len(route1)), range(len(route2)))
+        for idx_cust1, customer in enumerate(route1):
+            if dont_look.is_set(solution, customer):
+                continue
 
-            for idx_cust1, idx_cust2 in iterable:
-                if _gain(costs, route1, idx_cust1, route2, idx_cust2) >= 0:
-                    continue
+            for idx2 in range(idx1 + 1, len(solution.routes)):
+                route2 = solution.routes[idx2]
 
-                new_route1 = deepcopy(route1)
-                new_route2 = deepcopy(route2)
+                for proposed, move in _moves(costs, route1, idx_cust1, route2):
+                    return proposed, (idx1, idx2), move
 
-                customer1 = route1.customers[idx_cust1]
-                customer2 = route2.customers[idx_cust2]
+            dont_look.set(solution, customer)
 
-                new_route1.remove_customer(customer1)
-                new_route2.remove_customer(customer2)
+    return None
 
-                if not new_route1.can_insert(customer2, idx_cust1):
-                    continue
 
-                if not new_route2.can_insert(customer1, idx_cust2):
-                    continue
+def _moves(costs: np.ndarray,
+           route1: Route,
+           idx_cust1: int,
+           route2: Route) -> Iterator[Tuple[float, Tuple[int, int]]]:
+    """
+    Yields the improving exchanges of the customer at idx_cust1 in the first
+    route with the customers of the second route, as (proposed cost, customer
+    indices) tuples.
+    """
+    current = route1.cost() + route2.cost()
 
-                new_route1.insert_customer(customer2, idx_cust1)
-                new_route2.insert_customer(customer1, idx_cust2)
+    for idx_cust2 in range(len(route2)):
+        if _gain(costs, route1, idx_cust1, route2, idx_cust2) >= 0:
+            continue
 
-                current = route1.cost() + route2.cost()
-                proposed = new_route1.cost() + new_route2.cost()
+        new_routes = _exchange(route1, idx_cust1, route2, idx_cust2)
 
-                if proposed < current:
-                    improvements.push(proposed,
-                                      (idx1, new_route1, idx2, new_route2))
+        if new_routes is None:
+            continue
 
-    if len(improvements) != 0:
-        _, (idx1, new_route1, idx2, new_route2) = improvements.pop()
+        proposed = new_routes[0].cost() + new_routes[1].cost()
 
-        solution = copy(solution)
+        if proposed < current:
+            yield proposed, (idx_cust1, idx_cust2)
 
-        solution.routes[idx1] = new_route1
-        solution.routes[idx2] = new_route2
 
-    return solution
+def _exchange(route1: Route,
+              idx_cust1: int,
+              route2: Route,
+              idx_cust2: int) -> Optional[Tuple[Route, Route]]:
+    """
+    Exchanges the customer at idx_cust1 in the first route with the customer
+    at idx_cust2 in the second. Returns the new routes, or None if the
+    exchange is not feasible. The passed-in routes are not changed.
+    """
+    new_route1 = deepcopy(route1)
+    new_route2 = deepcopy(route2)
+
+    customer1 = route1.customers[idx_cust1]
+    customer2 = route2.customers[idx_cust2]
+
+    new_route1.remove_customer(customer1)
+    new_route2.remove_customer(customer2)
+
+    if not new_route1.can_insert(customer2, idx_cust1):
+        return None
+
+    if not new_route2.can_insert(customer1, idx_cust2):
+        return None
+
+    new_route1.insert_customer(customer2, idx_cust1)
+    new_route2.insert_customer(customer1, idx_cust2)
+
+    return new_route1, new_route2
 
 
 def _gain(costs: np.ndarray,
@@ -1,48 +1,291 @@
+from typing import List, Optional, Tuple
+
 import numpy as np
 
-from heuristic.classes import Heap, Problem, Route, Stacks
+from heuristic.classes import Problem, Route, Stacks
 from heuristic.constants import DEPOT
 
 
 def in_route_two_opt(route: Route) -> Route:
     """
-    Performs the best in-route two-opt swap, based on routing costs.
+    Performs the best in-route two-opt swap, based on routing and handling
+    costs. Of all swaps that improve the routing costs, the best feasible swap
+    is returned, or the passed-in route if there is none.
+
+    Swaps are evaluated in increasing order of routing costs, until the
+    routing costs alone exceed the cost of the best swap found. The route of a
+    swap is that of appending its customers one at a time, and its handling
+    costs are determined from a summary of its loading plan (see ``_Plan``),
+    without constructing the route. The plans of the customers before the
+    reversed segment are the same for many swaps, and are computed only once.
+    When the plan after the reversed segment is that of the original tour,
+    the handling costs of the remaining customers follow in O(1), and the swap
+    is evaluated in O(segment). Otherwise the remaining customers are
+    appended as well, until the swap is no longer better than the best found.
+    Only the route of the best swap is actually constructed.
 
     Intra 2-opt in Hornstra et al. (2020).
     """
-    problem = Problem()
+    tour = [DEPOT] + route.customers.to_list()
+    candidates = _candidates(tour, route.routing_cost())
+
+    if len(candidates) == 0:
+        return route
+
+    plans = _Plans(tour)
+
+    best_cost = route.cost()
+    best = None
+
+    for candidate_cost, first, second in candidates:
+        if candidate_cost >= best_cost:
+            # Handling costs are non-negative, so the routing costs of this
+            # swap (and all later swaps) are a lower bound on their costs.
+            break
+
+        handling_cost = plans.handling_cost(first,
+                                            second,
+                                            best_cost - candidate_cost)
+
+        if handling_cost is not None:
+            best_cost = candidate_cost + handling_cost
+            best = first, second
+
+    if best is None:
+        return route
+
+    first, second = best
+    new_route = Route([], [Stacks(Problem().num_stacks)])
+    new_tour = tour[1:first] + tour[second - 1:first - 1:-1] + tour[second:]
+
+    if new_route.attempt_append_tail(new_tour) \
+            and new_route.cost() < route.cost():
+        return new_route
+
+    return route
+
+
+class _Plan:
+    __slots__ = ['deliveries', 'pickups', 'max_loads', 'legs', 'volume',
+                 'stack']
+
+    deliveries: List[float]  # delivery volume in each stack, at the depot
+    pickups: List[float]  # pickup volume in each stack, at the last customer
+    max_loads: List[float]  # maximum load of each stack, over all legs
+    legs: List[int]  # number of legs at which each stack is unloaded
+    volume: float  # total volume moved
+    stack: Optional[int]  # delivery stack of the last customer
+
+    def __init__(self, num_stacks: int):
+        """
+        Summary of the loading plan of a route that is constructed by
+        appending customers one at a time, as ``Route.attempt_append_tail``
+        does. Each customer's delivery item is pushed into the rear of the
+        stack with the least delivery volume, and its pickup item into the
+        rear of the stack with the least pickup volume. At each customer, the
+        delivery items of later customers are moved out of these two stacks,
+        and put back. So each delivery item is moved once for each earlier leg
+        at which its stack was unloaded, which gives the handling costs.
+        """
+        self.deliveries = [0.] * num_stacks
+        self.pickups = [0.] * num_stacks
+        self.max_loads = [0.] * num_stacks
+        self.legs = [0] * num_stacks
+        self.volume = 0.
+        self.stack = None
+
+    def __copy__(self):
+        plan = _Plan(0)
+
+        plan.deliveries = self.deliveries.copy()
+        plan.pickups = self.pickups.copy()
+        plan.max_loads = self.max_loads.copy()
+        plan.legs = self.legs.copy()
+        plan.volume = self.volume
+        plan.stack = self.stack
+
+        return plan
+
+    def __eq__(self, other: "_Plan") -> bool:
+        """
+        Tests if the loads of both plans are the same, in which case appending
+        the same customers to either has the same effect. O(stacks).
+        """
+        return self.deliveries == other.deliveries \
+            and self.pickups == other.pickups \
+            and self.max_loads == other.max_loads
+
+    def append(self, delivery: float, pickup: float, capacity: float) -> bool:
+        """
+        Appends a customer with the passed-in delivery and pickup volumes, if
+        these fit in their stacks (see ``Route.can_insert``). Returns whether
+        the customer was appended. O(stacks).
+        """
+        deliveries, pickups = self.deliveries, self.pickups
+
+        stack = deliveries.index(min(deliveries))
+
+        # The delivery item is carried on all legs up to the customer, so it
+        # must fit on each of these.
+        if self.max_loads[stack] + delivery > capacity:
+            return False
+
+        pickup_stack = pickups.index(min(pickups))
+
+        if pickups[pickup_stack] + pickup > capacity:
+            return False
+
+        self.volume += delivery * self.legs[stack]
+
+        deliveries[stack] += delivery
+        pickups[pickup_stack] += pickup
 
-    tour = np.array([DEPOT] + route.customers.to_list())
+        self.max_loads[stack] += delivery
+        self.max_loads = [max(load, volume) for load, volume
+                          in zip(self.max_loads, pickups)]
 
-    feasible_moves = Heap()
-    feasible_moves.push(route.cost(), route)
+        self.legs[stack] += 1
 
-    for first in range(1, len(route)):
-        for second in range(first + 1, len(route)):
-            if _gain(tour, first, second) >= 0:
-                continue  # this is not a better move.
+        if pickup_stack != stack:
+            self.legs[pickup_stack] += 1
 
-            # This is a better route than the one we have currently. Of course
-            # that does not mean we can find a good handling configuration as
-            # well, so we attempt to create a route for this 2-opt move and skip
-            # if it is infeasible.
-            tour[first:second] = tour[second - 1:first - 1:-1]
-            new_route = Route([], [Stacks(problem.num_stacks)])
+        self.stack = stack
+        return True
 
-            if new_route.attempt_append_tail(tour[1:]):
-                feasible_moves.push(new_route.cost(), new_route)
 
-    _, best_route = feasible_moves.pop()
-    return best_route
+class _Plans:
+    __slots__ = ['_tour', '_deliveries', '_pickups', '_capacity',
+                 '_handling_cost', '_plans', '_weights']
 
+    def __init__(self, tour: List[int]):
+        """
+        Loading plans of the first customers of the passed-in tour, from which
+        the handling costs of two-opt swaps of this tour are determined. See
+        ``handling_cost``.
+        """
+        problem = Problem()
+
+        # Delivery and pickup volumes of the tour's customers, by index.
+        ids = 2 * np.array(tour[1:], dtype=int)
+
+        self._tour = tour
+        self._deliveries = [0.] + problem.volumes[ids].tolist()
+        self._pickups = [0.] + problem.volumes[ids + 1].tolist()
+
+        self._capacity = problem.stack_capacity
+        self._handling_cost = problem.handling_cost
+
+        # Plans of the first customers of the tour, up to the first customer
+        # that does not fit.
+        self._plans = [_Plan(problem.num_stacks)]
+
+        for idx in range(1, len(tour)):
+            plan = self._plans[-1].__copy__()
+
+            if not self._append(plan, idx):
+                break
+
+            self._plans.append(plan)
+
+        # Delivery volume of each stack, of the customers from each index
+        # onwards. Only needed when all customers fit.
+        self._weights = [[0.] * problem.num_stacks]
+
+        if len(self._plans) == len(tour):
+            for idx in range(len(tour) - 1, 0, -1):
+                weights = self._weights[-1].copy()
+                weights[self._plans[idx].stack] += self._deliveries[idx]
+                self._weights.append(weights)
+
+            self._weights.reverse()  # first entry is that of the depot.
+
+    def handling_cost(self,
+                      first: int,
+                      second: int,
+                      bound: float) -> Optional[float]:
+        """
+        Returns the handling costs of the route of the two-opt swap that
+        reverses the customers from first up to second, or None if that route
+        is infeasible, or its handling costs are not below the passed-in
+        bound. O(second - first) when the plan after the reversed segment is
+        that of the tour, and O(n - first) otherwise, where n is the length
+        of the tour.
+        """
+        if first - 1 >= len(self._plans):  # customers before first do not fit
+            return None
+
+        plan = self._plans[first - 1].__copy__()
+
+        for idx in range(second - 1, first - 1, -1):
+            if not self._append(plan, idx):
+                return None
+
+        if second - 1 < len(self._plans) and plan == self._plans[second - 1]:
+            if len(self._plans) != len(self._tour):
+                # The remaining customers are appended exactly as for the
+                # tour, which does not fit.
+                return None
+
+            # The remaining customers are in the same stacks as for the tour,
+            # but the number of legs at which those stacks are unloaded may
+            # differ.
+            tour_plan = self._plans[second - 1]
+            volume = plan.volume + self._plans[-1].volume - tour_plan.volume
+            volume += sum((legs - tour_legs) * weight
+                          for legs, tour_legs, weight
+                          in zip(plan.legs, tour_plan.legs,
+                                 self._weights[second]))
+
+            cost = self._handling_cost * volume
+            return cost if cost < bound else None
+
+        for idx in range(second, len(self._tour)):
+            if not self._append(plan, idx):
+                return None
+
+            if self._handling_cost * plan.volume >= bound:
+                # Appending customers only adds to the handling costs.
+                return None
+
+        cost = self._handling_cost * plan.volume
+        return cost if cost < bound else None
+
+    def _append(self, plan: _Plan, idx: int) -> bool:
+        return plan.append(self._deliveries[idx],
+                           self._pickups[idx],
+                           self._capacity)
+
+
+def _candidates(tour: List[int],
+                routing_cost: float) -> List[Tuple[float, int, int]]:
+    """
+    Returns the two-opt swaps of the passed-in tour that improve its routing
+    costs, as (routing cost, first, second) tuples, in increasing order. The
+    gains of all swaps are computed at once, using NumPy.
+    """
+    distances = Problem().distances
+    nodes = np.array(tour) + 1
+
+    # Swaps reverse the customers from first up to second. Reversing a single
+    # customer does not change the tour, but its gain might be negative due
+    # to rounding, so such swaps are left out.
+    first, second = np.triu_indices(len(tour) - 1, k=2)
+    first, second = first[first >= 1], second[first >= 1]
 
-def _gain(tour: np.ndarray, first: int, second: int) -> float:
     # Proposed changes.
-    gain = Route.distance([tour[first - 1], tour[second - 1]])
-    gain += Route.distance([tour[first], tour[second]])
+    gains = distances[nodes[first - 1], nodes[second - 1]]
+    gains += distances[nodes[first], nodes[second]]
 
     # Current situation.
-    gain -= Route.distance([tour[first - 1], tour[first]])
-    gain -= Route.distance([tour[second - 1], tour[second]])
+    gains -= distances[nodes[first - 1], nodes[first]]
+    gains -= distances[nodes[second - 1], nodes[second]]
+
+    improving = gains < 0
+    costs = routing_cost + gains[improving]
+    first, second = first[improving], second[improving]
+
+    order = np.lexsort((second, first, costs))
 
-    return gain
+    return list(zip(costs[order].tolist(),
+                    first[order].tolist(),
+                    second[order].tolist()))
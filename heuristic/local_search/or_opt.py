@@ -0,0 +1,253 @@
+from copy import copy, deepcopy
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from heuristic.classes import Problem, Route, Solution
+from heuristic.constants import DEPOT, SEGMENT_LENGTHS
+from heuristic.functions import remove_empty_routes
+from .DontLookBits import DontLookBits
+from .Executor import Move
+from .MoveCache import PairMove
+from .OperatorContext import OperatorContext
+
+# Candidate segment moves, as (routing cost change, segment start, segment
+# length, insertion index) tuples.
+Candidate = Tuple[float, int, int, int]
+
+
+@remove_empty_routes
+def or_opt(solution: Solution,
+           context: Optional[OperatorContext] = None) -> Solution:
+    """
+    Moves a segment of consecutive customers (see ``SEGMENT_LENGTHS``) from
+    one route into another, keeping their order. The moves are evaluated in
+    increasing order of routing costs, and the first that improves the total
+    (routing and handling) costs is performed. O(n^2), where n is the number
+    of customers.
+
+    The routing costs and vehicle loads of a move are determined in O(1),
+    from the costs of the segment's links, and the aggregated delivery and
+    pickup volumes of the segment and the legs of the other route. Only
+    moves that fit in the vehicle on every leg are actually performed, to
+    determine their handling costs. The moves between each pair of routes are
+    cached, see ``MoveCache``, and scanned using the context's executor. With
+    first improvement, the first improving move of a segment is performed
+    instead.
+
+    References
+    ----------
+    - Or, Ilhan. 1976. "Traveling Salesman-Type Combinatorial Problems and
+      Their Relation to the Logistics of Regional Blood Banking." PhD thesis,
+      Northwestern University.
+    """
+    if context is None:
+        context = OperatorContext()
+
+    if context.first_improvement:
+        best = _first_move(solution, context.dont_look_bits(__name__))
+    else:
+        tasks = [(idx1, idx2)
+                 for idx1 in range(len(solution.routes))
+                 for idx2 in range(len(solution.routes))
+                 if idx1 != idx2]
+
+        cache = context.move_cache(__name__)
+        best = cache.best_move(_best_moves, solution, tasks, context.executor)
+
+    if best is not None:
+        _, (idx1, idx2), (start, length, at) = best
+
+        solution = copy(solution)
+        solution.routes[idx1], solution.routes[idx2] = _move_segment(
+            solution.routes[idx1], solution.routes[idx2], start, length, at)
+
+    return solution
+
+
+def _best_moves(solution: Solution,
+                tasks: List[Tuple[int, int]]) -> List[Optional[Move]]:
+    """
+    Finds the move of a segment of the first route into the second, for each
+    pair of routes in the passed-in tasks, which are (route index, route
+    index) tuples.
+    """
+    moves = []
+
+    for idx1, idx2 in tasks:
+        route1 = solution.routes[idx1]
+        route2 = solution.routes[idx2]
+
+        candidates = _candidates(route1, route2, range(len(route1)))
+        moves.append(_move(route1, route2, candidates))
+
+    return moves
+
+
+def _first_move(solution: Solution,
+                dont_look: DontLookBits) -> Optional[PairMove]:
+    """
+    Finds the move of the first segment with an improving move, as a (proposed
+    cost, route indices, move) tuple, skipping segments whose first
+    customer's don't-look bit is set.
+    """
+    for idx1, route1 in enumerate(solution.routes):
+        for start, customer in enumerate(route1):
+            if dont_look.is_set(solution, customer):
+                continue
+
+            for idx2, route2 in enumerate(solution.routes):
+                if idx1 == idx2:
+                    continue
+
+                candidates = _candidates(route1, route2, [start])
+                move = _move(route1, route2, candidates)
+
+                if move is not None:
+                    return move[0], (idx1, idx2), move[1]
+
+            dont_look.set(solution, customer)
+
+    return None
+
+
+def _candidates(route1: Route,
+                route2: Route,
+                starts: Iterable[int]) -> List[Candidate]:
+    """
+    Returns the moves of the segments of the first route starting at the
+    passed-in indices into the second route, that improve the routing costs
+    and fit in the vehicle. These are sorted by routing cost change. O(1) for
+    each move.
+    """
+    problem = Problem()
+    distances = problem.distances
+
+    tour1 = [DEPOT] + route1.customers.to_list() + [DEPOT]
+    tour2 = [DEPOT] + route2.customers.to_list() + [DEPOT]
+
+    # The vehicle load on each leg of the second route, and the maximum of
+    # these loads over the legs up to and from each leg.
+    loads = _loads(route2.customers.to_list())
+    prefix_max = list(accumulate(loads, max))
+    suffix_max = list(accumulate(reversed(loads), max))[::-1]
+
+    candidates = []
+
+    for start in starts:
+        for length in SEGMENT_LENGTHS:
+            if start + length > len(route1):
+                continue
+
+            first, last = tour1[start + 1], tour1[start + length]
+            prev, succ = tour1[start], tour1[start + length + 1]
+
+            removal = distances[prev + 1, succ + 1] \
+                - distances[prev + 1, first + 1] \
+                - distances[last + 1, succ + 1]
+
+            segment = tour1[start + 1:start + length + 1]
+            deliveries = [problem.demands[customer].volume
+                          for customer in segment]
+            pickups = [problem.pickups[customer].volume
+                       for customer in segment]
+
+            delivery, pickup = sum(deliveries), sum(pickups)
+
+            # Largest load increase on the legs within the segment, relative
+            # to the load on the leg into the segment.
+            peak = max((sum(pickups[:idx]) - sum(deliveries[:idx])
+                        for idx in range(1, length)), default=0.)
+
+            for at in range(len(route2) + 1):
+                before, after = tour2[at], tour2[at + 1]
+
+                change = removal + distances[before + 1, first + 1] \
+                    + distances[last + 1, after + 1] \
+                    - distances[before + 1, after + 1]
+
+                if change >= 0:
+                    continue
+
+                if prefix_max[at] + delivery > problem.capacity \
+                        or loads[at] + delivery + peak > problem.capacity \
+                        or suffix_max[at] + pickup > problem.capacity:
+                    continue
+
+                candidates.append((change, start, length, at))
+
+    candidates.sort()
+    return candidates
+
+
+def _move(route1: Route,
+          route2: Route,
+          candidates: List[Candidate]) -> Optional[Move]:
+    """
+    Performs the candidate moves on copies of the two routes, in order, and
+    returns the first that is feasible and improving, as a (proposed cost,
+    (segment start, segment length, insertion index)) tuple. Returns None if
+    there is no such move.
+    """
+    current = route1.cost() + route2.cost()
+
+    for _, start, length, at in candidates:
+        new_routes = _move_segment(route1, route2, start, length, at)
+
+        if new_routes is None:
+            continue
+
+        proposed = new_routes[0].cost() + new_routes[1].cost()
+
+        if proposed < current:
+            return proposed, (start, length, at)
+
+    return None
+
+
+def _move_segment(route1: Route,
+                  route2: Route,
+                  start: int,
+                  length: int,
+                  at: int) -> Optional[Tuple[Route, Route]]:
+    """
+    Moves the segment of the given length starting at start in the first
+    route into the second, at the passed-in insertion index. Returns the new
+    routes, or None if the move is not feasible. The passed-in routes are not
+    changed.
+    """
+    segment = route1.customers[start:start + length]
+
+    new_route1 = deepcopy(route1)
+    new_route2 = deepcopy(route2)
+
+    for customer in segment:
+        new_route1.remove_customer(customer)
+
+    for idx, customer in enumerate(segment, at):
+        if not new_route2.can_insert(customer, idx):
+            return None
+
+        new_route2.insert_customer(customer, idx)
+
+    return new_route1, new_route2
+
+
+def _loads(customers: List[int]) -> List[float]:
+    """
+    Returns the vehicle load on each leg of a route visiting the passed-in
+    customers: the deliveries of the customers still to be visited, and the
+    pickups of those already visited.
+    """
+    volumes = Problem().volumes
+    ids = 2 * np.array(customers, dtype=int)  # of the delivery items
+
+    deliveries = volumes[ids].tolist()
+    pickups = volumes[ids + 1].tolist()
+
+    remaining = list(accumulate(reversed(deliveries)))[::-1] + [0.]
+    collected = [0.] + list(accumulate(pickups))
+
+    return [delivery + pickup
+            for delivery, pickup in zip(remaining, collected)]
@@ -1,19 +1,37 @@
 from copy import copy, deepcopy
+from functools import partial
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 
-from heuristic.classes import Heap, Route, Solution
+from heuristic.classes import Heap, Problem, Route, Solution
 from heuristic.constants import DEPOT
 from heuristic.functions import remove_empty_routes, routing_costs
+from .DontLookBits import DontLookBits
+from .Executor import Move
+from .MoveCache import PairMove
+from .OperatorContext import OperatorContext
 
 
 @remove_empty_routes
-def relocate_customer(solution: Solution) -> Solution:
+def relocate_customer(solution: Solution,
+                      context: Optional[OperatorContext] = None) -> Solution:
     """
     Performs the best customer relocation move, based on routing costs. Of all
     such moves, the best is performed and the updated solution is returned.
     O(n^2), where n is the number of customers.
 
+    When the context's number of neighbours k is set, customers are only
+    inserted next to their k nearest customers (a granular neighbourhood).
+    This is O(nk), but might miss some improving moves. See
+    ``OperatorContext``.
+
+    The best move between each pair of routes is cached, so after a move only
+    the pairs involving the changed routes are scanned again. See
+    ``MoveCache``. With first improvement, the first improving move is
+    performed instead (see ``OperatorContext``). The route pairs are scanned
+    using the executor of the passed-in context, see ``OperatorContext``.
+
     Similar to reinsertion in Hornstra et al. (2020).
 
     References
@@ -21,50 +39,169 @@ def relocate_customer(solution: Solution) -> Solution:
     - Savelsbergh, Martin W. P. 1992. "The Vehicle Routing Problem with Time
       Windows: Minimizing Route Duration." *ORSA Journal on Computing* 4 (2):
       146-154.
+    - Toth, Paolo, and Daniele Vigo. 2003. "The Granular Tabu Search and Its
+      Application to the Vehicle-Routing Problem." *INFORMS Journal on
+      Computing* 15 (4): 333-346.
+    """
+    if context is None:
+        context = OperatorContext()
+
+    k = context.neighbours
+
+    if context.first_improvement:
+        best = _first_move(solution,
+                           context.dont_look_bits(__name__),
+                           k)
+    else:
+        tasks = [(idx_route, idx_next)
+                 for idx_route in range(len(solution.routes))
+                 for idx_next in range(idx_route, len(solution.routes))]
+
+        # Moves depend on the neighbourhood size k, so each k has its own
+        # cache.
+        cache = context.move_cache((__name__, k))
+        best = cache.best_move(partial(_best_moves, k=k),
+                               solution,
+                               tasks,
+                               context.executor)
+
+    if best is not None:
+        _, (idx_route, idx_next), (customer, insert_idx) = best
+
+        # The changed routes are copied, as they are shared with the passed-in
+        # solution.
+        solution = copy(solution)
+        route = deepcopy(solution.routes[idx_route])
+        solution.routes[idx_route] = route
+
+        if idx_next == idx_route:
+            next_route = route
+        else:
+            next_route = deepcopy(solution.routes[idx_next])
+            solution.routes[idx_next] = next_route
+
+        if route is next_route and route.indices[customer] < insert_idx:
+            # We re-insert into the same route, and the insert location will
+            # shift once we remove the customer. This accounts for that.
+            insert_idx -= 1
+
+        route.remove_customer(customer)
+        next_route.insert_customer(customer, insert_idx)
+
+    return solution
+
+
+def _best_moves(solution: Solution,
+                tasks: List[Tuple[int, int]],
+                k: Optional[int] = None) -> List[Optional[Move]]:
+    """
+    Finds the best relocation move between each pair of routes in the
+    passed-in tasks, which are (route index, route index) tuples. The
+    customers of the first route are moved into the second, next to their k
+    nearest customers if k is passed.
+    """
+    moves = []
+    costs = routing_costs(solution)
+
+    for idx_route, idx_next in tasks:
+        improvements = Heap()
+
+        curr_route = solution.routes[idx_route]
+        route = solution.routes[idx_next]
+
+        for customer in curr_route:
+            for proposed, idx in _moves(costs, curr_route, route, customer, k):
+                improvements.push(proposed, (customer, idx))
+
+        moves.append(improvements.pop() if len(improvements) != 0 else None)
+
+    return moves
+
+
+def _first_move(solution: Solution,
+                dont_look: DontLookBits,
+                k: Optional[int] = None) -> Optional[PairMove]:
+    """
+    Finds the first improving relocation move, as a (proposed cost, route
+    indices, move) tuple, skipping customers whose don't-look bit is set.
     """
-    improvements = Heap()
     costs = routing_costs(solution)
 
     for idx_route, curr_route in enumerate(solution.routes):
         for customer in curr_route:
-            for route in solution.routes[idx_route:]:
-                for idx in range(len(route) + 1):
-                    gain = _gain(costs, route, idx, customer)
+            if dont_look.is_set(solution, customer):
+                continue
 
-                    if gain >= 0 or not route.can_insert(customer, idx):
-                        # This is either infeasible, or not an improving move.
-                        continue
+            for idx_next in range(idx_route, len(solution.routes)):
+                route = solution.routes[idx_next]
 
-                    # The following performs the proposed move on a copy of the
-                    # two routes involved. If the move is an improvement, it is
-                    # added to the pool of improving moves.
-                    old_route = deepcopy(curr_route)
-                    new_route = deepcopy(route)
+                for proposed, idx in _moves(costs, curr_route, route, customer,
+                                            k):
+                    if route is curr_route \
+                            and idx - route.indices[customer] in (0, 1):
+                        continue  # this re-inserts at the same position.
 
-                    old_route.remove_customer(customer)
-                    new_route.insert_customer(customer, idx)
+                    return proposed, (idx_route, idx_next), (customer, idx)
 
-                    current = route.cost() + curr_route.cost()
-                    proposed = old_route.cost() + new_route.cost()
+            dont_look.set(solution, customer)
 
-                    if proposed < current:
-                        improvements.push(proposed, (customer, idx, route))
+    return None
 
-    if len(improvements) != 0:
-        _, (customer, insert_idx, next_route) = improvements.pop()
 
-        solution = copy(solution)
-        route = solution.find_route(customer)
+def _moves(costs: np.ndarray,
+           curr_route: Route,
+           route: Route,
+           customer: int,
+           k: Optional[int] = None) -> Iterator[Tuple[float, int]]:
+    """
+    Yields the improving moves of the customer from its current route into
+    the passed-in route, as (proposed cost, insertion index) tuples. The
+    customer is inserted next to its k nearest customers if k is passed.
+    """
+    if k is None:
+        insertions = range(len(route) + 1)
+    else:
+        insertions = _granular_insertions(route, customer, k)
 
-        if route is next_route and route.customers.index(customer) < insert_idx:
-            # We re-insert into the same route, and the insert location will
-            # shift once we remove the customer. This accounts for that.
-            insert_idx -= 1
+    for idx in insertions:
+        gain = _gain(costs, route, idx, customer)
 
-        route.remove_customer(customer)
-        next_route.insert_customer(customer, insert_idx)
+        if gain >= 0 or not route.can_insert(customer, idx):
+            # This is either infeasible, or not an improving move.
+            continue
 
-    return solution
+        # The following performs the proposed move on a copy of the two
+        # routes involved. If the move is an improvement, it is yielded.
+        old_route = deepcopy(curr_route)
+        new_route = deepcopy(route)
+
+        old_route.remove_customer(customer)
+        new_route.insert_customer(customer, idx)
+
+        current = route.cost() + curr_route.cost()
+        proposed = old_route.cost() + new_route.cost()
+
+        if proposed < current:
+            yield proposed, idx
+
+
+def _granular_insertions(route: Route, customer: int, k: int) -> List[int]:
+    """
+    Returns the insertion indices just before and after the customer's k
+    nearest customers in the passed-in route, in increasing order.
+    """
+    insertions = set()
+
+    # The nearest customer is usually, but not always (e.g. when customers
+    # share a location), the customer itself, so we skip that.
+    nearest = Problem().nearest_customers[customer, :k + 1]
+
+    for other in nearest[nearest != customer][:k]:
+        if other in route:
+            idx = route.indices[other]
+            insertions.update([idx, idx + 1])
+
+    return sorted(insertions)
 
 
 def _gain(costs: np.ndarray, route: Route, idx: int, customer: int) -> float:
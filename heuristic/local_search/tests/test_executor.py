@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from heuristic.classes import Problem
+from heuristic.functions import initial_solution
+from heuristic.local_search import Executor
+from heuristic.local_search.relocate_customer import _best_moves
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_scan_in_parallel_matches_serial():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    solution = initial_solution()
+    tasks = [(idx1, idx2)
+             for idx1 in range(len(solution.routes))
+             for idx2 in range(idx1, len(solution.routes))]
+
+    serial = Executor().scan(_best_moves, solution, tasks)
+
+    with Executor(2, min_routes=1) as executor:
+        parallel = executor.scan(_best_moves, solution, tasks)
+
+    assert len(serial) == len(tasks)
+    assert parallel == serial
+
+
+def test_scan_below_min_routes_is_serial():
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    solution = initial_solution()
+    tasks = [(0, 1)]
+
+    with Executor(2, min_routes=len(solution.routes) + 1) as executor:
+        assert executor.scan(_best_moves, solution, tasks) \
+            == _best_moves(solution, tasks)
+
+        # No worker processes are started for so small a solution.
+        assert executor._pool is None
@@ -0,0 +1,145 @@
+from copy import deepcopy
+from pathlib import Path
+from typing import Optional, Tuple
+
+from numpy.random import default_rng
+
+from heuristic.classes import Problem
+from heuristic.constants import (CRITERION, DECAY, DONT_LOOK_NEIGHBOURS,
+                                 WEIGHTS)
+from heuristic.destroy_operators import D_OPERATORS
+from heuristic.functions import initial_solution
+from heuristic.local_search import (LocalSearch, OperatorContext,
+                                    ROUTE_OPERATORS, SOLUTION_OPERATORS,
+                                    exchange_customer)
+from heuristic.local_search.DontLookBits import DontLookBits
+from heuristic.repair_operators import R_OPERATORS
+from heuristic.search import Checkpoint, Search
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_first_improvement_does_not_increase_costs():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    local_search = LocalSearch(first_improvement=True)
+
+    for op in SOLUTION_OPERATORS:
+        local_search.add_solution_operator(op)
+
+    for op in ROUTE_OPERATORS:
+        local_search.add_route_operator(op)
+
+    initial = initial_solution()
+    improved = local_search(initial)
+
+    assert improved.objective() <= initial.objective()
+    assert len(improved.unassigned) == 0
+    assert sorted(customer for route in improved.routes
+                  for customer in route) == list(range(len(initial.routes)))
+
+
+def test_bit_is_cleared_when_neighbouring_route_changes():
+    problem = Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+    solution = initial_solution()  # each customer has its own route.
+
+    bits = DontLookBits()
+    bits.set(solution, 0)
+
+    assert bits.is_set(solution, 0)
+
+    # Changes to routes that are not near the customer keep its bit set.
+    neighbours = problem.nearest_customers[0, :DONT_LOOK_NEIGHBOURS]
+    other = next(customer for customer in range(problem.num_customers)
+                 if customer not in neighbours)
+
+    solution.find_route(other).mark_changed()
+    assert bits.is_set(solution, 0)
+
+    neighbour = next(customer for customer in neighbours if customer != 0)
+
+    solution.find_route(neighbour).mark_changed()
+    assert not bits.is_set(solution, 0)
+
+
+def test_bits_are_cleared_for_another_instance():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    context = OperatorContext(first_improvement=True)
+    solution = exchange_customer(initial_solution(), context)
+
+    assert any(context.save_bits(solution).values())
+
+    # The bits refer to customers of the first instance, which the second
+    # instance does not have.
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+    solution = initial_solution()
+
+    assert not any(context.save_bits(solution).values())
+    exchange_customer(solution, context)
+
+
+def test_local_searches_do_not_share_bits():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    first, second = _search(1, None)[1], _search(1, None)[1]
+    solution = first(initial_solution())
+
+    assert any(first.save_bits(solution).values())
+    assert not any(second.save_bits(solution).values())
+
+
+def test_resumed_search_keeps_bits(tmp_path):
+    problem = Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+    checkpoint = str(tmp_path / "search.checkpoint")
+
+    search, _ = _search(problem.instance, checkpoint)
+    search.iterate(initial_solution(),
+                   WEIGHTS,
+                   DECAY,
+                   deepcopy(CRITERION),
+                   iterations=25)
+
+    saved = Checkpoint.from_file(checkpoint)
+    _, best_bits = saved.dont_look
+
+    assert any(best_bits.values())
+
+    # The checkpointed routes are given new versions when read, so their bits
+    # are not set. Resuming the search should set these again.
+    search, local_search = _search(problem.instance, checkpoint)
+    assert not any(local_search.save_bits(saved.best).values())
+
+    # There are no iterations left, so this returns the checkpointed best
+    # solution.
+    result = search.iterate(None, WEIGHTS, DECAY, None, iterations=25,
+                            resume=saved)
+
+    assert result.best_state is saved.best
+    assert local_search.save_bits(saved.best) == best_bits
+
+
+def _search(seed: int,
+            checkpoint: Optional[str]) -> Tuple[Search, LocalSearch]:
+    search = Search(default_rng(seed))
+
+    for op in D_OPERATORS:
+        search.add_destroy_operator(op)
+
+    for op in R_OPERATORS:
+        search.add_repair_operator(op)
+
+    # Route operators change (nearly) all routes after the solution operators
+    # are done, which clears the bits. Those are left out here, so there are
+    # bits to checkpoint.
+    local_search = LocalSearch(first_improvement=True)
+
+    for op in SOLUTION_OPERATORS:
+        local_search.add_solution_operator(op)
+
+    search.improve_best(local_search)
+
+    if checkpoint is not None:
+        search.checkpoint_to(checkpoint, 25)
+
+    return search, local_search
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+from numpy.random import default_rng
+
+from heuristic.classes import Problem, Route, Solution, Stacks
+from heuristic.local_search import in_route_two_opt
+from heuristic.local_search.in_route_two_opt import _Plan
+from heuristic.repair_operators import greedy_insert
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def _append_route(customers) -> Route:
+    route = Route([], [Stacks(Problem().num_stacks)])
+    return route if route.attempt_append_tail(customers) else None
+
+
+def _naive_two_opt(route: Route) -> Route:
+    """
+    Constructs the route of every two-opt swap that improves the routing
+    costs, and returns the cheapest of these and the passed-in route. As in
+    the operator, the last two customers are never part of the reversed
+    segment.
+    """
+    tour = route.customers.to_list()
+    best = route
+
+    for first in range(len(tour)):
+        for second in range(first + 2, len(tour) - 1):
+            new_tour = tour[:first] + tour[first:second][::-1] + tour[second:]
+            new_route = _append_route(new_tour)
+
+            if new_route is not None \
+                    and new_route.routing_cost() < route.routing_cost() \
+                    and new_route.cost() < best.cost():
+                best = new_route
+
+    return best
+
+
+@pytest.mark.parametrize("instance",
+                         ["small_7", "large_1", "large_30", "large_100"])
+def test_two_opt_matches_naive_evaluation(instance: str):
+    problem = Problem.from_file(str(DATA / f"{instance}.csv"), delimiter=',')
+    solution = greedy_insert(Solution([], list(range(problem.num_customers))),
+                             default_rng(1))
+
+    improved = 0
+
+    for route in solution.routes:
+        new_route = in_route_two_opt(route)
+
+        assert new_route.cost() == pytest.approx(_naive_two_opt(route).cost())
+        assert sorted(new_route.customers) == sorted(route.customers)
+
+        improved += new_route is not route
+
+    # The greedy routes can be improved, so the comparison is not trivial.
+    assert improved > 0
+
+
+@pytest.mark.parametrize("instance", ["small_1", "small_7", "large_1"])
+def test_plan_matches_appended_route(instance: str):
+    problem = Problem.from_file(str(DATA / f"{instance}.csv"), delimiter=',')
+    rng = default_rng(1)
+
+    for _ in range(25):
+        customers = rng.permutation(problem.num_customers)[:10].tolist()
+        plan = _Plan(problem.num_stacks)
+
+        fits = all(plan.append(problem.demands[customer].volume,
+                               problem.pickups[customer].volume,
+                               problem.stack_capacity)
+                   for customer in customers)
+
+        route = _append_route(customers)
+
+        assert fits == (route is not None)
+
+        if fits:
+            handling_cost = problem.handling_cost * plan.volume
+            assert handling_cost == pytest.approx(route.handling_cost())
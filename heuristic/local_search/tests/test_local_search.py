@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from numpy.testing import assert_almost_equal
+
+from heuristic.classes import OperatorStatistics, Problem
+from heuristic.functions import initial_solution
+from heuristic.local_search import (Executor, LocalSearch, ROUTE_OPERATORS,
+                                    SOLUTION_OPERATORS)
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_parallel_route_improvement_matches_serial():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    descent = LocalSearch()
+
+    for op in SOLUTION_OPERATORS:
+        descent.add_solution_operator(op)
+
+    solution = descent(initial_solution())
+
+    serial_statistics = OperatorStatistics()
+    serial = _route_search(None, serial_statistics)(solution)
+
+    parallel_statistics = OperatorStatistics()
+
+    with Executor(2, min_routes=1) as executor:
+        parallel = _route_search(executor, parallel_statistics)(solution)
+
+    assert_almost_equal(parallel.objective(), serial.objective())
+    assert [route.customers.to_list() for route in parallel.routes] \
+        == [route.customers.to_list() for route in serial.routes]
+
+    # The route operator calls in the worker processes are recorded as well.
+    serial_records = serial_statistics.to_records()
+    parallel_records = parallel_statistics.to_records()
+
+    assert len(serial_records) == len(ROUTE_OPERATORS)
+    assert [(record["operator"], record["calls"], record["accepts"])
+            for record in parallel_records] \
+        == [(record["operator"], record["calls"], record["accepts"])
+            for record in serial_records]
+
+    # Routes the workers did not improve keep their versions, so cached
+    # moves involving those routes remain valid.
+    unchanged = [idx for idx, route in enumerate(serial.routes)
+                 if route.version == solution.routes[idx].version]
+
+    assert len(unchanged) > 0
+    assert all(parallel.routes[idx].version == solution.routes[idx].version
+               for idx in unchanged)
+
+
+def _route_search(executor, statistics):
+    local_search = LocalSearch(executor, statistics)
+
+    for op in ROUTE_OPERATORS:
+        local_search.add_route_operator(op)
+
+    return local_search
@@ -0,0 +1,118 @@
+from copy import copy, deepcopy
+from pathlib import Path
+
+from heuristic.classes import Problem
+from heuristic.functions import initial_solution
+from heuristic.local_search import (Executor, OperatorContext,
+                                    SOLUTION_OPERATORS)
+from heuristic.local_search.MoveCache import MoveCache
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+class _Scan:
+
+    def __init__(self):
+        """
+        Scan function that records the scanned tasks, and returns a move with
+        the negated sum of route indices as proposed cost, so the pair with the
+        highest indices has the best move.
+        """
+        self.scanned = []
+
+    def __call__(self, solution, tasks):
+        self.scanned.extend(tasks)
+        return [(-idx1 - idx2, (idx1, idx2)) for idx1, idx2 in tasks]
+
+
+def _setup():
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    solution = initial_solution()
+    pairs = [(idx1, idx2)
+             for idx1 in range(len(solution.routes))
+             for idx2 in range(idx1 + 1, len(solution.routes))]
+
+    return solution, pairs
+
+
+def test_best_move_of_all_pairs():
+    solution, pairs = _setup()
+    scan = _Scan()
+
+    best = MoveCache().best_move(scan, solution, pairs, Executor())
+    idx1, idx2 = pairs[-1]
+
+    assert scan.scanned == pairs
+    assert best == (-idx1 - idx2, (idx1, idx2), (idx1, idx2))
+
+
+def test_unchanged_pairs_are_not_scanned_again():
+    solution, pairs = _setup()
+    cache = MoveCache()
+    scan = _Scan()
+
+    first = cache.best_move(scan, solution, pairs, Executor())
+    scan.scanned.clear()
+
+    # Copies of the solution share the routes, and thus the cached moves.
+    second = cache.best_move(scan, copy(solution), pairs, Executor())
+
+    assert scan.scanned == []
+    assert second == first
+
+
+def test_changed_routes_are_scanned_again():
+    solution, pairs = _setup()
+    cache = MoveCache()
+    scan = _Scan()
+
+    cache.best_move(scan, solution, pairs, Executor())
+    scan.scanned.clear()
+
+    solution = copy(solution)
+    solution.routes[0] = deepcopy(solution.routes[0])
+    solution.routes[0].mark_changed()
+
+    cache.best_move(scan, solution, pairs, Executor())
+
+    assert scan.scanned == [pair for pair in pairs if 0 in pair]
+
+
+def test_moves_of_old_routes_are_evicted():
+    solution, pairs = _setup()
+    cache = MoveCache()
+    scan = _Scan()
+
+    cache.best_move(scan, solution, pairs, Executor())
+
+    changed = copy(solution)
+    changed.routes[0] = deepcopy(changed.routes[0])
+    changed.routes[0].mark_changed()
+
+    cache.best_move(scan, changed, pairs, Executor())
+    scan.scanned.clear()
+
+    # Only the moves of the most recently scanned solution are kept, so the
+    # pairs involving the original first route must be scanned again.
+    cache.best_move(scan, solution, pairs, Executor())
+
+    assert scan.scanned == [pair for pair in pairs if 0 in pair]
+    assert len(cache._moves) == len(pairs)
+
+
+def test_operators_with_cached_moves_match_fresh_scans():
+    Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+
+    context = OperatorContext()
+    solution = initial_solution()
+
+    for op in SOLUTION_OPERATORS:
+        for _ in range(5):
+            cached = op(solution, context)
+            fresh = op(solution, OperatorContext())
+
+            assert [route.customers.to_list() for route in cached.routes] \
+                == [route.customers.to_list() for route in fresh.routes]
+
+            solution = cached
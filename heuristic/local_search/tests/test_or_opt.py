@@ -0,0 +1,54 @@
+import importlib
+from pathlib import Path
+
+import pytest
+from numpy.random import default_rng
+
+from heuristic.classes import Problem, Solution
+from heuristic.local_search import OperatorContext, or_opt
+from heuristic.repair_operators import greedy_insert
+from validator.rules import RULES
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+@pytest.mark.parametrize("length", [2, 3])
+@pytest.mark.parametrize("first", [False, True])
+def test_or_opt_moves_segments_until_no_improvement(monkeypatch,
+                                                    length: int,
+                                                    first: bool):
+    module = importlib.import_module("heuristic.local_search.or_opt")
+    monkeypatch.setattr(module, "SEGMENT_LENGTHS", [length])
+
+    problem = Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+    all_customers = list(range(problem.num_customers))
+    solution = greedy_insert(Solution([], all_customers.copy()),
+                             default_rng(1))
+
+    context = OperatorContext(first_improvement=first)
+    moves = 0
+
+    while True:
+        new_solution = or_opt(solution, context)
+
+        if new_solution.objective() >= solution.objective():
+            break
+
+        solution = new_solution
+        moves += 1
+
+        # Each customer is still visited exactly once, and the solution is
+        # feasible.
+        customers = [customer for route in solution.routes
+                     for customer in route]
+
+        assert sorted(customers) == all_customers
+        assert all(rule(solution)[0] for rule in RULES)
+
+    # The greedy solution can be improved, but once there is no improving
+    # move left, the solution is left unchanged.
+    assert moves > 0
+    assert new_solution.objective() == solution.objective()
+    assert len(new_solution.routes) == len(solution.routes)
+    assert all(new_route is route for new_route, route
+               in zip(new_solution.routes, solution.routes))
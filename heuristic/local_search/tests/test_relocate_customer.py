@@ -0,0 +1,91 @@
+import importlib
+from pathlib import Path
+
+import pytest
+from numpy.random import default_rng
+
+from heuristic.classes import Problem, Solution
+from heuristic.functions import routing_costs
+from heuristic.local_search import OperatorContext, relocate_customer
+from heuristic.local_search.relocate_customer import _moves
+from heuristic.repair_operators import greedy_insert
+from heuristic.search import solve
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def _setup():
+    problem = Problem.from_file(str(DATA / "large_1.csv"), delimiter=',')
+    unassigned = list(range(problem.num_customers))
+
+    return problem, greedy_insert(Solution([], unassigned), default_rng(1))
+
+
+def _next_to_nearest(problem: Problem, route, customer: int, k: int):
+    """
+    Returns the insertion indices next to the customer's k nearest customers
+    in the route, not counting the customer itself.
+    """
+    nearest = [other for other in problem.nearest_customers[customer]
+               if other != customer][:k]
+
+    return {idx for other in nearest if other in route
+            for idx in (route.indices[other], route.indices[other] + 1)}
+
+
+@pytest.mark.parametrize("k", [1, 5])
+def test_moves_are_next_to_nearest_customers(k: int):
+    problem, solution = _setup()
+    costs = routing_costs(solution)
+
+    granular = full = 0
+
+    for curr_route in solution.routes:
+        for route in solution.routes:
+            for customer in curr_route:
+                moves = list(_moves(costs, curr_route, route, customer, k))
+                all_moves = dict((idx, cost) for cost, idx
+                                 in _moves(costs, curr_route, route, customer))
+
+                allowed = _next_to_nearest(problem, route, customer, k)
+
+                for cost, idx in moves:
+                    assert idx in allowed
+                    assert cost == pytest.approx(all_moves[idx])
+
+                granular += len(moves)
+                full += len(all_moves)
+
+    # The granular neighbourhood is not empty, but smaller than the full one.
+    assert 0 < granular < full
+
+
+@pytest.mark.parametrize("k", [1, 5])
+def test_relocate_uses_context_neighbours(monkeypatch, k: int):
+    module = importlib.import_module(
+        "heuristic.local_search.relocate_customer")
+    granular_insertions = module._granular_insertions
+
+    neighbours = []
+
+    def record(route, customer, k):
+        neighbours.append(k)
+        return granular_insertions(route, customer, k)
+
+    monkeypatch.setattr(module, "_granular_insertions", record)
+
+    _, solution = _setup()
+
+    relocate_customer(solution)  # default, full neighbourhood
+    assert neighbours == []
+
+    relocate_customer(solution, OperatorContext(neighbours=k))
+    assert len(neighbours) != 0 and set(neighbours) == {k}
+
+    # The searches pass the number of neighbours to the local search.
+    neighbours.clear()
+
+    Problem.from_file(str(DATA / "small_30.csv"), delimiter=',')
+    solve(1, iterations=50, relocate_neighbours=k)
+
+    assert len(neighbours) != 0 and set(neighbours) == {k}
@@ -0,0 +1,60 @@
+import os
+import time
+from typing import Optional
+
+from heuristic.classes import Solution
+
+
+class AnytimeOutput:
+
+    def __init__(self,
+                 location: str,
+                 interval: float,
+                 best_objective=None):
+        """
+        Iteration callback that writes the best solution found so far to the
+        given location, at most once every interval seconds. Solutions are
+        written atomically, so the file at location always holds a complete
+        solution, even if the search is stopped while writing.
+
+        Parameters
+        ----------
+        location
+            Solution file location.
+        interval
+            Minimum time between writes, in seconds.
+        best_objective
+            Optional shared ``multiprocessing.Value``, holding the objective of
+            the solution written to location. When passed, a solution is only
+            written if it improves on this objective. This allows several
+            searches to write to the same location.
+        """
+        self._location = location
+        self._interval = interval
+        self._best_objective = best_objective
+
+        self._last_write = time.perf_counter()
+        self._written: Optional[Solution] = None
+
+    def __call__(self, iteration: int, best: Solution, current: Solution):
+        if best is self._written \
+                or time.perf_counter() - self._last_write < self._interval:
+            return
+
+        self._written = best
+        self._last_write = time.perf_counter()
+
+        if self._best_objective is None:
+            self._write(best)
+            return
+
+        with self._best_objective.get_lock():
+            if best.objective() < self._best_objective.value:
+                self._best_objective.value = best.objective()
+                self._write(best)
+
+    def _write(self, solution: Solution):
+        tmp_location = f"{self._location}.{os.getpid()}.tmp"
+
+        solution.to_file(tmp_location)
+        os.replace(tmp_location, self._location)
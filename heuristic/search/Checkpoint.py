@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import gzip
+import os
+import pickle
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from alns.State import State
+from alns.criteria import AcceptanceCriterion
+
+from heuristic.alns_adapter import Statistics
+
+
+class Checkpoint:
+    __slots__ = ['iteration',
+                 'best',
+                 'current',
+                 'last_improvement',
+                 'd_weights',
+                 'r_weights',
+                 'criterion',
+                 'rnd_state',
+                 'statistics',
+                 'dont_look']
+
+    iteration: int  # number of completed iterations
+    best: State
+    current: State
+    last_improvement: int  # iteration of the last improving best solution
+
+    d_weights: np.ndarray  # destroy and repair operator weights
+    r_weights: np.ndarray
+
+    criterion: AcceptanceCriterion  # includes e.g. the temperature
+    rnd_state: Dict[str, Any]  # bit generator state
+    statistics: Statistics
+
+    # Customers whose don't-look bits are set for the current and best
+    # solutions, by operator. See ``LocalSearch.save_bits``.
+    dont_look: Tuple[Dict[str, List[int]], Dict[str, List[int]]]
+
+    def __init__(self, **kwargs):
+        """
+        Snapshot of a search after some iterations, from which the search can
+        be resumed. A resumed search continues exactly as the original search
+        would have. See also ``Search.iterate``.
+        """
+        for attr in self.__slots__:
+            setattr(self, attr, kwargs[attr])
+
+    def __getstate__(self):
+        state = {attr: getattr(self, attr) for attr in self.__slots__}
+
+        # Statistics objects cannot be pickled, so we pickle their contents.
+        state['statistics'] = (self.statistics.objectives,
+                               dict(self.statistics.destroy_operator_counts),
+                               dict(self.statistics.repair_operator_counts))
+
+        return state
+
+    def __setstate__(self, state):
+        objectives, d_counts, r_counts = state.pop('statistics')
+
+        self.statistics = Statistics()
+        self.statistics.destroy_operator_counts.update(d_counts)
+        self.statistics.repair_operator_counts.update(r_counts)
+
+        for objective in objectives:
+            self.statistics.collect_objective(objective)
+
+        self.dont_look = {}, {}  # not present in older checkpoints.
+
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    @classmethod
+    def from_file(cls, location: str) -> Checkpoint:
+        """
+        Reads a checkpoint from the passed-in location. See ``to_file``.
+        """
+        with gzip.open(location, 'rb') as file:
+            return pickle.load(file)
+
+    def to_file(self, location: str):
+        """
+        Writes this checkpoint to the passed-in location, as a compressed
+        pickle. The best and current solutions are pickled together, so any
+        routes they share are still shared when the checkpoint is read. The
+        checkpoint is written atomically, so the file at location always holds
+        a complete checkpoint, even if the search is stopped while writing.
+        """
+        tmp_location = f"{location}.{os.getpid()}.tmp"
+
+        with gzip.open(tmp_location, 'wb') as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_location, location)
@@ -0,0 +1,55 @@
+from queue import Empty, Full
+from typing import Optional
+
+from heuristic.classes import Solution
+
+
+class Migration:
+
+    def __init__(self, inbox, outbox, interval: int):
+        """
+        Iteration callback that exchanges solutions between searches (islands).
+        Every interval iterations, the best solution of this island is sent to
+        the outbox, and the best solution received in the inbox (if any)
+        becomes the current solution - but only if it improves on that.
+
+        Parameters
+        ----------
+        inbox
+            Queue of solutions sent to this island by other islands.
+        outbox
+            Queue to send this island's best solutions to. This queue should
+            be bounded, e.g. to a single solution. When it is full, the other
+            island has not yet received the previous solution, and this
+            solution is dropped rather than queued.
+        interval
+            Number of iterations between migrations.
+        """
+        self._inbox = inbox
+        self._outbox = outbox
+        self._interval = interval
+
+    def __call__(self,
+                 iteration: int,
+                 best: Solution,
+                 current: Solution) -> Optional[Solution]:
+        if (iteration + 1) % self._interval != 0:
+            return None
+
+        try:
+            self._outbox.put_nowait(best)
+        except Full:
+            pass
+
+        incoming = current
+
+        while True:  # there might be several solutions waiting.
+            try:
+                solution = self._inbox.get_nowait()
+            except Empty:
+                break
+
+            if solution.objective() < incoming.objective():
+                incoming = solution
+
+        return None if incoming is current else incoming
@@ -0,0 +1,245 @@
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from alns import ALNS
+from alns.State import State
+from alns.criteria import AcceptanceCriterion
+
+from heuristic.alns_adapter import (Result, Statistics, consider_candidate,
+                                    outcome, select_operator,
+                                    validate_parameters)
+from heuristic.classes import OperatorStatistics
+from heuristic.local_search import LocalSearch
+from .Checkpoint import Checkpoint
+
+IterationCallback = Callable[[int, State, State], Optional[State]]
+
+
+class Search(ALNS):
+
+    def __init__(self, rnd_state):
+        """
+        ALNS, with additional stopping criteria, and callbacks that are called
+        after each iteration. Apart from that, the search is exactly that of
+        ALNS: for the same arguments, both give the same results.
+        """
+        super().__init__(rnd_state)
+
+        self._iteration_callbacks: List[IterationCallback] = []
+
+        self._checkpoint_location: Optional[str] = None
+        self._checkpoint_interval: Optional[int] = None
+
+        self._operator_statistics: Optional[OperatorStatistics] = None
+        self._local_search: Optional[LocalSearch] = None
+
+    def on_iteration(self, func: IterationCallback):
+        """
+        Adds a callback function that is called after each iteration, with the
+        iteration number, and the best and current solutions. The callback may
+        return a solution, which then becomes the current solution (and the
+        best, if it improves on that). Otherwise it should return None.
+        """
+        self._iteration_callbacks.append(func)
+
+    def improve_best(self, local_search: LocalSearch):
+        """
+        Improves each new best solution using the passed-in local search. This
+        is like ``on_best``, but the local search's don't-look bits are also
+        saved with each checkpoint, and restored when resuming.
+        """
+        self.on_best(local_search)
+        self._local_search = local_search
+
+    def checkpoint_to(self, location: str, interval: int):
+        """
+        Writes a checkpoint of the search to the given location, every
+        interval iterations. The search can be resumed from such a checkpoint,
+        see ``iterate``.
+        """
+        self._checkpoint_location = location
+        self._checkpoint_interval = interval
+
+    def instrument(self, statistics: OperatorStatistics):
+        """
+        Records the run time and outcome of each destroy and repair operator
+        call in the passed-in operator statistics. These include the local
+        search of new best solutions, see ``OperatorStatistics``.
+        """
+        self._operator_statistics = statistics
+
+    def iterate(self,
+                initial_solution: State,
+                weights,
+                operator_decay: float,
+                criterion: AcceptanceCriterion,
+                iterations: int = 10000,
+                collect_stats: bool = True,
+                time_limit: Optional[float] = None,
+                max_stagnation: Optional[int] = None,
+                resume: Optional[Checkpoint] = None) -> Result:
+        """
+        Runs the ALNS search. See ``ALNS.iterate`` for details. The search
+        stops after the given number of iterations, or earlier, once either of
+        the following stopping criteria is met.
+
+        Parameters
+        ----------
+        time_limit
+            Wall-clock time limit for the search, in seconds. Default None,
+            which means no time limit.
+        max_stagnation
+            Maximum number of consecutive iterations without improving the
+            best solution. Default None, which means no such limit.
+        resume
+            Checkpoint to resume the search from. The search then continues
+            exactly as the search that wrote the checkpoint would have, and
+            the initial solution and acceptance criterion arguments are not
+            used. The time limit applies to the resumed search only. Default
+            None, which starts a new search.
+
+        Returns
+        -------
+        Result
+            Result object, containing the best solution and some statistics.
+        """
+        weights = np.asarray(weights, dtype=np.float16)
+
+        validate_parameters(self, weights, operator_decay, iterations)
+
+        start = time.perf_counter()
+
+        if resume is None:
+            current = best = initial_solution
+            first_iteration = last_improvement = 0
+
+            d_weights = np.ones(len(self.destroy_operators), dtype=np.float16)
+            r_weights = np.ones(len(self.repair_operators), dtype=np.float16)
+
+            statistics = Statistics()
+
+            if collect_stats:
+                statistics.collect_objective(initial_solution.objective())
+        else:
+            current, best = resume.current, resume.best
+            first_iteration = resume.iteration
+            last_improvement = resume.last_improvement
+
+            d_weights, r_weights = resume.d_weights, resume.r_weights
+
+            criterion = resume.criterion
+            statistics = resume.statistics
+
+            self._rnd_state.bit_generator.state = resume.rnd_state
+
+            # The solution routes are new objects, with new versions, so the
+            # don't-look bits need to be set for them again.
+            if self._local_search is not None:
+                self._local_search.restore_bits(current, resume.dont_look[0])
+                self._local_search.restore_bits(best, resume.dont_look[1])
+
+        for iteration in range(first_iteration, iterations):
+            if time_limit is not None \
+                    and time.perf_counter() - start >= time_limit:
+                break
+
+            if max_stagnation is not None \
+                    and iteration - last_improvement >= max_stagnation:
+                break
+
+            d_idx = select_operator(self.destroy_operators, d_weights,
+                                    self._rnd_state)
+
+            r_idx = select_operator(self.repair_operators, r_weights,
+                                    self._rnd_state)
+
+            d_name, d_operator = self.destroy_operators[d_idx]
+            d_start = time.perf_counter()
+            destroyed = d_operator(current, self._rnd_state)
+
+            r_name, r_operator = self.repair_operators[r_idx]
+            r_start = time.perf_counter()
+            candidate = r_operator(destroyed, self._rnd_state)
+            r_end = time.perf_counter()
+
+            prev_best, prev_current = best, current
+            best, current, weight_idx = consider_candidate(self,
+                                                           best,
+                                                           current,
+                                                           candidate,
+                                                           criterion)
+
+            if self._operator_statistics is not None:
+                stats = self._operator_statistics
+                result = outcome(weight_idx)
+
+                # New best solutions are improved by the local search while
+                # they are considered, which is part of the operators' yield.
+                if result == "best":
+                    improvement = prev_current.objective() - best.objective()
+                else:
+                    improvement = prev_current.objective() \
+                        - candidate.objective()
+
+                evaluation = time.perf_counter() - r_end
+
+                stats.record_call("destroy", d_name,
+                                  r_start - d_start + evaluation)
+                stats.record_outcome("destroy", d_name, result, improvement)
+
+                stats.record_call("repair", r_name,
+                                  r_end - r_start + evaluation)
+                stats.record_outcome("repair", r_name, result, improvement)
+
+            if best is not prev_best:
+                last_improvement = iteration + 1
+
+            d_weights[d_idx] *= operator_decay
+            d_weights[d_idx] += (1 - operator_decay) * weights[weight_idx]
+
+            r_weights[r_idx] *= operator_decay
+            r_weights[r_idx] += (1 - operator_decay) * weights[weight_idx]
+
+            if collect_stats:
+                statistics.collect_objective(current.objective())
+
+                statistics.collect_destroy_operator(d_name, weight_idx)
+                statistics.collect_repair_operator(r_name, weight_idx)
+
+            for callback in self._iteration_callbacks:
+                new_current = callback(iteration, best, current)
+
+                if new_current is None:
+                    continue
+
+                current = new_current
+
+                if current.objective() < best.objective():
+                    best = current
+                    last_improvement = iteration + 1
+
+            if self._checkpoint_location is not None \
+                    and (iteration + 1) % self._checkpoint_interval == 0:
+                checkpoint = Checkpoint(
+                    iteration=iteration + 1,
+                    best=best,
+                    current=current,
+                    last_improvement=last_improvement,
+                    d_weights=d_weights,
+                    r_weights=r_weights,
+                    criterion=criterion,
+                    rnd_state=self._rnd_state.bit_generator.state,
+                    statistics=statistics,
+                    dont_look=self._save_bits(current, best))
+
+                checkpoint.to_file(self._checkpoint_location)
+
+        return Result(best, statistics if collect_stats else None)
+
+    def _save_bits(self, current: State, best: State):
+        if self._local_search is None:
+            return {}, {}
+
+        return (self._local_search.save_bits(current),
+                self._local_search.save_bits(best))
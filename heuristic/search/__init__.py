@@ -0,0 +1,7 @@
+from .AnytimeOutput import AnytimeOutput
+from .Checkpoint import Checkpoint
+from .Migration import Migration
+from .Search import Search
+from .batch import batch, write_summary
+from .multi_start import multi_start
+from .solve import solve
@@ -0,0 +1,181 @@
+import csv
+import glob
+import json
+import time
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional
+
+from heuristic.classes import OperatorStatistics, Problem
+from .AnytimeOutput import AnytimeOutput
+from .solve import solve
+
+
+def batch(in_files: str,
+          workers: int = 1,
+          timeout: Optional[float] = None,
+          retries: int = 1,
+          output_interval: Optional[float] = None,
+          operator_statistics: bool = False,
+          **kwargs) -> List[Dict]:
+    """
+    Solves all problem instances matching the passed-in glob string. Each
+    instance is solved in its own worker process, and up to workers instances
+    are solved at the same time. Solutions are written to the solution file of
+    each instance, as for a single run.
+
+    Parameters
+    ----------
+    in_files
+        Problem instance data file locations (glob string).
+    workers
+        Number of instances to solve in parallel. Default 1.
+    timeout
+        Wall-clock time limit for each instance, in seconds. Instances that do
+        not finish in time are stopped, and not retried. Default None, which
+        means no time limit.
+    retries
+        Number of times an instance is retried when its worker process fails,
+        e.g. because it crashed. Retries resume from the last checkpoint, if
+        any. Default 1.
+    output_interval
+        When passed, the best solution found so far is written to the solution
+        file at (roughly) this interval, in seconds. See ``AnytimeOutput``.
+        Default None, which means only the final solution is written.
+    operator_statistics
+        Whether to write per-operator statistics for each instance, to
+        ``solutions/oracs_<instance>_0_operators.csv``. See
+        ``OperatorStatistics``. Default False.
+    kwargs
+        Additional arguments, passed to ``solve``.
+
+    Returns
+    -------
+    List[Dict]
+        Run summary, with an entry for each instance.
+    """
+    ctx = get_context()
+
+    pending = [(location, 1) for location in sorted(glob.glob(in_files))]
+    running = {}  # maps process sentinels to the process and run details
+    results = {}
+
+    while pending or running:
+        while pending and len(running) < workers:
+            location, attempt = pending.pop(0)
+
+            receiver, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_solve,
+                                  args=(location, attempt, sender,
+                                        output_interval, operator_statistics,
+                                        kwargs))
+            process.start()
+            sender.close()  # only the worker process sends on this end.
+
+            running[process.sentinel] = (process, receiver, location, attempt,
+                                         time.perf_counter())
+
+        # We wait until some process finishes, or the first time limit of the
+        # running processes expires.
+        wait_time = None
+
+        if timeout is not None:
+            first_start = min(start for *_, start in running.values())
+            wait_time = max(first_start + timeout - time.perf_counter(), 0)
+
+        for sentinel in wait(list(running), wait_time):
+            process, receiver, location, attempt, start = running.pop(sentinel)
+            process.join()
+
+            try:
+                results[location] = receiver.recv()
+            except EOFError:  # the worker did not send a result, so it failed.
+                if attempt <= retries:
+                    pending.append((location, attempt + 1))
+                else:
+                    results[location] = _summary(location, "failed", attempt)
+
+            receiver.close()
+
+        for sentinel, details in list(running.items()):
+            process, receiver, location, attempt, start = details
+
+            if timeout is not None \
+                    and time.perf_counter() - start >= timeout:
+                process.kill()
+                process.join()
+                receiver.close()
+
+                del running[sentinel]
+                results[location] = _summary(location, "timeout", attempt)
+
+    return [results[location] for location in sorted(results)]
+
+
+def write_summary(summary: List[Dict], location: str):
+    """
+    Writes the run summary to the passed-in location, as CSV if the location
+    ends in '.csv', and as JSON otherwise.
+    """
+    with open(location, 'w', newline='') as file:
+        if location.endswith(".csv"):
+            fields = list(_summary("", "", 0).keys())
+
+            writer = csv.DictWriter(file, fields)
+            writer.writeheader()
+            writer.writerows(summary)
+        else:
+            json.dump(summary, file, indent=2)
+
+
+def _solve(location: str,
+           attempt: int,
+           sender,
+           output_interval: Optional[float],
+           operator_statistics: bool,
+           kwargs):
+    start = time.perf_counter()
+
+    problem = Problem.from_file(location, delimiter=',')
+    out_file = f"solutions/oracs_{problem.instance}.csv"
+    checkpoint = f"solutions/oracs_{problem.instance}_0.checkpoint"
+
+    callbacks = []
+
+    if output_interval is not None:
+        callbacks.append(AnytimeOutput(out_file, output_interval))
+
+    if attempt > 1:  # continue where the failed attempt left off.
+        kwargs = dict(kwargs, resume=True)
+
+    statistics = OperatorStatistics() if operator_statistics else None
+
+    solution = solve(problem.instance,
+                     callbacks=callbacks,
+                     checkpoint=checkpoint,
+                     statistics=statistics,
+                     **kwargs)
+    solution.to_file(out_file)
+
+    if statistics is not None:
+        stats_location = f"solutions/oracs_{problem.instance}_0_operators.csv"
+        statistics.to_file(stats_location)
+
+    sender.send(_summary(location, "solved", attempt,
+                         instance=problem.instance,
+                         objective=solution.objective(),
+                         routes=len(solution.routes),
+                         run_time=time.perf_counter() - start))
+
+
+def _summary(location: str, status: str, attempts: int, **kwargs) -> Dict:
+    summary = dict(location=location,
+                   status=status,
+                   attempts=attempts,
+                   instance=None,
+                   objective=None,
+                   routes=None,
+                   run_time=None)
+
+    summary.update(kwargs)
+    return summary
@@ -0,0 +1,139 @@
+from multiprocessing import get_context
+from operator import methodcaller
+from typing import Optional
+
+from numpy.random import SeedSequence
+
+from heuristic.classes import OperatorStatistics, Problem, Solution
+from heuristic.classes.SharedProblem import SharedProblem
+from .AnytimeOutput import AnytimeOutput
+from .Migration import Migration
+from .solve import solve
+
+# These are shared between worker processes, see _initialise.
+_best_objective = None
+_queues = None
+
+
+def multi_start(location: str,
+                workers: int,
+                output_interval: Optional[float] = None,
+                migration_interval: Optional[int] = None,
+                operator_statistics: bool = False,
+                **kwargs) -> Solution:
+    """
+    Runs several ALNS searches on the problem instance at the passed-in
+    location, in parallel. Returns the best solution found by any of the
+    searches.
+
+    The first search is seeded with the problem instance number, as a single
+    search would be. The other searches use seeds spawned from that, so the
+    results are reproducible for a given number of workers - at least when the
+    searches are independent.
+
+    The searches are independent by default. When a migration interval is
+    passed, the searches instead form islands in a ring: every so many
+    iterations, each island sends its best solution to the next island, which
+    adopts it as its current solution if that is an improvement. See also
+    ``Migration``. Since migration depends on the relative speed of the
+    islands, such runs are not exactly reproducible.
+
+    Parameters
+    ----------
+    location
+        Problem instance file location.
+    workers
+        Number of searches (and worker processes).
+    output_interval
+        When passed, the best solution found so far is written to the solution
+        file at (roughly) this interval, in seconds. See ``AnytimeOutput``.
+        Default None, which means only the final solution is written.
+    migration_interval
+        Number of iterations between migrations. Default None, which means the
+        searches are independent.
+    operator_statistics
+        Whether to write per-operator statistics for each search, to
+        ``solutions/oracs_<instance>_<idx>_operators.csv``. See
+        ``OperatorStatistics``. Default False.
+    kwargs
+        Additional arguments, passed to ``solve``.
+
+    Returns
+    -------
+    Solution
+        Best solution found.
+    """
+    problem = Problem.from_file(location, delimiter=',')
+
+    if workers == 1:  # no need to start any worker processes.
+        return _solve(problem.instance, 0, output_interval, None,
+                      operator_statistics, kwargs)
+
+    seed = SeedSequence(problem.instance)
+    seeds = [seed] + seed.spawn(workers - 1)
+
+    ctx = get_context()
+    best_objective = ctx.Value('d', float("inf"))
+    queues = [ctx.Queue(maxsize=1) for _ in range(workers)]
+
+    # The workers attach to the problem instance in shared memory, rather than
+    # each setting up the problem instance themselves.
+    with problem.share() as shared, \
+            ctx.Pool(workers,
+                     initializer=_initialise,
+                     initargs=(shared, best_objective, queues)) as pool:
+        args = [(seed, idx, output_interval, migration_interval,
+                 operator_statistics, kwargs)
+                for idx, seed in enumerate(seeds)]
+
+        solutions = pool.starmap(_solve, args, chunksize=1)
+
+    # Ties are resolved in favour of the earliest search.
+    return min(solutions, key=methodcaller("objective"))
+
+
+def _initialise(shared: SharedProblem, best_objective, queues):
+    global _best_objective, _queues
+    _best_objective = best_objective
+    _queues = queues
+
+    Problem.attach(shared)
+
+
+def _solve(seed,
+           idx: int,
+           output_interval: Optional[float],
+           migration_interval: Optional[int],
+           operator_statistics: bool,
+           kwargs) -> Solution:
+    callbacks = []
+
+    if output_interval is not None:
+        location = f"solutions/oracs_{Problem().instance}.csv"
+        callbacks.append(AnytimeOutput(location,
+                                       output_interval,
+                                       _best_objective))
+
+    # Each search has its own checkpoint file, which is only written when a
+    # checkpoint interval is passed.
+    checkpoint = f"solutions/oracs_{Problem().instance}_{idx}.checkpoint"
+
+    if migration_interval is not None and _queues is not None:
+        inbox = _queues[idx]
+        outbox = _queues[(idx + 1) % len(_queues)]
+
+        callbacks.append(Migration(inbox, outbox, migration_interval))
+
+    statistics = OperatorStatistics() if operator_statistics else None
+
+    solution = solve(seed,
+                     callbacks=callbacks,
+                     checkpoint=checkpoint,
+                     statistics=statistics,
+                     **kwargs)
+
+    if statistics is not None:
+        location = f"solutions/oracs_{Problem().instance}_{idx}_operators.csv"
+        statistics.to_file(location)
+
+    return solution
@@ -0,0 +1,135 @@
+import os
+from copy import deepcopy
+from typing import Iterable, Optional, Union
+
+from numpy.random import SeedSequence, default_rng
+
+from heuristic.classes import OperatorStatistics, Problem, Solution
+from heuristic.constants import (CRITERION, DECAY, ITERATIONS,
+                                 RELOCATE_NEIGHBOURS, WEIGHTS)
+from heuristic.destroy_operators import D_OPERATORS
+from heuristic.functions import initial_solution
+from heuristic.local_search import (Executor, LocalSearch, ROUTE_OPERATORS,
+                                    SOLUTION_OPERATORS)
+from heuristic.repair_operators import R_OPERATORS
+from .Checkpoint import Checkpoint
+from .Search import IterationCallback, Search
+
+
+def solve(seed: Union[int, SeedSequence],
+          iterations: int = ITERATIONS,
+          time_limit: Optional[float] = None,
+          max_stagnation: Optional[int] = None,
+          local_search_workers: int = 1,
+          first_improvement_from: Optional[int] = None,
+          relocate_neighbours: Optional[int] = RELOCATE_NEIGHBOURS,
+          callbacks: Iterable[IterationCallback] = (),
+          checkpoint: Optional[str] = None,
+          checkpoint_interval: Optional[int] = None,
+          resume: bool = False,
+          statistics: Optional[OperatorStatistics] = None) -> Solution:
+    """
+    Runs a single ALNS search on the current problem instance, starting from
+    the initial solution. Returns the best solution found.
+
+    Parameters
+    ----------
+    seed
+        Seed for the search's random number generator.
+    iterations
+        Maximum number of iterations. Default ``ITERATIONS``.
+    time_limit
+        Wall-clock time limit for the search, in seconds. Default None, which
+        means no time limit.
+    max_stagnation
+        Maximum number of consecutive iterations without improving the best
+        solution. Default None, which means no such limit.
+    local_search_workers
+        Number of worker processes for the route improvements and
+        neighbourhood scans of the local search. See ``Executor``. Default 1.
+    first_improvement_from
+        Minimum number of customers for which the local search uses first
+        improvement, rather than best improvement. See ``LocalSearch``. Default
+        None, which always uses best improvement.
+    relocate_neighbours
+        Number of nearest customers next to which the local search relocates a
+        customer, or None for all insertion points. See ``OperatorContext``.
+        Default ``RELOCATE_NEIGHBOURS``.
+    callbacks
+        Callbacks to call after each iteration. See ``Search.on_iteration``.
+    checkpoint
+        Checkpoint file location. Default None, which means no checkpoints are
+        written, and the search is not resumed.
+    checkpoint_interval
+        Number of iterations between checkpoints. Default None, which means no
+        checkpoints are written.
+    resume
+        Whether to resume the search from the checkpoint, if the checkpoint
+        file exists. See ``Search.iterate``. Default False.
+    statistics
+        When passed, the run time and outcome of each operator call is
+        recorded in these operator statistics. Default None.
+
+    Returns
+    -------
+    Solution
+        Best solution found by the search.
+    """
+    search = Search(default_rng(seed))
+
+    for op in D_OPERATORS:
+        search.add_destroy_operator(op)
+
+    for op in R_OPERATORS:
+        search.add_repair_operator(op)
+
+    first_improvement = first_improvement_from is not None \
+        and Problem().num_customers >= first_improvement_from
+
+    executor = Executor(local_search_workers)
+    local_search = LocalSearch(executor,
+                               statistics=statistics,
+                               first_improvement=first_improvement,
+                               neighbours=relocate_neighbours)
+
+    for op in SOLUTION_OPERATORS:
+        local_search.add_solution_operator(op)
+
+    for op in ROUTE_OPERATORS:
+        local_search.add_route_operator(op)
+
+    search.improve_best(local_search)
+
+    for callback in callbacks:
+        search.on_iteration(callback)
+
+    if statistics is not None:
+        search.instrument(statistics)
+
+    if checkpoint is not None and checkpoint_interval is not None:
+        search.checkpoint_to(checkpoint, checkpoint_interval)
+
+    if resume and checkpoint is not None and os.path.exists(checkpoint):
+        init = None
+        resume_from = Checkpoint.from_file(checkpoint)
+    else:
+        init = initial_solution()
+        resume_from = None
+
+    # The acceptance criterion is stateful, so each search needs a fresh one.
+    criterion = deepcopy(CRITERION)
+
+    try:
+        result = search.iterate(init,
+                                WEIGHTS,
+                                DECAY,
+                                criterion,
+                                iterations,
+                                time_limit=time_limit,
+                                max_stagnation=max_stagnation,
+                                resume=resume_from)
+    finally:
+        executor.close()
+
+    # noinspection PyTypeChecker
+    return result.best_state
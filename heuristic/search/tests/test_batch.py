@@ -0,0 +1,98 @@
+import csv
+import importlib
+import json
+import os
+import time
+from pathlib import Path
+
+from heuristic.search import batch, write_summary
+from heuristic.search.batch import _summary
+
+DATA = Path(__file__).parents[3] / "data"
+
+batch_module = importlib.import_module("heuristic.search.batch")
+
+
+def test_summary_names_instance_with_operator_statistics(tmp_path,
+                                                         monkeypatch):
+    # Solutions and statistics are written relative to the working directory.
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "solutions").mkdir()
+
+    location = str(DATA / "small_1.csv")
+    summary = batch(location, iterations=5, operator_statistics=True)
+
+    assert len(summary) == 1
+    assert summary[0]["location"] == location
+    assert summary[0]["status"] == "solved"
+
+    assert (tmp_path / "solutions" / "oracs_1_0_operators.csv").exists()
+
+
+def _report_process(location, attempt, sender, *args):
+    sender.send(_summary(location, "solved", attempt, instance=os.getpid()))
+
+
+def _sleep(location, attempt, sender, *args):
+    time.sleep(60)
+
+
+def _fail_first_attempt(location, attempt, sender, *args):
+    if attempt == 1:
+        os._exit(1)  # exits without sending a result, as a crash would.
+
+    sender.send(_summary(location, "solved", attempt))
+
+
+def test_each_instance_is_solved_in_own_process(monkeypatch):
+    monkeypatch.setattr(batch_module, "_solve", _report_process)
+
+    locations = [str(DATA / "small_1.csv"), str(DATA / "small_2.csv")]
+    summary = batch(str(DATA / "small_[12].csv"), workers=2)
+
+    assert [entry["location"] for entry in summary] == locations
+    assert all(entry["status"] == "solved" for entry in summary)
+
+    # The instance field holds the process identifier of the worker.
+    pids = {entry["instance"] for entry in summary}
+    assert len(pids) == 2
+    assert os.getpid() not in pids
+
+
+def test_instance_is_stopped_after_timeout(monkeypatch):
+    monkeypatch.setattr(batch_module, "_solve", _sleep)
+
+    start = time.perf_counter()
+    summary = batch(str(DATA / "small_1.csv"), timeout=0.5)
+
+    assert time.perf_counter() - start < 30
+    assert summary == [_summary(str(DATA / "small_1.csv"), "timeout", 1)]
+
+
+def test_failed_instance_is_retried(monkeypatch):
+    monkeypatch.setattr(batch_module, "_solve", _fail_first_attempt)
+
+    location = str(DATA / "small_1.csv")
+
+    assert batch(location, retries=1) == [_summary(location, "solved", 2)]
+    assert batch(location, retries=0) == [_summary(location, "failed", 1)]
+
+
+def test_write_summary(tmp_path):
+    summary = [_summary("first.csv", "solved", 1, instance=1, objective=2.5,
+                        routes=3, run_time=4.),
+               _summary("second.csv", "timeout", 1)]
+
+    write_summary(summary, str(tmp_path / "summary.json"))
+    write_summary(summary, str(tmp_path / "summary.csv"))
+
+    with open(tmp_path / "summary.json") as file:
+        assert json.load(file) == summary
+
+    with open(tmp_path / "summary.csv") as file:
+        rows = list(csv.DictReader(file))
+
+    assert [row["location"] for row in rows] == ["first.csv", "second.csv"]
+    assert [row["status"] for row in rows] == ["solved", "timeout"]
+    assert rows[0]["objective"] == "2.5"
+    assert rows[1]["objective"] == ""
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from heuristic.classes import Problem
+from heuristic.search import Checkpoint, solve
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+class _Trajectory:
+
+    def __init__(self):
+        """
+        Iteration callback that records the iteration number, and the best and
+        current objectives, of each iteration.
+        """
+        self.iterations = []
+
+    def __call__(self, iteration, best, current):
+        self.iterations.append((iteration,
+                                best.objective(),
+                                current.objective()))
+
+
+@pytest.mark.parametrize("first_improvement_from", [None, 0])
+def test_resumed_search_equals_uninterrupted_search(tmp_path,
+                                                    first_improvement_from):
+    Problem.from_file(str(DATA / "small_12.csv"), delimiter=',')
+    checkpoint = str(tmp_path / "search.checkpoint")
+
+    uninterrupted = _Trajectory()
+    solution = solve(1,
+                     iterations=150,
+                     first_improvement_from=first_improvement_from,
+                     callbacks=[uninterrupted])
+
+    # Stops after 40 iterations, leaving a checkpoint at that point.
+    solve(1,
+          iterations=40,
+          first_improvement_from=first_improvement_from,
+          checkpoint=checkpoint,
+          checkpoint_interval=20)
+
+    assert Checkpoint.from_file(checkpoint).iteration == 40
+
+    resumed = _Trajectory()
+    resumed_solution = solve(1,
+                             iterations=150,
+                             first_improvement_from=first_improvement_from,
+                             callbacks=[resumed],
+                             checkpoint=checkpoint,
+                             checkpoint_interval=20,
+                             resume=True)
+
+    # The resumed search continues exactly as the uninterrupted search did
+    # after the checkpoint, and thus finds the same solution.
+    assert resumed.iterations == uninterrupted.iterations[40:]
+    assert resumed_solution.objective() == solution.objective()
+    assert [route.customers.to_list() for route in resumed_solution.routes] \
+        == [route.customers.to_list() for route in solution.routes]
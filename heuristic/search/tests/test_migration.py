@@ -0,0 +1,37 @@
+from queue import Queue
+
+from heuristic.search.Migration import Migration
+
+
+class _Solution:
+
+    def __init__(self, objective: float):
+        self._objective = objective
+
+    def objective(self) -> float:
+        return self._objective
+
+
+def test_migration_drops_solutions_when_outbox_is_full():
+    inbox, outbox = Queue(maxsize=1), Queue(maxsize=1)
+    migration = Migration(inbox, outbox, interval=1)
+
+    first, second = _Solution(2), _Solution(1)
+
+    assert migration(0, first, first) is None
+    assert migration(1, second, second) is None
+
+    # The second solution is dropped, as the first was not yet received.
+    assert outbox.get_nowait() is first
+    assert outbox.empty()
+
+
+def test_migration_returns_best_improving_incoming_solution():
+    inbox, outbox = Queue(maxsize=1), Queue(maxsize=1)
+    migration = Migration(inbox, outbox, interval=1)
+
+    current, incoming = _Solution(2), _Solution(1)
+    inbox.put(incoming)
+
+    assert migration(0, current, current) is incoming
+    assert migration(1, current, current) is None  # nothing new received.
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+from numpy.random import SeedSequence
+
+from heuristic.classes import Problem
+from heuristic.search import multi_start, solve
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def _objectives(location: str, workers: int, iterations: int):
+    """
+    Solves the instance at location with the seeds of the searches of a
+    multi-start run, one at a time, and returns the objectives.
+    """
+    problem = Problem.from_file(location, delimiter=',')
+
+    seed = SeedSequence(problem.instance)
+    seeds = [seed] + seed.spawn(workers - 1)
+
+    return [solve(seed, iterations=iterations).objective() for seed in seeds]
+
+
+def test_single_search_is_seeded_with_instance():
+    location = str(DATA / "small_30.csv")
+
+    solution = multi_start(location, workers=1, iterations=50)
+    objective, = _objectives(location, workers=1, iterations=50)
+
+    assert solution.objective() == pytest.approx(objective)
+
+
+def test_returns_best_of_all_searches():
+    location = str(DATA / "small_30.csv")
+    objectives = _objectives(location, workers=3, iterations=50)
+
+    # The first search is not the best, so the result is not trivially that
+    # of a single search.
+    assert min(objectives) < objectives[0]
+
+    solution = multi_start(location, workers=3, iterations=50)
+    assert solution.objective() == pytest.approx(min(objectives))
@@ -0,0 +1,128 @@
+from copy import copy
+from multiprocessing import Value
+from pathlib import Path
+
+from heuristic.classes import OperatorStatistics, Problem
+from heuristic.functions import initial_solution
+from heuristic.search import AnytimeOutput, solve
+
+DATA = Path(__file__).parents[3] / "data"
+
+
+def test_operator_statistics_include_local_search():
+    Problem.from_file(str(DATA / "small_30.csv"), delimiter=',')
+
+    statistics = OperatorStatistics()
+    instrumented = solve(1, iterations=50, statistics=statistics)
+
+    # Recording statistics does not change the search.
+    assert instrumented.objective() == solve(1, iterations=50).objective()
+
+    times = {}
+
+    for record in statistics.to_records():
+        times[record["kind"]] = times.get(record["kind"], 0.) + record["time"]
+
+    # The local search only runs on new best solutions, while these are
+    # considered, so its time is included in that of the destroy and repair
+    # operators that found them.
+    assert times["local search"] > 0
+    assert times["destroy"] >= times["local search"]
+    assert times["repair"] >= times["local search"]
+
+
+class _Iterations:
+
+    def __init__(self):
+        """
+        Iteration callback that records the iteration numbers.
+        """
+        self.iterations = []
+
+    def __call__(self, iteration, best, current):
+        self.iterations.append(iteration)
+
+
+def test_search_stops_at_iteration_limit():
+    Problem.from_file(str(DATA / "small_30.csv"), delimiter=',')
+
+    callback = _Iterations()
+    solve(1, iterations=25, callbacks=[callback])
+
+    assert callback.iterations == list(range(25))
+
+
+def test_search_stops_at_stagnation_limit():
+    # The initial solution of this instance is never improved on, so the
+    # search stagnates from the first iteration.
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    callback = _Iterations()
+    solve(1, iterations=100, max_stagnation=10, callbacks=[callback])
+
+    assert callback.iterations == list(range(10))
+
+
+def test_search_stops_at_time_limit():
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    callback = _Iterations()
+    solve(1, iterations=100, time_limit=0., callbacks=[callback])
+
+    assert callback.iterations == []
+
+
+def test_anytime_output_writes_best_solution(tmp_path):
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    location = tmp_path / "solution.csv"
+    output = AnytimeOutput(str(location), interval=0.)
+
+    best = initial_solution()
+    output(0, best, best)
+
+    expected = tmp_path / "expected.csv"
+    best.to_file(str(expected))
+
+    # The solution is written as a whole, without temporary files left.
+    assert location.read_text() == expected.read_text()
+    assert sorted(tmp_path.iterdir()) == sorted([location, expected])
+
+    # The same best solution is not written again.
+    location.unlink()
+    output(1, best, best)
+
+    assert not location.exists()
+
+
+def test_anytime_output_waits_for_interval(tmp_path):
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    location = tmp_path / "solution.csv"
+    output = AnytimeOutput(str(location), interval=3600.)
+
+    best = initial_solution()
+    output(0, best, best)
+
+    assert not location.exists()
+
+
+def test_anytime_output_writes_only_improving_solutions(tmp_path):
+    Problem.from_file(str(DATA / "small_1.csv"), delimiter=',')
+
+    best = initial_solution()
+
+    # Another search already wrote a better solution to the location.
+    location = tmp_path / "solution.csv"
+    best_objective = Value('d', best.objective() - 1)
+    output = AnytimeOutput(str(location), 0., best_objective)
+
+    output(0, best, best)
+
+    assert not location.exists()
+
+    best_objective.value = best.objective() + 1
+    output(1, copy(best), best)
+
+    assert location.exists()
+    assert best_objective.value == best.objective()
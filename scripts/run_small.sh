@@ -2,10 +2,8 @@
 
 instances="data/small_*.csv"
 
-for instance in $instances
-do
-  echo $instance
-  pipenv run python -Om heuristic $instance
-done
+# Solves all instances in a single batch run. The number of instances solved in
+# parallel may be set via the WORKERS environment variable.
+pipenv run python -Om heuristic batch "$instances" --workers "${WORKERS:-1}"
 
 pipenv run python -m analysis "$instances" summary.csv